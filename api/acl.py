@@ -0,0 +1,144 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from dotenv import load_dotenv
+
+
+class ProjectACL:
+    """In-memory membership index: project id -> {user id: project role}.
+
+    A project's members are loaded with one query the first time it is
+    checked, after which membership and role checks are dict lookups. Every
+    write to user_project calls invalidate / invalidate_user for this worker;
+    a trigger announces the affected projects to every other worker on commit,
+    which apply them through apply_invalidation (realtime.BoardBroadcaster).
+    While that listener is disconnected the index is suspended and every check
+    reads user_project; ``ttl`` is only a backstop.
+    """
+
+    MEMBERS_SQL = 'SELECT user_id, role FROM user_project WHERE project_id = {param}'
+
+    def __init__(self, ttl: float = 30.0, max_projects: int = 5000):
+        self.ttl = ttl
+        self.max_projects = max_projects
+        self._projects = OrderedDict()  # project id -> (members, loaded_at)
+        self._generations = {}          # project id -> invalidation counter
+        self._epoch = 0                 # bumped by invalidate_user / clear / suspend / resume
+        self._suspended = False
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_env(cls):
+        load_dotenv()
+        return cls(
+            ttl=float(os.getenv('ACL_CACHE_TTL', '30')),
+            max_projects=int(os.getenv('ACL_CACHE_MAX_PROJECTS', '5000')),
+        )
+
+    def _lookup(self, project_id: int):
+        """Return (members or None, load token) under the lock"""
+        with self._lock:
+            entry = self._projects.get(project_id) if not self._suspended else None
+            if entry is not None and time.monotonic() - entry[1] < self.ttl:
+                self._projects.move_to_end(project_id)
+                self._hits += 1
+                return entry[0], None
+            self._misses += 1
+            return None, (self._epoch, self._generations.get(project_id, 0))
+
+    def _store(self, project_id: int, members: dict, token: tuple):
+        with self._lock:
+            # Skip the store if the project was invalidated while we were loading it
+            if self._suspended or token != (self._epoch, self._generations.get(project_id, 0)):
+                return
+            self._projects[project_id] = (members, time.monotonic())
+            self._projects.move_to_end(project_id)
+            while len(self._projects) > self.max_projects:
+                self._projects.popitem(last=False)
+
+    def members(self, conn, project_id: int) -> dict:
+        """Membership map for a project, loading it through a psycopg2 connection on a miss"""
+        members, token = self._lookup(project_id)
+        if members is not None:
+            return members
+
+        with conn.cursor() as cur:
+            cur.execute(self.MEMBERS_SQL.format(param='%s'), (project_id,))
+            members = {row['user_id']: row['role'] for row in cur.fetchall()}
+        self._store(project_id, members, token)
+        return members
+
+    async def amembers(self, db, project_id: int) -> dict:
+        """Membership map for a project, loading it through an asyncpg connection on a miss"""
+        members, token = self._lookup(project_id)
+        if members is not None:
+            return members
+
+        rows = await db.fetch(self.MEMBERS_SQL.format(param='$1'), project_id)
+        members = {row['user_id']: row['role'] for row in rows}
+        self._store(project_id, members, token)
+        return members
+
+    def role(self, conn, project_id: int, user_id: int) -> Optional[str]:
+        """Project role of a user, or None if they are not a member"""
+        return self.members(conn, project_id).get(user_id)
+
+    async def arole(self, db, project_id: int, user_id: int) -> Optional[str]:
+        return (await self.amembers(db, project_id)).get(user_id)
+
+    def invalidate(self, project_id: int):
+        """Forget a project's members after a membership write"""
+        with self._lock:
+            self._projects.pop(project_id, None)
+            self._generations[project_id] = self._generations.get(project_id, 0) + 1
+
+    def invalidate_user(self, user_id: int):
+        """Forget every project a user belongs to (role change, deletion)"""
+        with self._lock:
+            for project_id in [pid for pid, (members, _) in self._projects.items() if user_id in members]:
+                del self._projects[project_id]
+            self._epoch += 1
+
+    def clear(self):
+        with self._lock:
+            self._projects.clear()
+            self._epoch += 1
+
+    def apply_invalidation(self, message: dict):
+        """Apply a cache_invalidation payload sent by another worker's write"""
+        if message.get('all'):
+            self.clear()
+        for project_id in message.get('projects', ()):
+            self.invalidate(project_id)
+
+    def suspend(self):
+        """Bypass the index until resume(): invalidations may be missed meanwhile"""
+        with self._lock:
+            self._suspended = True
+        self.clear()
+
+    def resume(self):
+        with self._lock:
+            # Loads that began before the listener was attached may predate a missed change
+            self._epoch += 1
+            self._suspended = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "projects": len(self._projects),
+                "suspended": self._suspended,
+                "max_projects": self.max_projects,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+# Initialize the per-worker membership index with environment variables
+project_acl = ProjectACL.from_env()
@@ -0,0 +1,117 @@
+import os
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+import asyncpg
+from dotenv import load_dotenv
+
+from db_pool import PoolTimeout
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEngine:
+    """asyncpg-backed engine for the async def endpoints.
+
+    Owns its own pool so awaiting the database never blocks the event loop
+    and never competes with the threadpool handlers for psycopg2 connections.
+    """
+
+    def __init__(
+        self,
+        connect_kwargs: dict,
+        min_size: int = 2,
+        max_size: int = 10,
+        max_inactive_lifetime: float = 300.0,
+        checkout_timeout: float = 10.0,
+        command_timeout: float = 30.0,
+    ):
+        self.connect_kwargs = connect_kwargs
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_inactive_lifetime = max_inactive_lifetime
+        self.checkout_timeout = checkout_timeout
+        self.command_timeout = command_timeout
+        self._pool = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """Build an engine from DB_* / DB_ASYNC_POOL_* environment variables"""
+        load_dotenv()
+
+        return cls(
+            connect_kwargs={
+                "host": os.getenv('DB_HOST'),
+                "port": os.getenv('DB_PORT'),
+                "database": os.getenv('DB_DATABASE'),
+                "user": os.getenv('DB_USERNAME'),
+                "password": os.getenv('DB_PASSWORD'),
+            },
+            min_size=int(os.getenv('DB_ASYNC_POOL_MIN_SIZE', '2')),
+            max_size=int(os.getenv('DB_ASYNC_POOL_MAX_SIZE', '10')),
+            max_inactive_lifetime=float(os.getenv('DB_ASYNC_POOL_MAX_IDLE', '300')),
+            checkout_timeout=float(os.getenv('DB_POOL_CHECKOUT_TIMEOUT', '10')),
+            command_timeout=float(os.getenv('DB_COMMAND_TIMEOUT', '30')),
+        )
+
+    async def open(self):
+        """Create the asyncpg pool (idempotent)"""
+        async with self._lock:
+            if self._pool is None:
+                self._pool = await asyncpg.create_pool(
+                    min_size=self.min_size,
+                    max_size=self.max_size,
+                    max_inactive_connection_lifetime=self.max_inactive_lifetime,
+                    command_timeout=self.command_timeout,
+                    **self.connect_kwargs
+                )
+                logger.info(f"Async database pool ready: min={self.min_size}, max={self.max_size}")
+        return self._pool
+
+    async def close(self):
+        async with self._lock:
+            if self._pool is not None:
+                await self._pool.close()
+                self._pool = None
+
+    @asynccontextmanager
+    async def connection(self):
+        """Acquire a connection, failing with PoolTimeout once checkout_timeout passes"""
+        pool = self._pool or await self.open()
+        try:
+            conn = await pool.acquire(timeout=self.checkout_timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeout(
+                f"Timed out after {self.checkout_timeout}s waiting for an async database connection "
+                f"(pool max_size={self.max_size})"
+            )
+        try:
+            yield conn
+        finally:
+            await pool.release(conn)
+
+    def stats(self) -> dict:
+        if self._pool is None:
+            return {"min_size": self.min_size, "max_size": self.max_size, "size": 0, "idle": 0, "in_use": 0}
+
+        size = self._pool.get_size()
+        idle = self._pool.get_idle_size()
+        return {
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+        }
+
+
+# Initialize the per-worker async engine with environment variables
+engine = AsyncEngine.from_env()
+
+
+async def get_async_db():
+    """FastAPI dependency that lends an asyncpg connection for the request"""
+    async with engine.connection() as conn:
+        yield conn
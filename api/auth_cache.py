@@ -0,0 +1,143 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+
+from dotenv import load_dotenv
+
+
+class PrincipalCache:
+    """Size-bounded LRU cache of authenticated principals keyed by bearer token.
+
+    Entries expire after ``ttl`` seconds or when the JWT itself expires,
+    whichever comes first. Writes that change who a user is (role, email,
+    deletion, logout) call invalidate_user / invalidate_token for this worker;
+    triggers announce the same changes to every other worker on commit, which
+    apply them through apply_invalidation (realtime.BoardBroadcaster). While
+    that listener is disconnected the cache is suspended: it neither serves
+    nor stores principals, as it could miss an invalidation.
+
+    Loads that raced an invalidation are not stored: take generation() before
+    reading the user and pass it to put().
+    """
+
+    def __init__(self, ttl: float = 30.0, max_size: int = 10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()  # token -> (principal, expires_at)
+        self._tokens_by_user = {}      # user id -> set of cached tokens
+        self._lock = threading.Lock()
+        self._generation = 0           # bumped by every invalidation
+        self._suspended = False
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_env(cls):
+        load_dotenv()
+        return cls(
+            ttl=float(os.getenv('AUTH_CACHE_TTL', '30')),
+            max_size=int(os.getenv('AUTH_CACHE_MAX_SIZE', '10000')),
+        )
+
+    def get(self, token: str):
+        """Return a copy of the cached principal, or None on a miss"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(token) if not self._suspended else None
+            if entry is None:
+                self._misses += 1
+                return None
+            principal, expires_at = entry
+            if expires_at <= now:
+                self._remove(token)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self._hits += 1
+            return dict(principal)
+
+    def generation(self) -> int:
+        """Token for put(): a load is only stored if nothing was invalidated since"""
+        with self._lock:
+            return self._generation
+
+    def put(self, token: str, principal: dict, token_expires_at: float = None, generation: int = None):
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+
+        expires_at = time.time() + self.ttl
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+
+        with self._lock:
+            if self._suspended or (generation is not None and generation != self._generation):
+                return
+            if token in self._entries:
+                self._remove(token)
+            self._entries[token] = (dict(principal), expires_at)
+            self._tokens_by_user.setdefault(principal['id'], set()).add(token)
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def _remove(self, token: str):
+        principal, _ = self._entries.pop(token)
+        tokens = self._tokens_by_user.get(principal['id'])
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[principal['id']]
+
+    def invalidate_token(self, token: str):
+        with self._lock:
+            self._generation += 1
+            if token in self._entries:
+                self._remove(token)
+
+    def invalidate_user(self, user_id: int):
+        """Drop every cached session of a user after their account changed"""
+        with self._lock:
+            self._generation += 1
+            for token in list(self._tokens_by_user.get(user_id, ())):
+                self._remove(token)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def apply_invalidation(self, message: dict):
+        """Apply a cache_invalidation payload sent by another worker's write"""
+        if message.get('all'):
+            self.clear()
+        for user_id in message.get('users', ()):
+            self.invalidate_user(user_id)
+
+    def suspend(self):
+        """Stop serving and storing until resume(): invalidations may be missed meanwhile"""
+        with self._lock:
+            self._suspended = True
+        self.clear()
+
+    def resume(self):
+        with self._lock:
+            # Loads that began before the listener was attached may predate a missed change
+            self._generation += 1
+            self._suspended = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "suspended": self._suspended,
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+# Initialize the per-worker principal cache with environment variables
+principal_cache = PrincipalCache.from_env()
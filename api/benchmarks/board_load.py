@@ -0,0 +1,136 @@
+"""Board load benchmark for GET /project/{project_id}.
+
+Seeds a throwaway project with N issues (each with one assignee) inside a
+transaction that is rolled back afterwards, then measures the number of
+queries and the latency of loading the board with the batched loader versus
+the old per-issue assignee lookup.
+
+Usage (from the api/ directory, with the usual DB_* variables in .env):
+
+    python benchmarks/board_load.py --sizes 100,1000,10000 --runs 20
+"""
+import os
+import sys
+import time
+import uuid
+import asyncio
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import fetch_project_board  # noqa: E402
+from async_db import engine  # noqa: E402
+
+
+class CountingConnection:
+    """Wraps an asyncpg connection and counts round trips"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.queries = 0
+
+    async def fetch(self, *args, **kwargs):
+        self.queries += 1
+        return await self._conn.fetch(*args, **kwargs)
+
+    async def fetchrow(self, *args, **kwargs):
+        self.queries += 1
+        return await self._conn.fetchrow(*args, **kwargs)
+
+    async def fetchval(self, *args, **kwargs):
+        self.queries += 1
+        return await self._conn.fetchval(*args, **kwargs)
+
+    async def execute(self, *args, **kwargs):
+        self.queries += 1
+        return await self._conn.execute(*args, **kwargs)
+
+
+async def legacy_fetch_project_board(db, project_id: int):
+    """The pre-batching loader: one assignee query per issue"""
+    await db.fetchrow('SELECT id, name, url, description, category, "created_at", "updated_at" FROM project WHERE id = $1', project_id)
+    issues = await db.fetch('SELECT * FROM issue WHERE "projectId" = $1 ORDER BY "listPosition", id', project_id)
+    await db.fetch('SELECT u.id FROM "user" u JOIN user_project up ON u.id = up.user_id WHERE up.project_id = $1', project_id)
+    for issue in issues:
+        await db.fetch("""
+            SELECT u.id, u.name, u.email, u."avatarUrl"
+            FROM "user" u
+            JOIN issue_user iu ON u.id = iu.user_id
+            WHERE iu.issue_id = $1
+        """, issue['id'])
+
+
+async def seed_project(conn, issue_count: int) -> int:
+    user_id = await conn.fetchval(
+        'INSERT INTO "user" (name, email) VALUES ($1, $2) RETURNING id',
+        'Benchmark User', f"bench-{uuid.uuid4().hex}@example.com"
+    )
+    project_id = await conn.fetchval(
+        'INSERT INTO project (name, owner_id) VALUES ($1, $2) RETURNING id',
+        f"Benchmark {issue_count}", user_id
+    )
+    await conn.execute(
+        'INSERT INTO user_project (user_id, project_id, role) VALUES ($1, $2, $3)',
+        user_id, project_id, 'admin'
+    )
+    await conn.execute("""
+        INSERT INTO issue (title, type, status, priority, "listPosition",
+                           description, "descriptionText", "reporterId", "projectId")
+        SELECT 'Issue ' || g, 'task',
+               (ARRAY['backlog', 'selected', 'inprogress', 'done'])[1 + g % 4],
+               '3', g, 'Benchmark description', 'Benchmark description', $1, $2
+        FROM generate_series(1, $3) AS g
+    """, user_id, project_id, issue_count)
+    await conn.execute("""
+        INSERT INTO issue_user (issue_id, user_id)
+        SELECT id, $1 FROM issue WHERE "projectId" = $2
+    """, user_id, project_id)
+    await conn.execute('ANALYZE issue; ANALYZE issue_user')
+    return project_id
+
+
+async def measure(loader, conn, project_id: int, runs: int):
+    timings = []
+    queries = 0
+    for _ in range(runs):
+        counting = CountingConnection(conn)
+        started = time.perf_counter()
+        await loader(counting, project_id)
+        timings.append((time.perf_counter() - started) * 1000)
+        queries = counting.queries
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(round(len(timings) * 0.95)) - 1)]
+    return queries, statistics.median(timings), p95
+
+
+async def main(sizes, runs: int, skip_legacy: bool):
+    await engine.open()
+    print(f"{'issues':>8} {'loader':>8} {'queries':>8} {'p50 ms':>10} {'p95 ms':>10}")
+    try:
+        for size in sizes:
+            async with engine.connection() as conn:
+                transaction = conn.transaction()
+                await transaction.start()
+                try:
+                    project_id = await seed_project(conn, size)
+                    loaders = [("batched", fetch_project_board)]
+                    if not skip_legacy:
+                        loaders.append(("legacy", legacy_fetch_project_board))
+                    for name, loader in loaders:
+                        queries, p50, p95 = await measure(loader, conn, project_id, runs)
+                        print(f"{size:>8} {name:>8} {queries:>8} {p50:>10.2f} {p95:>10.2f}")
+                finally:
+                    await transaction.rollback()
+    finally:
+        await engine.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the project board loader")
+    parser.add_argument("--sizes", default="100,1000,10000", help="Comma separated issue counts")
+    parser.add_argument("--runs", type=int, default=20, help="Board loads per size")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only measure the batched loader")
+    args = parser.parse_args()
+
+    asyncio.run(main([int(s) for s in args.sizes.split(",")], args.runs, args.skip_legacy))
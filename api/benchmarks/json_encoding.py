@@ -0,0 +1,130 @@
+"""Response serialization benchmark for a large board.
+
+Builds a synthetic board of N issues (no database needed) and measures the
+cost of turning it into response bytes:
+
+    response_model  the old GET /project/{id} path: model dump, re-validation
+                    against ProjectResponse, JSON-mode dump, stdlib json
+    encoder         plain dicts through jsonable_encoder and stdlib json
+                    (any endpoint returning a dict)
+    orjson          FastJSONResponse.render on the same values, which is what
+                    endpoints returning a FastJSONResponse now pay
+
+Usage (from the api/ directory):
+
+    python benchmarks/json_encoding.py --issues 5000 --runs 20
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+from decimal import Decimal
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from main import build_issue, serialize_updated_issue, Project, ProjectResponse, User  # noqa: E402
+from responses import FastJSONResponse  # noqa: E402
+
+STATUSES = ['backlog', 'selected', 'inprogress', 'underreview', 'done']
+
+
+def synthetic_rows(issue_count: int):
+    """Issue rows and assignee rows shaped like the database results"""
+    users = [
+        {"id": n, "name": f"User {n}", "email": f"user{n}@example.com", "avatarUrl": None}
+        for n in range(1, 21)
+    ]
+    started = datetime(2024, 1, 1, 9, 30)
+    issues = []
+    for n in range(1, issue_count + 1):
+        issues.append({
+            "id": n,
+            "title": f"Issue {n}: something needs doing",
+            "type": "task",
+            "status": STATUSES[n % len(STATUSES)],
+            "priority": str(1 + n % 5),
+            "listPosition": Decimal(n * 1024),
+            "description": "A reasonably sized description of the work. " * 4,
+            "descriptionText": "A reasonably sized description of the work. " * 4,
+            "estimate": 8,
+            "timeSpent": 2,
+            "timeRemaining": 6,
+            "reporterId": 1,
+            "projectId": 1,
+            "created_at": started + timedelta(minutes=n),
+            "updated_at": started + timedelta(minutes=n, seconds=30),
+            "due_date": (started + timedelta(days=n % 30)).date(),
+        })
+    assignees = {issue["id"]: [users[issue["id"] % len(users)]] for issue in issues}
+    return issues, users, assignees
+
+
+def build_board(issues, users, assignees) -> ProjectResponse:
+    return ProjectResponse(project=Project(
+        id=1,
+        name="Benchmark",
+        category="software",
+        createdAt=datetime(2024, 1, 1),
+        updatedAt=datetime(2024, 1, 2),
+        issues=[build_issue(issue, assignees[issue["id"]]) for issue in issues],
+        users=[User(**user) for user in users],
+    ))
+
+
+def response_model_path(board: ProjectResponse) -> bytes:
+    validated = ProjectResponse.model_validate(board.model_dump())
+    return json.dumps(validated.model_dump(mode="json"), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def encoder_path(payload) -> bytes:
+    return json.dumps(jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def orjson_path(payload) -> bytes:
+    return FastJSONResponse(None).render(payload)
+
+
+def measure(fn, payload, runs: int):
+    timings = []
+    size = 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        size = len(fn(payload))
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(round(len(timings) * 0.95)) - 1)]
+    return size, statistics.median(timings), p95
+
+
+def main(issue_count: int, runs: int):
+    issues, users, assignees = synthetic_rows(issue_count)
+    board = build_board(issues, users, assignees)
+    updated = {"issues": [serialize_updated_issue(issue, assignees[issue["id"]]) for issue in issues]}
+
+    cases = [
+        ("board", "response_model", response_model_path, board),
+        ("board", "encoder", encoder_path, board),
+        ("board", "orjson", orjson_path, board),
+        ("dicts", "encoder", encoder_path, updated),
+        ("dicts", "orjson", orjson_path, updated),
+    ]
+
+    print(f"{issue_count} issues, {runs} runs")
+    print(f"{'payload':>8} {'path':>15} {'bytes':>10} {'p50 ms':>10} {'p95 ms':>10}")
+    for payload_name, path_name, fn, payload in cases:
+        size, p50, p95 = measure(fn, payload, runs)
+        print(f"{payload_name:>8} {path_name:>15} {size:>10} {p50:>10.2f} {p95:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark JSON response serialization")
+    parser.add_argument("--issues", type=int, default=5000, help="Issues on the synthetic board")
+    parser.add_argument("--runs", type=int, default=20, help="Serializations per path")
+    args = parser.parse_args()
+
+    main(args.issues, args.runs)
@@ -0,0 +1,290 @@
+import os
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.extras import RealDictCursor
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    """Raised when no database connection could be checked out in time"""
+
+
+class ConnectionPool:
+    """Thread-safe pool of psycopg2 connections.
+
+    Connections are health checked when they have been idle for a while,
+    recycled once they exceed ``max_lifetime`` and handed out LIFO so the
+    hottest connections stay warm while surplus ones age out.
+    """
+
+    def __init__(
+        self,
+        connect_kwargs: dict,
+        min_size: int = 2,
+        max_size: int = 10,
+        max_lifetime: float = 1800.0,
+        health_check_after: float = 30.0,
+        checkout_timeout: float = 10.0,
+    ):
+        if max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min={min_size}, max={max_size}")
+
+        self.connect_kwargs = connect_kwargs
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.health_check_after = health_check_after
+        self.checkout_timeout = checkout_timeout
+
+        self._idle = deque()   # (conn, created_at, last_used_at)
+        self._created_at = {}  # id(conn) -> created_at, for connections in use
+        self._size = 0
+        self._waiting = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._stats = {
+            "checkouts": 0,
+            "timeouts": 0,
+            "connections_created": 0,
+            "connections_discarded": 0,
+            "health_check_failures": 0,
+            "wait_time_total_ms": 0.0,
+            "wait_time_max_ms": 0.0,
+        }
+
+    @classmethod
+    def from_env(cls):
+        """Build a pool from DB_* / DB_POOL_* environment variables.
+
+        DB_POOL_MAX_SIZE is the per-worker limit. If DB_POOL_TOTAL_MAX_SIZE is
+        set instead, it is divided across WEB_CONCURRENCY uvicorn workers so the
+        whole deployment stays under the server's max_connections.
+        """
+        load_dotenv()
+
+        workers = max(int(os.getenv('WEB_CONCURRENCY', '1')), 1)
+        total_max = os.getenv('DB_POOL_TOTAL_MAX_SIZE')
+        if total_max:
+            max_size = max(int(total_max) // workers, 1)
+        else:
+            max_size = int(os.getenv('DB_POOL_MAX_SIZE', '10'))
+        min_size = min(int(os.getenv('DB_POOL_MIN_SIZE', '2')), max_size)
+
+        return cls(
+            connect_kwargs={
+                "host": os.getenv('DB_HOST'),
+                "port": os.getenv('DB_PORT'),
+                "database": os.getenv('DB_DATABASE'),
+                "user": os.getenv('DB_USERNAME'),
+                "password": os.getenv('DB_PASSWORD'),
+            },
+            min_size=min_size,
+            max_size=max_size,
+            max_lifetime=float(os.getenv('DB_POOL_MAX_LIFETIME', '1800')),
+            health_check_after=float(os.getenv('DB_POOL_HEALTH_CHECK_AFTER', '30')),
+            checkout_timeout=float(os.getenv('DB_POOL_CHECKOUT_TIMEOUT', '10')),
+        )
+
+    def _connect(self):
+        conn = psycopg2.connect(cursor_factory=RealDictCursor, **self.connect_kwargs)
+        with self._cond:
+            self._stats["connections_created"] += 1
+        return conn
+
+    def open(self):
+        """Pre-fill the pool up to min_size connections"""
+        with self._cond:
+            self._closed = False
+
+        while True:
+            # Reserve one slot at a time: a failed connect gives back only its own
+            # slot, so a worker started before Postgres keeps its full capacity
+            with self._cond:
+                if self._size >= self.min_size:
+                    break
+                self._size += 1
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            now = time.monotonic()
+            with self._cond:
+                self._idle.append((conn, now, now))
+                self._cond.notify()
+
+        logger.info(f"Database pool ready: min={self.min_size}, max={self.max_size}")
+
+    def close(self):
+        """Close idle connections and refuse new checkouts"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+
+        for conn, _, _ in idle:
+            self._close_quietly(conn)
+
+    def _close_quietly(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _discard(self, conn):
+        self._close_quietly(conn)
+        with self._cond:
+            self._size -= 1
+            self._stats["connections_discarded"] += 1
+            self._cond.notify()
+
+    def _is_healthy(self, conn, created_at, last_used_at, now):
+        if conn.closed or now - created_at > self.max_lifetime:
+            return False
+        if now - last_used_at < self.health_check_after:
+            return True
+
+        # Idle long enough that the server or a proxy may have dropped it
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            with self._cond:
+                self._stats["health_check_failures"] += 1
+            return False
+
+    def getconn(self, timeout: float = None):
+        """Check out a connection, waiting up to timeout seconds for one to free up"""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            conn = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise PoolTimeout("Database pool is closed")
+                    if self._idle:
+                        conn, created_at, last_used_at = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeout(
+                            f"Timed out after {timeout}s waiting for a database connection "
+                            f"(pool max_size={self.max_size})"
+                        )
+                    self._waiting += 1
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+
+            if conn is None:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                created_at = time.monotonic()
+            elif not self._is_healthy(conn, created_at, last_used_at, time.monotonic()):
+                self._discard(conn)
+                continue
+
+            waited_ms = (time.monotonic() - started) * 1000
+            with self._cond:
+                self._created_at[id(conn)] = created_at
+                self._stats["checkouts"] += 1
+                self._stats["wait_time_total_ms"] += waited_ms
+                self._stats["wait_time_max_ms"] = max(self._stats["wait_time_max_ms"], waited_ms)
+            return conn
+
+    def putconn(self, conn):
+        """Return a connection, resetting any transaction left open by the caller"""
+        with self._cond:
+            created_at = self._created_at.pop(id(conn), None)
+
+        if created_at is None:
+            # Not ours (or returned twice) - never hand it out again
+            self._close_quietly(conn)
+            return
+
+        now = time.monotonic()
+        if self._closed or conn.closed or now - created_at > self.max_lifetime:
+            self._discard(conn)
+            return
+
+        try:
+            if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+        except Exception:
+            self._discard(conn)
+            return
+
+        with self._cond:
+            self._idle.append((conn, created_at, now))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, timeout: float = None):
+        """Context manager for code paths outside a request"""
+        conn = self.getconn(timeout)
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def stats(self) -> dict:
+        """Pool gauges and counters for capacity planning"""
+        with self._cond:
+            checkouts = self._stats["checkouts"]
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "waiting": self._waiting,
+                "checkouts": checkouts,
+                "timeouts": self._stats["timeouts"],
+                "connections_created": self._stats["connections_created"],
+                "connections_discarded": self._stats["connections_discarded"],
+                "health_check_failures": self._stats["health_check_failures"],
+                "wait_time_avg_ms": round(self._stats["wait_time_total_ms"] / checkouts, 3) if checkouts else 0.0,
+                "wait_time_max_ms": round(self._stats["wait_time_max_ms"], 3),
+            }
+
+
+# Initialize the per-worker pool with environment variables
+pool = ConnectionPool.from_env()
+
+
+def get_db():
+    """FastAPI dependency that lends a pooled connection for the request"""
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
@@ -160,6 +160,7 @@ class EmailService:
         priority: str,
         ticket_type: str,
         ticket_url: str,
+        unsubscribe_url: str = None,
         template_id: int = 10621  # Template ID for assignee change
     ) -> bool:
         """Send assignee change notification"""
@@ -199,6 +200,7 @@ class EmailService:
         project_name: str,
         ticket_status: str,
         ticket_url: str,
+        unsubscribe_url: str = None,
         template_id: int = 10622  # Template ID for comments
     ) -> bool:
         """Send comment notification"""
@@ -223,6 +225,35 @@ class EmailService:
         
         return await self.send_template_email(template_id, receivers, replacements)
 
+    async def send_ticket_digest_email(
+        self,
+        user_email: str,
+        user_name: str,
+        changes: List[Dict[str, str]],  # [{"ticketId", "ticketTitle", "summary", "ticketUrl"}]
+        project_name: str,
+        updated_by_name: str,
+        unsubscribe_url: str = None,
+        template_id: int = 10623  # Template ID for batched ticket updates
+    ) -> bool:
+        """Send one notification covering several ticket changes (bulk edits)"""
+        
+        receivers = [{"email": user_email, "name": user_name}]
+        replacements = [{
+            "senderVariant": "1",
+            "userName": user_name,
+            "changeCount": str(len(changes)),
+            "changes": changes,
+            "changesSummary": "\n".join(
+                f"#{change['ticketId']} {change['ticketTitle']}: {change['summary']}" for change in changes
+            ),
+            "projectName": project_name,
+            "updatedByName": updated_by_name,
+            "ticketUrl": changes[0]['ticketUrl'] if changes else "",
+            "unsubscribeUrl": unsubscribe_url or (f"{changes[0]['ticketUrl']}/unsubscribe" if changes else "")
+        }]
+        
+        return await self.send_template_email(template_id, receivers, replacements)
+
 # Utility functions
 def get_user_initials(name: str) -> str:
     """Get user initials from full name"""
@@ -0,0 +1,92 @@
+"""Sparse fieldsets for issue payloads (?fields=title,status,userIds).
+
+Every public issue field names the issue columns it is built from, so a
+projection is pushed down into the SELECT list: unrequested columns (long
+descriptions in particular) are neither read nor sent. userIds and users come
+from issue_user; they are only loaded when one of them is requested.
+"""
+import hashlib
+from collections import namedtuple
+from typing import Optional
+
+from fastapi import HTTPException
+
+IssueField = namedtuple('IssueField', ['columns', 'value'])
+
+
+def _assignee(user) -> dict:
+    return {"id": user['id'], "name": user['name'], "email": user['email'], "avatarUrl": user['avatarUrl']}
+
+
+# Public field -> (columns of "issue i" it reads, value from the row and its assignee rows).
+# Values follow build_issue, so a projection is a subset of the full document.
+ISSUE_FIELDS = {
+    'id': IssueField(('i.id',), lambda issue, users: str(issue['id'])),
+    'title': IssueField(('i.title',), lambda issue, users: issue['title']),
+    'type': IssueField(('i.type',), lambda issue, users: issue['type'] or "task"),
+    'status': IssueField(('i.status',), lambda issue, users: issue['status'] or "backlog"),
+    'priority': IssueField(('i.priority',), lambda issue, users: issue['priority'] or "3"),
+    'listPosition': IssueField(('i."listPosition"',), lambda issue, users: issue['listPosition'] or 0),
+    'description': IssueField(
+        ('i.description',),
+        lambda issue, users: f"<p>{issue['description']}</p>" if issue['description'] else ""
+    ),
+    'descriptionText': IssueField(
+        ('i."descriptionText"', 'i.description'),
+        lambda issue, users: issue['descriptionText'] or issue['description'] or ""
+    ),
+    'estimate': IssueField(('i.estimate',), lambda issue, users: issue['estimate']),
+    'timeSpent': IssueField(('i."timeSpent"',), lambda issue, users: issue['timeSpent'] or 0),
+    'timeRemaining': IssueField(('i."timeRemaining"',), lambda issue, users: issue['timeRemaining']),
+    'reporterId': IssueField(('i."reporterId"',), lambda issue, users: issue['reporterId']),
+    'projectId': IssueField(('i."projectId"',), lambda issue, users: issue['projectId']),
+    'createdAt': IssueField(('i."created_at"',), lambda issue, users: issue['created_at']),
+    'updatedAt': IssueField(('i."updated_at"',), lambda issue, users: issue['updated_at']),
+    'dueDate': IssueField(('i.due_date',), lambda issue, users: issue['due_date']),
+    'commentCount': IssueField(('i.comment_count',), lambda issue, users: issue['comment_count']),
+    'userIds': IssueField((), lambda issue, users: [user['id'] for user in users]),
+    'users': IssueField((), lambda issue, users: [_assignee(user) for user in users]),
+}
+
+# ?fields=board: everything the project views read from project.issues (card face, column,
+# order, avatars, the "recent" filter and the issue search's newest-first list)
+BOARD_FIELDS = ('id', 'title', 'type', 'status', 'priority', 'listPosition', 'userIds', 'createdAt', 'updatedAt')
+
+
+def parse_fields(value: Optional[str], allowed=ISSUE_FIELDS) -> Optional[tuple]:
+    """Field names from a comma separated ?fields= value, or None when it was not given"""
+    if value is None:
+        return None
+    fields = tuple(dict.fromkeys(name.strip() for name in value.split(',') if name.strip()))
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(allowed)}"
+        )
+    return fields
+
+
+def select_list(fields: tuple, required: tuple = ('i.id',)) -> str:
+    """SELECT list for the requested fields plus the columns the query itself needs"""
+    columns = list(required)
+    for name in fields:
+        if name in ISSUE_FIELDS:
+            columns.extend(ISSUE_FIELDS[name].columns)
+    return ', '.join(dict.fromkeys(columns))
+
+
+def needs_assignees(fields: tuple) -> bool:
+    return 'userIds' in fields or 'users' in fields
+
+
+def project_issue(issue, assignee_users, fields: tuple) -> dict:
+    """The requested fields of one issue row"""
+    return {name: ISSUE_FIELDS[name].value(issue, assignee_users) for name in fields if name in ISSUE_FIELDS}
+
+
+def projection_tag(fields: Optional[tuple]) -> str:
+    """Short, stable ETag component for a projection"""
+    if fields is None:
+        return "all"
+    return hashlib.sha1(','.join(fields).encode()).hexdigest()[:12]
@@ -0,0 +1,37 @@
+from fastapi import Request, Response
+
+# Clients may keep a copy but must revalidate it (If-None-Match) on every use
+CACHE_CONTROL = 'private, no-cache'
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from the values that identify one version of a representation"""
+    return '"' + '-'.join(str(part) for part in parts) + '"'
+
+
+def request_etags(request: Request) -> list:
+    """Entity tags listed in If-None-Match (weak prefixes dropped, as RFC 9110 compares weakly)"""
+    header = request.headers.get('if-none-match')
+    if not header:
+        return []
+    tags = []
+    for tag in header.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag:
+            tags.append(tag)
+    return tags
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    tags = request_etags(request)
+    return '*' in tags or etag in tags
+
+
+def cache_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag))
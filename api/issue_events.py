@@ -0,0 +1,146 @@
+"""Append-only issue history (issue_event).
+
+Writers record field-level changes in the transaction that makes them: diff
+the issue rows from before and after the write with issue_changes(), then
+record_events() sends every change of the request in one batched INSERT. If
+the write rolls back, so does its history.
+
+Tracked fields are status, priority, estimate, listPosition and assignees
+(as sorted user id lists). Column respacing by the rebalancer renumbers
+positions without changing the order and is not recorded.
+
+issue_event is partitioned by month on created_at. ensure_partitions() keeps
+the coming months' partitions ready (the app runs it at startup); retention
+drops whole months with drop_expired_partitions() instead of deleting rows.
+
+Usage (from the api/ directory):
+
+    python issue_events.py maintain                    # create upcoming partitions
+    python issue_events.py maintain --keep-months 12   # ... and drop older months
+"""
+import os
+import sys
+import argparse
+from decimal import Decimal
+
+from dotenv import load_dotenv
+from psycopg2.extras import Json, execute_values
+
+load_dotenv()
+
+# Event field -> issue column it is read from
+TRACKED_COLUMNS = {
+    'status': 'status',
+    'priority': 'priority',
+    'estimate': 'estimate',
+    'listPosition': 'listPosition',
+}
+ASSIGNEES = 'assignees'
+EVENT_FIELDS = (*TRACKED_COLUMNS, ASSIGNEES)
+
+PARTITION_MONTHS_AHEAD = int(os.getenv('ISSUE_EVENT_MONTHS_AHEAD', '3'))
+RETENTION_MONTHS = int(os.getenv('ISSUE_EVENT_RETENTION_MONTHS', '0'))  # 0 keeps every month
+
+INSERT_EVENTS_SQL = """
+    INSERT INTO issue_event (issue_id, project_id, actor_id, field, old_value, new_value)
+    VALUES %s
+"""
+INSERT_PAGE_SIZE = 1000
+
+
+def _json(value):
+    """JSONB parameter for a column value (SQL NULL for None)"""
+    if value is None:
+        return None
+    if isinstance(value, Decimal):
+        value = float(value)
+    return Json(value)
+
+
+def issue_changes(before, after, actor_id, old_assignees=None, new_assignees=None) -> list:
+    """Event rows for the tracked fields that differ between two rows of one issue.
+
+    ``before`` may hold only some columns; fields missing from it are not
+    compared. Assignees are compared when both id lists are given.
+    """
+    issue_id, project_id = after['id'], after['projectId']
+    rows = []
+    for field, column in TRACKED_COLUMNS.items():
+        if column not in before or column not in after:
+            continue
+        old, new = before[column], after[column]
+        if old != new:
+            rows.append((issue_id, project_id, actor_id, field, _json(old), _json(new)))
+    if old_assignees is not None and new_assignees is not None and set(old_assignees) != set(new_assignees):
+        rows.append((
+            issue_id, project_id, actor_id, ASSIGNEES,
+            Json(sorted(set(old_assignees))), Json(sorted(set(new_assignees)))
+        ))
+    return rows
+
+
+def record_events(cur, rows: list):
+    """Insert event rows on the writer's cursor, batched into multi-row INSERTs"""
+    if rows:
+        execute_values(cur, INSERT_EVENTS_SQL, rows, page_size=INSERT_PAGE_SIZE)
+
+
+def serialize_event(event) -> dict:
+    return {
+        "id": str(event['id']),
+        "issueId": event['issue_id'],
+        "projectId": event['project_id'],
+        "field": event['field'],
+        "from": event['old_value'],
+        "to": event['new_value'],
+        "createdAt": event['created_at'],
+        "actor": {
+            "id": event['actor_id'],
+            "name": event['actor_name'],
+            "avatarUrl": event['actor_avatar_url']
+        } if event['actor_id'] is not None else None
+    }
+
+
+def ensure_partitions(conn, months_ahead: int = PARTITION_MONTHS_AHEAD):
+    """Create the monthly partitions from the current month to months_ahead"""
+    with conn.cursor() as cur:
+        cur.execute('SELECT issue_event_create_partitions(%s)', (months_ahead,))
+    conn.commit()
+
+
+def drop_expired_partitions(conn, keep_months: int = RETENTION_MONTHS) -> list:
+    """Drop the months older than keep_months before the current one; returns the dropped tables"""
+    if keep_months <= 0:
+        return []
+    with conn.cursor() as cur:
+        cur.execute('SELECT issue_event_drop_partitions(%s) AS dropped', (keep_months,))
+        dropped = [row['dropped'] for row in cur.fetchall()]
+    conn.commit()
+    return dropped
+
+
+def main(argv=None):
+    from migrate import get_connection
+
+    parser = argparse.ArgumentParser(description="Issue history partition maintenance")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    maintain_parser = subparsers.add_parser('maintain', help="Create upcoming and drop expired partitions")
+    maintain_parser.add_argument('--months-ahead', type=int, default=PARTITION_MONTHS_AHEAD,
+                                 help="Months to create beyond the current one")
+    maintain_parser.add_argument('--keep-months', type=int, default=RETENTION_MONTHS,
+                                 help="Months kept before the current one (0 keeps all)")
+    args = parser.parse_args(argv)
+
+    conn = get_connection()
+    try:
+        ensure_partitions(conn, args.months_ahead)
+        for table in drop_expired_partitions(conn, args.keep_months):
+            print(f"Dropped {table}")
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+"""Bulk issue import through PostgreSQL COPY.
+
+Rows from a CSV file (with a header row) or a JSONL file are streamed with
+COPY into a temporary staging table, validated with set-based queries and
+merged into issue / issue_user in the same transaction, so an import lands
+completely or not at all. No notification emails are sent; board clients get
+a single resync event once the import commits.
+
+Recognised fields (CSV header or JSON keys): title (required), type, status,
+priority, listPosition, description, estimate, timeSpent, timeRemaining,
+dueDate and assignees (member emails, ";"-separated in CSV or a JSON list).
+Cards without a listPosition are appended to their column in file order.
+
+Usage (from the api/ directory):
+
+    python issue_import.py --project 3 --reporter 1 issues.csv
+    python issue_import.py --project 3 --reporter 1 --format jsonl issues.jsonl
+    cat issues.csv | python issue_import.py --project 3 --reporter 1 -
+"""
+import io
+import sys
+import csv
+import json
+import argparse
+
+from ordering import POSITION_STEP
+from realtime import publish
+
+ISSUE_TYPES = ['task', 'bug', 'story']
+ISSUE_STATUSES = ['backlog', 'selected', 'inprogress', 'underreview', 'done']
+ISSUE_PRIORITIES = ['1', '2', '3', '4', '5']
+FORMATS = ('csv', 'jsonl')
+
+# Input field -> staging column, in COPY column order
+IMPORT_FIELDS = {
+    'title': 'title',
+    'type': 'type',
+    'status': 'status',
+    'priority': 'priority',
+    'listPosition': 'list_position',
+    'description': 'description',
+    'estimate': 'estimate',
+    'timeSpent': 'time_spent',
+    'timeRemaining': 'time_remaining',
+    'dueDate': 'due_date',
+    'assignees': 'assignees',
+}
+
+PROGRESS_EVERY = 10000  # rows between progress callbacks while copying
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportValidationError(Exception):
+    """The file was rejected; ``errors`` lists {"line", "error"} for the first bad rows"""
+
+    def __init__(self, errors: list):
+        self.errors = errors
+        super().__init__(f"{len(errors)} invalid row(s), first on line {errors[0]['line']}")
+
+
+def read_records(stream, fmt: str):
+    """Yield (line number, record dict) from a text stream"""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError:
+            raise ImportValidationError([{"line": line, "error": "Invalid JSON"}])
+        if not isinstance(record, dict):
+            raise ImportValidationError([{"line": line, "error": "Expected a JSON object"}])
+        yield line, record
+
+
+def staging_row(line: int, record: dict) -> list:
+    """One staging row; every value travels as text and is validated in SQL"""
+    row = [line]
+    for field in IMPORT_FIELDS:
+        value = record.get(field)
+        if field == 'assignees' and isinstance(value, list):
+            value = ';'.join(str(email) for email in value)
+        elif isinstance(value, (dict, list)):
+            value = json.dumps(value)
+        row.append(None if value is None or value == '' else str(value))
+    return row
+
+
+class CopyStream:
+    """Read-only file object rendering rows as CSV on demand, for COPY ... FROM STDIN"""
+
+    def __init__(self, rows, progress=None):
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator='\n')
+        self._progress = progress
+        self.count = 0
+        # psycopg2 replaces exceptions raised in the read callback with a
+        # generic QueryCanceled, so a bad line is kept here and re-raised by
+        # the caller once COPY returns
+        self.error = None
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or self._buffer.tell() < size:
+            try:
+                row = next(self._rows)
+            except StopIteration:
+                break
+            except ImportValidationError as e:
+                self.error = e
+                self._rows = iter(())
+                break
+            self._writer.writerow(row)
+            self.count += 1
+            if self._progress and self.count % PROGRESS_EVERY == 0:
+                self._progress('copying', self.count)
+
+        chunk = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return chunk
+
+    readline = read
+
+
+VALIDATION_SQL = """
+    SELECT line, error FROM (
+        SELECT line, 'title is required' AS error
+        FROM issue_import_staging WHERE title IS NULL OR btrim(title) = ''
+        UNION ALL
+        SELECT line, 'title is longer than 500 characters'
+        FROM issue_import_staging WHERE length(title) > 500
+        UNION ALL
+        SELECT line, 'unknown type ' || type
+        FROM issue_import_staging WHERE type <> ALL(%(types)s)
+        UNION ALL
+        SELECT line, 'unknown status ' || status
+        FROM issue_import_staging WHERE status <> ALL(%(statuses)s)
+        UNION ALL
+        SELECT line, 'priority must be one of 1-5'
+        FROM issue_import_staging WHERE priority <> ALL(%(priorities)s)
+        UNION ALL
+        SELECT line, 'listPosition must be a number'
+        FROM issue_import_staging WHERE list_position !~ '^-?[0-9]+(\\.[0-9]+)?$'
+        UNION ALL
+        SELECT line, 'estimate, timeSpent and timeRemaining must be whole numbers'
+        FROM issue_import_staging
+        WHERE estimate !~ '^[0-9]{1,9}$' OR time_spent !~ '^[0-9]{1,9}$' OR time_remaining !~ '^[0-9]{1,9}$'
+        UNION ALL
+        SELECT line, 'dueDate must be a calendar date as YYYY-MM-DD'
+        FROM issue_import_staging
+        -- CASE fixes the evaluation order: nothing is cast before the format is known to be good
+        WHERE CASE
+            WHEN due_date !~ '^[0-9]{4}-[0-9]{2}-[0-9]{2}$' THEN true
+            WHEN substr(due_date, 1, 4)::int = 0 OR substr(due_date, 6, 2)::int NOT BETWEEN 1 AND 12 THEN true
+            ELSE substr(due_date, 9, 2)::int NOT BETWEEN 1 AND extract(day FROM
+                make_date(substr(due_date, 1, 4)::int, substr(due_date, 6, 2)::int, 1) + INTERVAL '1 month - 1 day'
+            )::int
+        END
+        UNION ALL
+        SELECT s.line, 'assignee ' || btrim(a.email) || ' is not a member of this project'
+        FROM issue_import_staging s
+        CROSS JOIN LATERAL unnest(string_to_array(s.assignees, ';')) AS a(email)
+        WHERE btrim(a.email) <> ''
+          AND NOT EXISTS (
+              SELECT 1 FROM "user" u
+              JOIN user_project up ON up.user_id = u.id AND up.project_id = %(project_id)s
+              WHERE lower(u.email) = lower(btrim(a.email))
+          )
+    ) errors
+    ORDER BY line
+    LIMIT %(limit)s
+"""
+
+MERGE_ISSUES_SQL = """
+    INSERT INTO issue (
+        id, title, type, status, priority, "listPosition",
+        description, "descriptionText", estimate, "timeSpent",
+        "timeRemaining", "reporterId", "projectId", due_date
+    )
+    SELECT
+        s.issue_id,
+        btrim(s.title),
+        COALESCE(s.type, 'task'),
+        COALESCE(s.status, 'backlog'),
+        COALESCE(s.priority, '3'),
+        COALESCE(
+            s.list_position::numeric,
+            COALESCE(tail.last_position, 0)
+                + %(step)s * ROW_NUMBER() OVER (PARTITION BY COALESCE(s.status, 'backlog') ORDER BY s.line)
+        ),
+        COALESCE(s.description, ''),
+        COALESCE(s.description, ''),
+        s.estimate::int,
+        COALESCE(s.time_spent::int, 0),
+        s.time_remaining::int,
+        %(reporter_id)s,
+        %(project_id)s,
+        s.due_date::date
+    FROM issue_import_staging s
+    LEFT JOIN LATERAL (
+        SELECT MAX("listPosition") AS last_position
+        FROM issue
+        WHERE "projectId" = %(project_id)s AND status = COALESCE(s.status, 'backlog')
+    ) tail ON true
+    ORDER BY s.line
+"""
+
+MERGE_ASSIGNEES_SQL = """
+    INSERT INTO issue_user (issue_id, user_id)
+    SELECT DISTINCT s.issue_id, u.id
+    FROM issue_import_staging s
+    CROSS JOIN LATERAL unnest(string_to_array(s.assignees, ';')) AS a(email)
+    JOIN "user" u ON lower(u.email) = lower(btrim(a.email))
+    ON CONFLICT (issue_id, user_id) DO NOTHING
+"""
+
+
+def import_issues(conn, stream, project_id: int, reporter_id: int, fmt: str = 'csv', progress=None) -> dict:
+    """Import every issue in a CSV/JSONL text stream into a project, atomically.
+
+    ``progress(phase, rows)`` is called while copying and at each phase
+    change (validating, merging, done). Raises ImportValidationError without
+    writing anything if a row is invalid.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported import format {fmt!r}")
+    report = progress or (lambda phase, rows: None)
+    columns = ', '.join(IMPORT_FIELDS.values())
+
+    try:
+        with conn.cursor() as cur:
+            cur.execute(f"""
+                CREATE TEMP TABLE issue_import_staging (
+                    line INTEGER NOT NULL,
+                    {', '.join(f'{column} TEXT' for column in IMPORT_FIELDS.values())},
+                    issue_id INTEGER
+                ) ON COMMIT DROP
+            """)
+
+            rows = (staging_row(line, record) for line, record in read_records(stream, fmt))
+            copy_stream = CopyStream(rows, report)
+            report('copying', 0)
+            try:
+                cur.copy_expert(f"COPY issue_import_staging (line, {columns}) FROM STDIN WITH (FORMAT csv)", copy_stream)
+            except Exception:
+                if copy_stream.error:
+                    raise copy_stream.error
+                raise
+            if copy_stream.error:
+                raise copy_stream.error
+            total = copy_stream.count
+
+            report('validating', total)
+            cur.execute(VALIDATION_SQL, {
+                'types': ISSUE_TYPES,
+                'statuses': ISSUE_STATUSES,
+                'priorities': ISSUE_PRIORITIES,
+                'project_id': project_id,
+                'limit': MAX_REPORTED_ERRORS,
+            })
+            errors = [{"line": row['line'], "error": row['error']} for row in cur.fetchall()]
+            if errors:
+                raise ImportValidationError(errors)
+
+            report('merging', total)
+            # Reserve ids up front so assignees can be attached to their staging row
+            cur.execute("UPDATE issue_import_staging SET issue_id = nextval(pg_get_serial_sequence('issue', 'id'))")
+            cur.execute(MERGE_ISSUES_SQL, {'step': POSITION_STEP, 'reporter_id': reporter_id, 'project_id': project_id})
+            imported = cur.rowcount
+            cur.execute(MERGE_ASSIGNEES_SQL)
+            assigned = cur.rowcount
+
+            if imported:
+                publish(cur, project_id, "resync", reason="import", count=imported)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    report('done', total)
+    return {"imported": imported, "assigned": assigned}
+
+
+def main(argv=None):
+    from migrate import get_connection
+
+    parser = argparse.ArgumentParser(description="Import issues into a project from CSV or JSONL")
+    parser.add_argument('path', help="File to import, or - for stdin")
+    parser.add_argument('--project', type=int, required=True, help="Target project id")
+    parser.add_argument('--reporter', type=int, required=True, help="User id recorded as reporter")
+    parser.add_argument('--format', choices=FORMATS, default=None,
+                        help="Input format (default: from the file extension, csv for stdin)")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ('jsonl' if args.path.endswith(('.jsonl', '.ndjson')) else 'csv')
+
+    def progress(phase, rows):
+        print(f"\r{phase:<12} {rows:>12,} rows", end='\n' if phase == 'done' else '', file=sys.stderr, flush=True)
+
+    conn = get_connection()
+    stream = sys.stdin if args.path == '-' else open(args.path, newline='', encoding='utf-8')
+    try:
+        result = import_issues(conn, stream, args.project, args.reporter, fmt, progress)
+        print(f"Imported {result['imported']} issue(s), {result['assigned']} assignment(s)")
+        return 0
+    except ImportValidationError as e:
+        print("\nImport rejected, nothing was written:", file=sys.stderr)
+        for error in e.errors:
+            print(f"  line {error['line']}: {error['error']}", file=sys.stderr)
+        return 1
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
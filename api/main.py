@@ -1,18 +1,48 @@
-from fastapi import FastAPI, HTTPException, Request, Depends
+from fastapi import FastAPI, HTTPException, Request, Response, Depends, Query, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Optional, Dict
 from datetime import datetime, timedelta
+from decimal import Decimal
 import os
+import re
+import json
+import tempfile
 from dotenv import load_dotenv
 import psycopg2
-from psycopg2.extras import RealDictCursor
+import asyncpg
 import traceback
 import secrets
 import hashlib
 import jwt
 from email_service import email_service, format_priority, format_status
+from db_pool import pool as db_pool, get_db, PoolTimeout
+from async_db import engine as async_engine, get_async_db
+from migrate import check_schema
+from auth_cache import principal_cache
+from acl import project_acl
+from pagination import encode_cursor, decode_cursor, clamp_limit, SqlParams
+from responses import FastJSONResponse
+from response_encoding import ResponseEncodingMiddleware, encoded_responses
+from fieldsets import (
+    ISSUE_FIELDS, BOARD_FIELDS, parse_fields, select_list, needs_assignees, project_issue, projection_tag
+)
+from http_cache import make_etag, request_etags, etag_matches, cache_headers, not_modified
+from realtime import board_events, publish, apublish
+from ordering import (
+    POSITION_STEP, position_between, gap_exhausted, neighbour_positions,
+    rebalance_column, rebalance_scheduler
+)
+from issue_import import import_issues, ImportValidationError, FORMATS as IMPORT_FORMATS
+from issue_events import (
+    EVENT_FIELDS, issue_changes, record_events, serialize_event, ensure_partitions, drop_expired_partitions
+)
+from project_export import (
+    iter_export, FORMATS as EXPORT_FORMATS, CSV_ENTITIES as EXPORT_CSV_ENTITIES,
+    MEDIA_TYPES as EXPORT_MEDIA_TYPES
+)
 import asyncio
 
 # Load environment variables
@@ -26,18 +56,25 @@ ALGORITHM = 'HS256'
 BASE_URL = os.getenv('BASE_URL', 'http://localhost:3000')
 
 # Create FastAPI app
-app = FastAPI(title="Ticket Tracker API", version="1.0.0")
+app = FastAPI(title="Ticket Tracker API", version="1.0.0", default_response_class=FastJSONResponse)
 
 # Enable CORS with explicit configuration
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:8080", "*"],
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"],
     expose_headers=["*"],
 )
 
+# gzip / brotli and MessagePack for clients that ask for them (see response_encoding.py)
+app.add_middleware(ResponseEncodingMiddleware)
+
+# Per-worker caches learn about other workers' writes over the board listener
+board_events.register_cache(principal_cache)
+board_events.register_cache(project_acl)
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -60,16 +97,93 @@ async def global_exception_handler(request: Request, exc: Exception):
         }
     )
 
-# Database connection function
-def get_db_connection():
-    """Create a database connection"""
-    return psycopg2.connect(
-        host=os.getenv('DB_HOST'),
-        port=os.getenv('DB_PORT'),
-        database=os.getenv('DB_DATABASE'),
-        user=os.getenv('DB_USERNAME'),
-        password=os.getenv('DB_PASSWORD'),
-        cursor_factory=RealDictCursor
+# Database connection pool lifecycle
+#
+# Two engines back the handlers:
+#   - `async def` handlers await asyncpg through get_async_db and never block the event loop
+#   - plain `def` handlers use blocking psycopg2 through get_db; FastAPI runs them on its
+#     threadpool, so a slow query there only ties up one worker thread
+# Never call get_db / psycopg2 from an `async def` handler.
+@app.on_event("startup")
+async def open_db_pools():
+    """Warm the per-worker connection pools"""
+    try:
+        await run_in_threadpool(db_pool.open)
+    except Exception as e:
+        # Connections are still created lazily on first checkout
+        print(f"Could not pre-fill database pool: {str(e)}")
+    try:
+        await async_engine.open()
+    except Exception as e:
+        print(f"Could not open async database pool: {str(e)}")
+    try:
+        await run_in_threadpool(run_index_advisor)
+    except Exception as e:
+        print(f"Index advisor could not inspect the schema: {str(e)}")
+    try:
+        await run_in_threadpool(run_issue_event_maintenance)
+    except Exception as e:
+        print(f"Issue history partitions could not be maintained: {str(e)}")
+    try:
+        await run_in_threadpool(run_sync_tombstone_pruning)
+    except Exception as e:
+        print(f"Sync tombstones could not be pruned: {str(e)}")
+    # Reconnects on its own if the database is not reachable yet
+    await board_events.start()
+
+def run_index_advisor():
+    """Warn at startup when a hot-path index or a migration is missing"""
+    with db_pool.connection() as conn:
+        check_schema(conn)
+
+def run_issue_event_maintenance():
+    """Create the coming months' issue_event partitions and apply the retention window"""
+    with db_pool.connection() as conn:
+        ensure_partitions(conn)
+        for table in drop_expired_partitions(conn):
+            print(f"Dropped expired issue history partition {table}")
+
+def run_sync_tombstone_pruning():
+    """Delete sync tombstones older than the retention window (cursors that old must resync)"""
+    if SYNC_TOMBSTONE_RETENTION_DAYS <= 0:
+        return
+    with db_pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "DELETE FROM sync_tombstone WHERE deleted_at < LOCALTIMESTAMP - make_interval(days => %s)",
+                (SYNC_TOMBSTONE_RETENTION_DAYS,)
+            )
+            pruned = cur.rowcount
+        conn.commit()
+    if pruned:
+        print(f"Pruned {pruned} sync tombstone(s)")
+
+@app.on_event("shutdown")
+async def close_db_pools():
+    """Close pooled connections on worker shutdown"""
+    await board_events.stop()
+    await async_engine.close()
+    await run_in_threadpool(db_pool.close)
+
+@app.exception_handler(PoolTimeout)
+async def pool_timeout_handler(request: Request, exc: PoolTimeout):
+    """Surface pool exhaustion as a retryable 503 instead of a generic 500"""
+    print(f"Database pool exhausted: {str(exc)}")
+    return JSONResponse(
+        status_code=503,
+        content={
+            "error": {
+                "code": "DATABASE_BUSY",
+                "message": "Database is busy, please retry",
+                "status": 503,
+                "data": {}
+            }
+        },
+        headers={
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Credentials": "true",
+            "Retry-After": "1",
+        }
     )
 
 # Email notification helper functions
@@ -77,15 +191,14 @@ async def send_assignment_notification(issue_id: int, assignee_users: list, proj
     """Send email notification when issue is assigned"""
     try:
         # Get issue details
-        conn = get_db_connection()
-        cur = conn.cursor()
-        
-        cur.execute("""
-            SELECT title, description, type, priority 
-            FROM issue 
-            WHERE id = %s
-        """, (issue_id,))
-        issue = cur.fetchone()
+        with db_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT title, description, type, priority 
+                    FROM issue 
+                    WHERE id = %s
+                """, (issue_id,))
+                issue = cur.fetchone()
         
         if not issue:
             return
@@ -117,11 +230,6 @@ async def send_assignment_notification(issue_id: int, assignee_users: list, proj
             
     except Exception as e:
         print(f"Error sending assignment notification: {str(e)}")
-    finally:
-        if 'cur' in locals():
-            cur.close()
-        if 'conn' in locals():
-            conn.close()
 
 def run_async_email(coro):
     """Helper to run async email functions"""
@@ -163,21 +271,26 @@ class Issue(BaseModel):
     timeRemaining: Optional[int] = None
     reporterId: int
     projectId: int
-    createdAt: Optional[str] = None
-    updatedAt: Optional[str] = None
+    createdAt: Optional[datetime] = None
+    updatedAt: Optional[datetime] = None
     userIds: List[int] = []
     users: List[User] = []
 
+class BoardColumn(BaseModel):
+    total: int
+    nextCursor: Optional[str] = None
+
 class Project(BaseModel):
     id: int
     name: str
     url: Optional[str] = None
     description: Optional[str] = None
     category: str = "software"
-    createdAt: Optional[str] = None
-    updatedAt: Optional[str] = None
+    createdAt: Optional[datetime] = None
+    updatedAt: Optional[datetime] = None
     issues: List[Issue] = []
     users: List[User] = []
+    columns: Optional[Dict[str, BoardColumn]] = None  # only when the board is paginated
 
 class ProjectResponse(BaseModel):
     project: Project
@@ -192,14 +305,37 @@ def read_root():
 # Authentication dependency function
 async def get_current_user(request: Request):
     """Get current user from JWT token"""
-    try:
-        # Get token from Authorization header
-        authorization: str = request.headers.get("Authorization")
-        
-        if not authorization or not authorization.startswith("Bearer "):
-            raise HTTPException(status_code=401, detail="Not authenticated")
-        
+    # Get token from Authorization header
+    authorization: str = request.headers.get("Authorization")
+    
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    
+    return await authenticate_token(authorization.split(" ")[1])
+
+async def get_stream_token(request: Request, token: Optional[str] = None) -> str:
+    """Bearer token from the Authorization header or ?token= (EventSource cannot send headers)"""
+    authorization: str = request.headers.get("Authorization")
+    if authorization and authorization.startswith("Bearer "):
         token = authorization.split(" ")[1]
+    
+    if not token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    
+    return token
+
+async def get_stream_user(token: str = Depends(get_stream_token)):
+    """Like get_current_user, but also accepts ?token="""
+    return await authenticate_token(token)
+
+async def authenticate_token(token: str) -> dict:
+    """Resolve a bearer token to the user it was issued for"""
+    try:
+        # Tokens in the cache were verified when they were stored and expire with the JWT
+        cached_user = principal_cache.get(token)
+        if cached_user:
+            return cached_user
+        generation = principal_cache.generation()
         
         # Decode JWT token
         try:
@@ -210,27 +346,24 @@ async def get_current_user(request: Request):
         except jwt.PyJWTError:
             raise HTTPException(status_code=401, detail="Invalid token")
         
-        # Get user from database
-        conn = get_db_connection()
-        cur = conn.cursor()
+        # Get user from database (only checked out on a cache miss)
+        async with async_engine.connection() as db:
+            user = await db.fetchrow(
+                'SELECT id, email, name, role, "avatarUrl" FROM "user" WHERE email = $1', email
+            )
         
-        try:
-            cur.execute('SELECT * FROM "user" WHERE email = %s', (email,))
-            user = cur.fetchone()
-            
-            if not user:
-                raise HTTPException(status_code=401, detail="User not found")
-            
-            return {
-                'id': user['id'],
-                'email': user['email'],
-                'name': user['name'],
-                'role': user['role'],
-                'avatarUrl': user['avatarUrl']
-            }
-        finally:
-            cur.close()
-            conn.close()
+        if not user:
+            raise HTTPException(status_code=401, detail="User not found")
+        
+        current_user = {
+            'id': user['id'],
+            'email': user['email'],
+            'name': user['name'],
+            'role': user['role'],
+            'avatarUrl': user['avatarUrl']
+        }
+        principal_cache.put(token, current_user, payload.get('exp'), generation)
+        return current_user
             
     except HTTPException:
         raise
@@ -238,57 +371,50 @@ async def get_current_user(request: Request):
         raise HTTPException(status_code=401, detail="Authentication failed")
 
 @app.get("/projects")
-async def get_projects(current_user: dict = Depends(get_current_user)):
+async def get_projects(current_user: dict = Depends(get_current_user), db=Depends(get_async_db)):
     """Get all projects for the current user"""
     user_id = current_user['id']
     
-    conn = get_db_connection()
-    cur = conn.cursor()
+    # Get all projects the user has access to
+    projects = await db.fetch("""
+        SELECT p.*, u.name as owner_name, u.email as owner_email,
+               COUNT(up2.user_id) as member_count, up.role as user_role,
+               (SELECT COALESCE(SUM(ps.issue_count), 0) FROM project_stats ps
+                WHERE ps.project_id = p.id) as issue_count
+        FROM project p
+        LEFT JOIN "user" u ON p.owner_id = u.id
+        LEFT JOIN user_project up2 ON p.id = up2.project_id
+        JOIN user_project up ON p.id = up.project_id
+        WHERE up.user_id = $1
+        GROUP BY p.id, u.name, u.email, up.role
+        ORDER BY p."created_at" DESC
+    """, user_id)
     
-    try:
-        # Get all projects the user has access to
-        cur.execute("""
-            SELECT p.*, u.name as owner_name, u.email as owner_email,
-                   COUNT(up2.user_id) as member_count, up.role as user_role
-            FROM project p
-            LEFT JOIN "user" u ON p.owner_id = u.id
-            LEFT JOIN user_project up2 ON p.id = up2.project_id
-            JOIN user_project up ON p.id = up.project_id
-            WHERE up.user_id = %s
-            GROUP BY p.id, u.name, u.email, up.role
-            ORDER BY p."created_at" DESC
-        """, (user_id,))
-        
-        projects = cur.fetchall()
-        
-        return {
-            "projects": [
-                {
-                    "id": p['id'],
-                    "name": p['name'],
-                    "url": p['url'],
-                    "description": p['description'],
-                    "category": p['category'],
-                    "createdAt": p['created_at'].isoformat() if p['created_at'] else None,
-                    "updated_at": p['updated_at'].isoformat() if p['updated_at'] else None,
-                    "ownerName": p['owner_name'],
-                    "ownerEmail": p['owner_email'],
-                    "memberCount": p['member_count'],
-                    "userRole": p['user_role']
-                }
-                for p in projects
-            ]
-        }
-    finally:
-        cur.close()
-        conn.close()
+    return {
+        "projects": [
+            {
+                "id": p['id'],
+                "name": p['name'],
+                "url": p['url'],
+                "description": p['description'],
+                "category": p['category'],
+                "createdAt": p['created_at'].isoformat() if p['created_at'] else None,
+                "updated_at": p['updated_at'].isoformat() if p['updated_at'] else None,
+                "ownerName": p['owner_name'],
+                "ownerEmail": p['owner_email'],
+                "memberCount": p['member_count'],
+                "issueCount": p['issue_count'],
+                "userRole": p['user_role']
+            }
+            for p in projects
+        ]
+    }
 
 # Get all projects (admin only)
 @app.get("/admin/projects")
-async def get_all_projects(current_user: dict = Depends(get_current_user)):
+def get_all_projects(current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Get all projects in the system (admin only)"""
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -300,7 +426,9 @@ async def get_all_projects(current_user: dict = Depends(get_current_user)):
         
         cur.execute("""
             SELECT p.*, u.name as owner_name, u.email as owner_email,
-                   COUNT(up.user_id) as member_count
+                   COUNT(up.user_id) as member_count,
+                   (SELECT COALESCE(SUM(ps.issue_count), 0) FROM project_stats ps
+                    WHERE ps.project_id = p.id) as issue_count
             FROM project p
             LEFT JOIN "user" u ON p.owner_id = u.id
             LEFT JOIN user_project up ON p.id = up.project_id
@@ -322,21 +450,20 @@ async def get_all_projects(current_user: dict = Depends(get_current_user)):
                     "updated_at": p['updated_at'].isoformat() if p['updated_at'] else None,
                     "ownerName": p['owner_name'],
                     "ownerEmail": p['owner_email'],
-                    "memberCount": p['member_count']
+                    "memberCount": p['member_count'],
+                    "issueCount": p['issue_count']
                 }
                 for p in projects
             ]
         }
     finally:
         cur.close()
-        conn.close()
 
 # Get admin's own projects (admin only)
 @app.get("/admin/my-projects")
-async def get_admin_my_projects(current_user: dict = Depends(get_current_user)):
+def get_admin_my_projects(current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Get projects where the current admin user is a member (admin only)"""
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -349,7 +476,9 @@ async def get_admin_my_projects(current_user: dict = Depends(get_current_user)):
         
         cur.execute("""
             SELECT p.*, u.name as owner_name, u.email as owner_email,
-                   COUNT(up2.user_id) as member_count, up.role as user_role
+                   COUNT(up2.user_id) as member_count, up.role as user_role,
+                   (SELECT COALESCE(SUM(ps.issue_count), 0) FROM project_stats ps
+                    WHERE ps.project_id = p.id) as issue_count
             FROM project p
             LEFT JOIN "user" u ON p.owner_id = u.id
             LEFT JOIN user_project up2 ON p.id = up2.project_id
@@ -374,6 +503,7 @@ async def get_admin_my_projects(current_user: dict = Depends(get_current_user)):
                     "ownerName": p['owner_name'],
                     "ownerEmail": p['owner_email'],
                     "memberCount": p['member_count'],
+                    "issueCount": p['issue_count'],
                     "userRole": p['user_role']
                 }
                 for p in projects
@@ -381,14 +511,28 @@ async def get_admin_my_projects(current_user: dict = Depends(get_current_user)):
         }
     finally:
         cur.close()
-        conn.close()
+
+# Database pool statistics (admin only)
+@app.get("/admin/db-pool")
+async def get_db_pool_stats(current_user: dict = Depends(get_current_user)):
+    """Get connection pool gauges and counters for capacity planning (admin only)"""
+    if current_user.get('role') != 'admin':
+        raise HTTPException(status_code=403, detail="Only admins can view pool statistics")
+
+    return {
+        "pool": db_pool.stats(),
+        "asyncPool": async_engine.stats(),
+        "principalCache": principal_cache.stats(),
+        "projectAcl": project_acl.stats(),
+        "realtime": board_events.stats(),
+        "encodedResponses": encoded_responses.stats()
+    }
 
 # Delete project (admin only)
 @app.delete("/projects/{project_id}")
-async def delete_project(project_id: int, current_user: dict = Depends(get_current_user)):
+def delete_project(project_id: int, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Delete a project and all associated data (admin only)"""
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -419,6 +563,7 @@ async def delete_project(project_id: int, current_user: dict = Depends(get_curre
         cur.execute('DELETE FROM project WHERE id = %s', (project_id,))
         
         conn.commit()
+        project_acl.invalidate(project_id)
         
         return {
             "message": f"Project '{project['name']}' deleted successfully",
@@ -433,252 +578,1624 @@ async def delete_project(project_id: int, current_user: dict = Depends(get_curre
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
+
+def build_issue(issue, assignee_users) -> Issue:
+    """Shape a board issue row plus its assignee rows into the Issue model"""
+    return Issue(
+        id=str(issue['id']),
+        title=issue['title'],
+        type=issue['type'] or "task",
+        status=issue['status'] or "backlog",
+        priority=issue['priority'] or "3",
+        listPosition=float(issue['listPosition']) if issue['listPosition'] else 0,
+        description=f"<p>{issue['description']}</p>" if issue['description'] else "",
+        descriptionText=issue['descriptionText'] or issue['description'] or "",
+        estimate=issue['estimate'],
+        timeSpent=issue['timeSpent'] or 0,
+        timeRemaining=issue['timeRemaining'],
+        reporterId=issue['reporterId'],
+        projectId=issue['projectId'],
+        createdAt=issue['created_at'],
+        updatedAt=issue['updated_at'],
+        userIds=[user['id'] for user in assignee_users],
+        users=[{
+            "id": user['id'],
+            "name": user['name'],
+            "email": user['email'],
+            "avatarUrl": user['avatarUrl']
+        } for user in assignee_users]
+    )
+
+def issue_event_fields(issue, user_ids) -> dict:
+    """Compact board-card view of an issue for push events (no description bodies)"""
+    return {
+        "id": str(issue['id']),
+        "title": issue['title'],
+        "type": issue['type'] or "task",
+        "status": issue['status'] or "backlog",
+        "priority": issue['priority'] or "3",
+        "listPosition": float(issue['listPosition']) if issue['listPosition'] else 0,
+        "userIds": list(user_ids),
+        "updatedAt": issue['updated_at'].isoformat() if issue['updated_at'] else None,
+    }
+
+async def fetch_assignees_by_issue(db, issue_ids: list, with_users: bool = True) -> dict:
+    """Load assignees for many issues in one round trip, keyed by issue id.
+
+    Without with_users only the ids are read (issue_user alone, no user join).
+    """
+    assignees = {issue_id: [] for issue_id in issue_ids}
+    if not issue_ids:
+        return assignees
+
+    if with_users:
+        rows = await db.fetch("""
+            SELECT iu.issue_id, u.id, u.name, u.email, u."avatarUrl"
+            FROM issue_user iu
+            JOIN "user" u ON u.id = iu.user_id
+            WHERE iu.issue_id = ANY($1::int[])
+            ORDER BY iu.issue_id, iu.id
+        """, issue_ids)
+    else:
+        rows = await db.fetch("""
+            SELECT iu.issue_id, iu.user_id AS id
+            FROM issue_user iu
+            WHERE iu.issue_id = ANY($1::int[])
+            ORDER BY iu.issue_id, iu.id
+        """, issue_ids)
+    for row in rows:
+        assignees[row['issue_id']].append(row)
+    return assignees
+
+async def build_issues(db, issues_data, fields: Optional[tuple] = None) -> list:
+    """Issue models for board rows, or dicts of just the requested fields.
+
+    Assignees for every issue come from issue_user at once, and only when needed.
+    """
+    if fields is None:
+        assignees = await fetch_assignees_by_issue(db, [issue['id'] for issue in issues_data])
+        return [build_issue(issue, assignees[issue['id']]) for issue in issues_data]
+    
+    assignees = {}
+    if needs_assignees(fields):
+        assignees = await fetch_assignees_by_issue(
+            db, [issue['id'] for issue in issues_data], with_users='users' in fields
+        )
+    return [project_issue(issue, assignees.get(issue['id'], []), fields) for issue in issues_data]
+
+BOARD_ISSUE_COLUMNS = """
+    i.id,
+    i.title,
+    i.type,
+    i.status,
+    i.priority,
+    i."listPosition",
+    i.description,
+    i."descriptionText",
+    i.estimate,
+    i."timeSpent",
+    i."timeRemaining",
+    i."reporterId",
+    i."projectId",
+    i."created_at",
+    i."updated_at"
+"""
+
+BOARD_COLUMN_PAGE_SIZE = 50
+BOARD_COLUMN_LIMIT_MAX = 500
+
+# Optional parts of GET /project/{id} besides its issues (?include=)
+PROJECT_INCLUDES = ('users',)
+
+def board_column_cursor(issue) -> str:
+    """Keyset cursor after the last card of a column page (board order: "listPosition", id)"""
+    position = issue['listPosition']
+    return encode_cursor([str(position) if position is not None else None, issue['id']])
+
+def board_column_after(params: SqlParams, after: list) -> str:
+    """WHERE condition for the cards following a board_column_cursor"""
+    try:
+        position = Decimal(after[0]) if after[0] is not None else None
+        last_id = int(after[1])
+    except (ArithmeticError, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # NULL positions sort last
+    if position is None:
+        return f'(i."listPosition" IS NULL AND i.id > {params.add(last_id)})'
+    return (
+        f'((i."listPosition", i.id) > ({params.add(position)}::numeric, {params.add(last_id)})'
+        f' OR i."listPosition" IS NULL)'
+    )
+
+async def fetch_board_column_heads(db, project_id: int, column_limit: int, issue_columns: str = BOARD_ISSUE_COLUMNS):
+    """First column_limit cards of every status plus each column's total, in one query.
+
+    Cards without a status sit in the backlog column, as build_issue shows them.
+    """
+    rows = await db.fetch(f"""
+        WITH columns AS (
+            SELECT COALESCE(NULLIF(status, ''), 'backlog') AS status, COUNT(*) AS total
+            FROM issue
+            WHERE "projectId" = $1
+            GROUP BY 1
+        )
+        SELECT c.status AS column_status, c.total, i.*
+        FROM columns c
+        CROSS JOIN LATERAL (
+            SELECT {issue_columns}
+            FROM issue i
+            WHERE i."projectId" = $1 AND COALESCE(NULLIF(i.status, ''), 'backlog') = c.status
+            ORDER BY i."listPosition", i.id
+            LIMIT $2
+        ) i
+        ORDER BY i."listPosition", i.id
+    """, project_id, column_limit)
+    
+    columns = {}
+    loaded = {}
+    for row in rows:
+        loaded[row['column_status']] = loaded.get(row['column_status'], 0) + 1
+        columns[row['column_status']] = (row['total'], row)
+    
+    return rows, {
+        status: BoardColumn(
+            total=total,
+            nextCursor=board_column_cursor(last) if total > loaded[status] else None
+        )
+        for status, (total, last) in columns.items()
+    }
+
+async def fetch_project_board(
+    db,
+    project_id: int,
+    column_limit: Optional[int] = None,
+    fields: Optional[tuple] = None,
+    include_users: bool = True
+):
+    """Load a project board with a fixed number of queries regardless of issue count.
+
+    With column_limit only the first cards of each status are loaded; the rest
+    come from GET /project/{id}/columns/{status}. With fields only those issue
+    fields are read and returned, as plain dicts instead of a ProjectResponse.
+    """
+    # Get project
+    project_data = await db.fetchrow("""
+        SELECT 
+            id,
+            name,
+            url,
+            description,
+            category,
+            "created_at",
+            "updated_at"
+        FROM project 
+        WHERE id = $1
+    """, project_id)
+    
+    if not project_data:
+        return None
+    
+    # Get issues for the project (board order and cursors need id and listPosition)
+    issue_columns = BOARD_ISSUE_COLUMNS if fields is None else select_list(fields, ('i.id', 'i."listPosition"'))
+    columns = None
+    if column_limit:
+        issues_data, columns = await fetch_board_column_heads(db, project_id, column_limit, issue_columns)
+    else:
+        issues_data = await db.fetch(f"""
+            SELECT {issue_columns}
+            FROM issue i
+            WHERE i."projectId" = $1
+            ORDER BY i."listPosition", i.id
+        """, project_id)
+    
+    # Get project members only
+    users_data = []
+    if include_users:
+        users_data = await db.fetch("""
+            SELECT u.id, u.name, u.email, u."avatarUrl"
+            FROM "user" u
+            JOIN user_project up ON u.id = up.user_id
+            WHERE up.project_id = $1
+            ORDER BY u.name
+        """, project_id)
+    
+    # Format issues
+    issues = await build_issues(db, issues_data, fields)
+    
+    # Format users
+    users = []
+    for user in users_data:
+        user_obj = User(
+            id=user['id'],
+            name=user['name'],
+            email=user['email'],
+            avatarUrl=user['avatarUrl']
+        )
+        users.append(user_obj)
+    
+    if fields is not None:
+        # Sparse issues do not fit the Issue model; same document shape, plain dicts
+        return {"project": {
+            "id": project_data['id'],
+            "name": project_data['name'],
+            "url": project_data['url'],
+            "description": project_data['description'],
+            "category": project_data['category'],
+            "createdAt": project_data['created_at'],
+            "updatedAt": project_data['updated_at'],
+            "issues": issues,
+            "users": users,
+            "columns": columns
+        }}
+    
+    # Create project response
+    project = Project(
+        id=project_data['id'],
+        name=project_data['name'],
+        url=project_data['url'],
+        description=project_data['description'],
+        category=project_data['category'],
+        createdAt=project_data['created_at'],
+        updatedAt=project_data['updated_at'],
+        issues=issues,
+        users=users,
+        columns=columns
+    )
+    
+    return ProjectResponse(project=project)
+
+# Board payload assembled by Postgres: mirrors build_issue / fetch_project_board field for
+# field (same keys, order, defaults and ISO timestamps) so the client sees the same document
+PROJECT_BOARD_JSON_SQL = """
+    SELECT json_build_object('project', json_build_object(
+        'id', p.id,
+        'name', p.name,
+        'url', p.url,
+        'description', p.description,
+        'category', p.category,
+        'createdAt', p."created_at",
+        'updatedAt', p."updated_at",
+        'issues', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', i.id::text,
+                'title', i.title,
+                'type', COALESCE(NULLIF(i.type, ''), 'task'),
+                'status', COALESCE(NULLIF(i.status, ''), 'backlog'),
+                'priority', COALESCE(NULLIF(i.priority, ''), '3'),
+                'listPosition', COALESCE(i."listPosition", 0)::float8,
+                'description', CASE WHEN COALESCE(i.description, '') <> ''
+                                    THEN '<p>' || i.description || '</p>' ELSE '' END,
+                'descriptionText', COALESCE(NULLIF(i."descriptionText", ''), NULLIF(i.description, ''), ''),
+                'estimate', i.estimate,
+                'timeSpent', COALESCE(i."timeSpent", 0),
+                'timeRemaining', i."timeRemaining",
+                'reporterId', i."reporterId",
+                'projectId', i."projectId",
+                'createdAt', i."created_at",
+                'updatedAt', i."updated_at",
+                'userIds', COALESCE(a.user_ids, '[]'::json),
+                'users', COALESCE(a.users, '[]'::json)
+            ) ORDER BY i."listPosition", i.id)
+            FROM issue i
+            LEFT JOIN LATERAL (
+                SELECT json_agg(u.id ORDER BY iu.id) AS user_ids,
+                       json_agg(json_build_object(
+                           'id', u.id, 'name', u.name, 'email', u.email,
+                           'avatarUrl', u."avatarUrl", 'role', NULL
+                       ) ORDER BY iu.id) AS users
+                FROM issue_user iu
+                JOIN "user" u ON u.id = iu.user_id
+                WHERE iu.issue_id = i.id
+            ) a ON true
+            WHERE i."projectId" = p.id
+        ), '[]'::json),
+        'users', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', u.id, 'name', u.name, 'email', u.email,
+                'avatarUrl', u."avatarUrl", 'role', NULL
+            ) ORDER BY u.name)
+            FROM "user" u
+            JOIN user_project up ON u.id = up.user_id
+            WHERE up.project_id = p.id
+        ), '[]'::json),
+        'columns', NULL
+    ))::text
+    FROM project p
+    WHERE p.id = $1
+"""
+
+# Serve GET /project/{project_id} from PROJECT_BOARD_JSON_SQL instead of Pydantic models
+BOARD_JSON_IN_DATABASE = os.getenv('BOARD_JSON_IN_DATABASE', 'false').lower() == 'true'
+
+async def fetch_project_board_json(db, project_id: int) -> Optional[bytes]:
+    """Load the board as a ready-to-send JSON document built by Postgres.
+
+    Parses to the same document as fetch_project_board; only insignificant
+    whitespace and float formatting (0 vs 0.0) differ on the wire.
+    """
+    document = await db.fetchval(PROJECT_BOARD_JSON_SQL, project_id)
+    return document.encode() if document is not None else None
+
+async def fetch_project_version(db, project_id: int) -> Optional[int]:
+    """Current project.version, bumped by triggers on every write to the project's data.
+
+    Read it before the data it tags: a write landing in between then only
+    costs the client one extra download, never a stale 304.
+    """
+    return await db.fetchval('SELECT version FROM project WHERE id = $1', project_id)
 
 @app.get("/project/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: int, current_user: dict = Depends(get_current_user)):
-    """Get a specific project with all its issues and users"""
+async def get_project(
+    project_id: int,
+    request: Request,
+    columnLimit: Optional[int] = None,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_async_db)
+):
+    """Get a specific project with its issues and users.
+
+    Pass columnLimit to load only the first cards of each status; the board's
+    `columns` then holds every status' total and the cursor for its next page.
+    fields=id,title,... returns only those issue fields (fields=board for the
+    card view), and include= lists the extras to load (users; default all).
+    """
     user_id = current_user['id']
-    
-    conn = get_db_connection()
-    cur = conn.cursor()
+    column_limit = clamp_limit(columnLimit, BOARD_COLUMN_LIMIT_MAX) if columnLimit else None
+    issue_fields = BOARD_FIELDS if fields == 'board' else parse_fields(fields)
+    include_users = include is None or 'users' in parse_fields(include, PROJECT_INCLUDES)
+    sparse = issue_fields is not None or not include_users
     
     try:
         # Check if user has access to this project
-        cur.execute("""
-            SELECT role FROM user_project 
-            WHERE user_id = %s AND project_id = %s
-        """, (user_id, project_id))
-        access = cur.fetchone()
-        
-        if not access:
+        if not await project_acl.arole(db, project_id, user_id):
             raise HTTPException(status_code=403, detail="Access denied to this project")
         
-        # Get project
-        cur.execute("""
-            SELECT 
-                id,
-                name,
-                url,
-                description,
-                category,
-                "created_at",
-                "updated_at"
-            FROM project 
-            WHERE id = %s
-        """, (project_id,))
-        project_data = cur.fetchone()
+        version = await fetch_project_version(db, project_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="No project found")
         
-        if not project_data:
+        # The two board builders differ in insignificant bytes, so each gets its own tag
+        use_database_json = BOARD_JSON_IN_DATABASE and not column_limit and not sparse
+        etag_parts = [
+            "project", project_id, version,
+            f"columns{column_limit}" if column_limit else "db" if use_database_json else "model"
+        ]
+        if sparse:
+            etag_parts += [projection_tag(issue_fields), "users" if include_users else "nousers"]
+        etag = make_etag(*etag_parts)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        if use_database_json:
+            # Fast path: stream Postgres' bytes back without building models
+            document = await fetch_project_board_json(db, project_id)
+            if document is None:
+                raise HTTPException(status_code=404, detail="No project found")
+            return Response(content=document, media_type="application/json", headers=cache_headers(etag))
+        
+        board = await fetch_project_board(db, project_id, column_limit, issue_fields, include_users)
+        
+        if not board:
             raise HTTPException(status_code=404, detail="No project found")
         
-        # Get issues for the project
-        cur.execute("""
+        return FastJSONResponse(board, headers=cache_headers(etag))
+        
+    except asyncpg.PostgresError as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+@app.get("/project/{project_id}/columns/{status}")
+async def get_board_column(
+    project_id: int,
+    status: str,
+    cursor: Optional[str] = None,
+    limit: int = BOARD_COLUMN_PAGE_SIZE,
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_async_db)
+):
+    """Next cards of one board column ("load more" for a board fetched with columnLimit)"""
+    if not await project_acl.arole(db, project_id, current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied to this project")
+    
+    issue_fields = BOARD_FIELDS if fields == 'board' else parse_fields(fields)
+    limit = clamp_limit(limit, BOARD_COLUMN_LIMIT_MAX)
+    params = SqlParams(project_id, status)
+    # Same column grouping as fetch_board_column_heads, so totals and cursors agree
+    conditions = ['i."projectId" = $1', "COALESCE(NULLIF(i.status, ''), 'backlog') = $2"]
+    after = decode_cursor(cursor, 2)
+    if after:
+        conditions.append(board_column_after(params, after))
+    
+    issue_columns = BOARD_ISSUE_COLUMNS if issue_fields is None else select_list(issue_fields, ('i.id', 'i."listPosition"'))
+    rows = await db.fetch(f"""
+        SELECT {issue_columns}
+        FROM issue i
+        WHERE {' AND '.join(conditions)}
+        ORDER BY i."listPosition", i.id
+        LIMIT {params.add(limit + 1)}
+    """, *params.values)
+    
+    page = rows[:limit]
+    
+    return FastJSONResponse({
+        "issues": await build_issues(db, page, issue_fields),
+        "nextCursor": board_column_cursor(page[-1]) if len(rows) > limit else None
+    })
+
+def stats_totals(row) -> dict:
+    return {
+        "issueCount": row['issue_count'],
+        "estimate": row['estimate'],
+        "timeSpent": row['time_spent'],
+        "timeRemaining": row['time_remaining']
+    }
+
+@app.get("/project/{project_id}/stats")
+async def get_project_stats(
+    project_id: int,
+    request: Request,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_async_db)
+):
+    """Issue counts and estimate / time totals per status, read from project_stats.
+
+    Triggers on issue keep that table current, so this reads a handful of
+    primary key rows however large the project is.
+    """
+    if not await project_acl.arole(db, project_id, current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied to this project")
+    
+    version = await fetch_project_version(db, project_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="No project found")
+    etag = make_etag("stats", project_id, version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    rows = await db.fetch("""
+        SELECT status, issue_count, estimate, time_spent, time_remaining
+        FROM project_stats
+        WHERE project_id = $1 AND issue_count > 0
+        ORDER BY status
+    """, project_id)
+    
+    totals = {
+        column: sum(row[column] for row in rows)
+        for column in ('issue_count', 'estimate', 'time_spent', 'time_remaining')
+    }
+    return FastJSONResponse({
+        "stats": {
+            **stats_totals(totals),
+            "byStatus": {row['status']: stats_totals(row) for row in rows}
+        }
+    }, headers=cache_headers(etag))
+
+HISTORY_PAGE_SIZE = 50
+HISTORY_PAGE_SIZE_MAX = 200
+
+def fetch_history_page(cur, scope_column: str, scope_id: int, field: Optional[str],
+                       limit: int, cursor: Optional[str]):
+    """One keyset page of issue_event rows for an issue or a project, newest first; returns (events, next cursor)"""
+    conditions = [f'e.{scope_column} = %s']
+    values = [scope_id]
+    event_fields = split_filter(field)
+    if event_fields:
+        unknown = [name for name in event_fields if name not in EVENT_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(EVENT_FIELDS)}"
+            )
+        conditions.append('e.field = ANY(%s)')
+        values.append(event_fields)
+    after = decode_cursor(cursor, 2)
+    if after:
+        try:
+            created_at, last_id = datetime.fromisoformat(after[0]), int(after[1])
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        conditions.append('(e.created_at, e.id) < (%s, %s)')
+        values += [created_at, last_id]
+    
+    cur.execute(f"""
+        SELECT e.id, e.issue_id, e.project_id, e.field, e.old_value, e.new_value, e.created_at,
+               e.actor_id, u.name as actor_name, u."avatarUrl" as actor_avatar_url
+        FROM issue_event e
+        LEFT JOIN "user" u ON u.id = e.actor_id
+        WHERE {' AND '.join(conditions)}
+        ORDER BY e.created_at DESC, e.id DESC
+        LIMIT %s
+    """, (*values, limit + 1))
+    rows = cur.fetchall()
+    
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor([page[-1]['created_at'].isoformat(), page[-1]['id']])
+    return [serialize_event(event) for event in page], next_cursor
+
+@app.get("/project/{project_id}/history")
+def get_project_history(
+    project_id: int,
+    field: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = HISTORY_PAGE_SIZE,
+    current_user: dict = Depends(get_current_user),
+    conn=Depends(get_db)
+):
+    """Field-level changes to a project's issues, newest first (field=status,assignees filters)"""
+    if not project_acl.role(conn, project_id, current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied to this project")
+    
+    cur = conn.cursor()
+    
+    try:
+        events, next_cursor = fetch_history_page(
+            cur, 'project_id', project_id, field, clamp_limit(limit, HISTORY_PAGE_SIZE_MAX), cursor
+        )
+        return FastJSONResponse({"events": events, "nextCursor": next_cursor})
+    finally:
+        cur.close()
+
+ISSUES_PAGE_SIZE = 50
+ISSUES_PAGE_SIZE_MAX = 100
+
+# GET /issues result fields when ?fields= is not given
+ISSUE_LIST_FIELDS = ('id', 'title', 'type', 'status', 'priority', 'listPosition', 'projectId', 'createdAt', 'updatedAt')
+
+def split_filter(value: Optional[str]) -> Optional[list]:
+    """Turn a comma separated query filter into a list of values"""
+    if not value:
+        return None
+    values = [v.strip() for v in value.split(',') if v.strip()]
+    return values or None
+
+def like_pattern(term: str) -> str:
+    """Escape LIKE wildcards in user input and wrap it for a substring match"""
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+@app.get("/project/{project_id}/events")
+async def stream_project_events(
+    project_id: int,
+    token: str = Depends(get_stream_token),
+    current_user: dict = Depends(get_stream_user)
+):
+    """Server-sent events for a project board: issue and comment changes as they commit"""
+    # Borrow a connection for the access check only; the stream itself holds none
+    async with async_engine.connection() as db:
+        if not await project_acl.arole(db, project_id, current_user['id']):
+            raise HTTPException(status_code=403, detail="Access denied to this project")
+
+    async def still_authorized() -> bool:
+        # Run when the project's members or this user change on any worker
+        try:
+            user = await authenticate_token(token)
+        except HTTPException:
+            return False
+        async with async_engine.connection() as db:
+            return bool(await project_acl.arole(db, project_id, user['id']))
+
+    # authenticate_token verified the token; a lapse since then ends the stream at once
+    expires_at = jwt.decode(
+        token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False}
+    ).get('exp')
+    
+    return StreamingResponse(
+        board_events.stream(project_id, current_user['id'], still_authorized, expires_at),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx: flush events instead of buffering them
+        }
+    )
+
+@app.get("/project/{project_id}/export")
+async def export_project(
+    project_id: int,
+    format: str = 'ndjson',
+    entity: str = 'issues',
+    current_user: dict = Depends(get_current_user)
+):
+    """Stream every issue of a project as NDJSON or CSV (see project_export.py)"""
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    if entity not in EXPORT_CSV_ENTITIES:
+        raise HTTPException(status_code=400, detail=f"entity must be one of: {', '.join(EXPORT_CSV_ENTITIES)}")
+    if format == 'ndjson' and entity != 'issues':
+        raise HTTPException(status_code=400, detail="entity=comments is only available for CSV exports")
+
+    # This connection serves the access check only; iter_export borrows a db_pool
+    # connection of its own while it streams
+    async with async_engine.connection() as db:
+        if not await project_acl.arole(db, project_id, current_user['id']):
+            raise HTTPException(status_code=403, detail="Access denied to this project")
+
+    return StreamingResponse(
+        iter_export(db_pool, project_id, format, entity),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="project-{project_id}-{entity}.{format}"',
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+# Rows are stamped with their transaction's start time but only become visible at
+# commit, so a cursor must not pass the start of any transaction still in flight:
+# the horizon is the oldest open transaction's start (or now, when there is none).
+# Read it before the snapshot is taken; anything in flight then has a later start.
+# Needs the app's role to see its own sessions in pg_stat_activity (it always does).
+SYNC_HORIZON_SQL = """
+    SELECT LEAST(LOCALTIMESTAMP, MIN(xact_start)::timestamp)
+    FROM pg_stat_activity
+    WHERE datname = current_database()
+      AND pid <> pg_backend_pid()
+      AND xact_start IS NOT NULL
+"""
+
+# Deletions are only recorded this long; older cursors get a resync (0 keeps every tombstone)
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv('SYNC_TOMBSTONE_RETENTION_DAYS', '30'))
+
+def sync_resync_response(horizon) -> dict:
+    return {
+        "cursor": encode_cursor([horizon.isoformat()]),
+        "resync": True,
+        "issues": [],
+        "deletedIssueIds": [],
+        "users": [],
+        "removedUserIds": []
+    }
+
+@app.get("/project/{project_id}/changes")
+async def get_project_changes(
+    project_id: int,
+    since: Optional[str] = None,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_async_db)
+):
+    """Issues, assignments and members changed or deleted since a sync cursor.
+
+    Without `since`, or with one older than the tombstone retention window,
+    only a fresh cursor is returned and `resync` is true: load the full board,
+    then poll with the cursor. Changed issues come back in board shape;
+    applying the same change twice is harmless.
+    """
+    if not await project_acl.arole(db, project_id, current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied to this project")
+    
+    since_values = decode_cursor(since, 1)
+    if since_values:
+        try:
+            changed_since = datetime.fromisoformat(since_values[0])
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    # Commit-safe cursor: every row stamped before it is visible to the snapshot below
+    horizon = await db.fetchval(SYNC_HORIZON_SQL)
+    if not since_values:
+        return sync_resync_response(horizon)
+    # Deletions before the retention window may already be pruned
+    if SYNC_TOMBSTONE_RETENTION_DAYS > 0 and await db.fetchval(
+        "SELECT $1::timestamp < LOCALTIMESTAMP - make_interval(days => $2)",
+        changed_since, SYNC_TOMBSTONE_RETENTION_DAYS
+    ):
+        return sync_resync_response(horizon)
+    
+    # One snapshot for every query
+    async with db.transaction(isolation='repeatable_read', readonly=True):
+        issues_data = await db.fetch("""
             SELECT 
-                i.id,
-                i.title,
-                i.type,
-                i.status,
-                i.priority,
-                i."listPosition",
-                i.description,
-                i."descriptionText",
-                i.estimate,
-                i."timeSpent",
-                i."timeRemaining",
-                i."reporterId",
-                i."projectId",
-                i."created_at",
-                i."updated_at",
-                u.name as reporter_name,
-                u.email as reporter_email,
-                u."avatarUrl" as reporter_avatar
+                i.id, i.title, i.type, i.status, i.priority, i."listPosition",
+                i.description, i."descriptionText", i.estimate, i."timeSpent",
+                i."timeRemaining", i."reporterId", i."projectId", i."created_at", i."updated_at"
             FROM issue i
-            LEFT JOIN "user" u ON i."reporterId" = u.id
-            WHERE i."projectId" = %s
+            WHERE i."projectId" = $1 AND i."updated_at" >= $2
             ORDER BY i."listPosition", i.id
-        """, (project_data['id'],))
-        issues_data = cur.fetchall()
+        """, project_id, changed_since)
+        assignees = await fetch_assignees_by_issue(db, [issue['id'] for issue in issues_data])
         
-        # Get project members only
-        cur.execute("""
+        users_data = await db.fetch("""
             SELECT u.id, u.name, u.email, u."avatarUrl"
-            FROM "user" u
-            JOIN user_project up ON u.id = up.user_id
-            WHERE up.project_id = %s
+            FROM user_project up
+            JOIN "user" u ON u.id = up.user_id
+            WHERE up.project_id = $1 AND up.updated_at >= $2
             ORDER BY u.name
-        """, (project_id,))
-        users_data = cur.fetchall()
+        """, project_id, changed_since)
+        
+        tombstones = await db.fetch("""
+            SELECT DISTINCT entity, entity_id
+            FROM sync_tombstone
+            WHERE project_id = $1 AND deleted_at >= $2
+        """, project_id, changed_since)
+    
+    # A member removed and re-added within the window is still a member
+    current_user_ids = {user['id'] for user in users_data}
+    
+    return FastJSONResponse({
+        "cursor": encode_cursor([horizon.isoformat()]),
+        "resync": False,
+        "issues": [build_issue(issue, assignees[issue['id']]) for issue in issues_data],
+        "deletedIssueIds": [str(t['entity_id']) for t in tombstones if t['entity'] == 'issue'],
+        "users": [
+            {
+                "id": user['id'],
+                "name": user['name'],
+                "email": user['email'],
+                "avatarUrl": user['avatarUrl']
+            }
+            for user in users_data
+        ],
+        "removedUserIds": [
+            t['entity_id'] for t in tombstones
+            if t['entity'] == 'member' and t['entity_id'] not in current_user_ids
+        ]
+    })
+
+@app.get("/issues")
+async def get_issues(
+    searchTerm: Optional[str] = None,
+    projectId: Optional[int] = None,
+    status: Optional[str] = None,
+    assignee: Optional[int] = None,
+    issue_type: Optional[str] = Query(None, alias="type"),
+    priority: Optional[str] = None,
+    limit: int = ISSUES_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_async_db)
+):
+    """Search issues in the caller's projects, one keyset page at a time"""
+    issue_fields = parse_fields(fields) or ISSUE_LIST_FIELDS
+    limit = clamp_limit(limit, ISSUES_PAGE_SIZE_MAX)
+    after = decode_cursor(cursor, 2)
+    params = SqlParams()
+    
+    # Scope to the caller's projects
+    if projectId is not None:
+        if not await project_acl.arole(db, projectId, current_user['id']):
+            raise HTTPException(status_code=403, detail="Access denied to this project")
+        conditions = [f'i."projectId" = {params.add(projectId)}']
+    else:
+        conditions = [f'i."projectId" IN (SELECT project_id FROM user_project WHERE user_id = {params.add(current_user["id"])})']
+    
+    if searchTerm and searchTerm.strip():
+        # Both branches are index-backed: GIN on search_vector, trigram GIN on title
+        query = params.add(searchTerm.strip())
+        pattern = params.add(like_pattern(searchTerm.strip()))
+        conditions.append(
+            f"(i.search_vector @@ websearch_to_tsquery('english', {query}) OR i.title ILIKE {pattern})"
+        )
+    if split_filter(status):
+        conditions.append(f'i.status = ANY({params.add(split_filter(status))}::text[])')
+    if split_filter(issue_type):
+        conditions.append(f'i.type = ANY({params.add(split_filter(issue_type))}::text[])')
+    if split_filter(priority):
+        conditions.append(f'i.priority = ANY({params.add(split_filter(priority))}::text[])')
+    if assignee is not None:
+        conditions.append(f'EXISTS (SELECT 1 FROM issue_user iu WHERE iu.issue_id = i.id AND iu.user_id = {params.add(assignee)})')
+    if after:
+        try:
+            position, last_id = Decimal(after[0]), int(after[1])
+        except (ArithmeticError, ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        conditions.append(
+            f'(COALESCE(i."listPosition", 0), i.id) > ({params.add(position)}::numeric, {params.add(last_id)})'
+        )
+    
+    rows = await db.fetch(f"""
+        SELECT {select_list(issue_fields, ('i.id', 'i."listPosition"'))}
+        FROM issue i
+        WHERE {' AND '.join(conditions)}
+        ORDER BY COALESCE(i."listPosition", 0), i.id
+        LIMIT {params.add(limit + 1)}
+    """, *params.values)
+    
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = page[-1]
+        next_cursor = encode_cursor([str(last['listPosition'] or 0), last['id']])
+    
+    return FastJSONResponse({
+        "issues": await build_issues(db, page, issue_fields),
+        "nextCursor": next_cursor
+    })
+
+SEARCH_RESULTS_MAX = 50
+
+@app.get("/issues/search")
+async def search_issues(
+    q: str,
+    projectId: Optional[int] = None,
+    limit: int = 20,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_async_db)
+):
+    """Ranked full-text issue search with highlighted title and description snippets"""
+    term = q.strip()
+    if not term:
+        raise HTTPException(status_code=400, detail="Search query is required")
+    limit = clamp_limit(limit, SEARCH_RESULTS_MAX)
+    params = SqlParams(term)
+    
+    if projectId is not None:
+        if not await project_acl.arole(db, projectId, current_user['id']):
+            raise HTTPException(status_code=403, detail="Access denied to this project")
+        scope = f'i."projectId" = {params.add(projectId)}'
+    else:
+        scope = f'i."projectId" IN (SELECT project_id FROM user_project WHERE user_id = {params.add(current_user["id"])})'
+    
+    # Rank on the indexed candidates first, then build headlines for the final page only.
+    # Text is HTML-escaped before ts_headline so the <mark> snippets are safe to render.
+    rows = await db.fetch(f"""
+        WITH query AS (
+            SELECT websearch_to_tsquery('english', $1) AS tsq
+        ), ranked AS (
+            SELECT i.id, i.title, i.type, i.status, i.priority, i."projectId",
+                   COALESCE(NULLIF(i."descriptionText", ''), i.description, '') AS body,
+                   ts_rank_cd(i.search_vector, query.tsq) + similarity(i.title, $1) AS rank
+            FROM issue i, query
+            WHERE {scope}
+              AND (i.search_vector @@ query.tsq OR i.title % $1)
+            ORDER BY rank DESC, i.id DESC
+            LIMIT {params.add(limit)}
+        )
+        SELECT r.id, r.title, r.type, r.status, r.priority, r."projectId", r.rank,
+               ts_headline('english',
+                   replace(replace(replace(r.title, '&', '&amp;'), '<', '&lt;'), '>', '&gt;'),
+                   query.tsq, 'StartSel=<mark>, StopSel=</mark>, HighlightAll=true') AS title_highlight,
+               ts_headline('english',
+                   replace(replace(replace(r.body, '&', '&amp;'), '<', '&lt;'), '>', '&gt;'),
+                   query.tsq, 'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=25, MinWords=8') AS snippet
+        FROM ranked r, query
+        ORDER BY r.rank DESC, r.id DESC
+    """, *params.values)
+    
+    return FastJSONResponse({
+        "issues": [
+            {
+                "id": str(row['id']),
+                "title": row['title'],
+                "type": row['type'] or "task",
+                "status": row['status'] or "backlog",
+                "priority": row['priority'] or "3",
+                "projectId": row['projectId'],
+                "rank": float(row['rank']),
+                "titleHighlight": row['title_highlight'],
+                "snippet": row['snippet']
+            }
+            for row in rows
+        ]
+    })
+
+# Duplicate endpoint removed - using the admin-only version below
+
+# Duplicate function removed - moved above
+
+@app.get("/currentUser", response_model=CurrentUserResponse)
+async def get_current_user_endpoint(current_user: dict = Depends(get_current_user)):
+    """Get the current authenticated user"""
+    user = User(
+        id=current_user['id'],
+        name=current_user['name'],
+        email=current_user['email'],
+        avatarUrl=current_user['avatarUrl'],
+        role=current_user['role']
+    )
+    
+    return CurrentUserResponse(currentUser=user)
+
+
+COMMENTS_PAGE_SIZE = 20
+COMMENTS_PAGE_SIZE_MAX = 100
+COMMENT_ORDERS = {'desc': 'DESC', 'asc': 'ASC'}
+
+def serialize_comment(comment) -> dict:
+    return {
+        "id": str(comment['id']),
+        "body": comment['body'],
+        "createdAt": comment['created_at'],
+        "updatedAt": comment['updated_at'],
+        "user": {
+            "id": comment['user_id'],
+            "name": comment['name'],
+            "email": comment['email'],
+            "avatarUrl": comment['avatarUrl']
+        }
+    }
+
+def fetch_comment_page(cur, issue_id: int, order: str = 'desc', limit: int = COMMENTS_PAGE_SIZE,
+                       cursor: Optional[str] = None):
+    """One keyset page of an issue's comments, newest or oldest first; returns (comments, next cursor)"""
+    direction = COMMENT_ORDERS.get(order)
+    if direction is None:
+        raise HTTPException(status_code=400, detail="order must be asc or desc")
+    
+    conditions = ['c."issueId" = %s']
+    values = [issue_id]
+    after = decode_cursor(cursor, 2)
+    if after:
+        try:
+            created_at, last_id = datetime.fromisoformat(after[0]), int(after[1])
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        conditions.append(f'(c."created_at", c.id) {"<" if direction == "DESC" else ">"} (%s, %s)')
+        values += [created_at, last_id]
+    
+    cur.execute(f"""
+        SELECT c.id, c.body, c."created_at", c."updated_at",
+               u.id as user_id, u.name, u.email, u."avatarUrl"
+        FROM comment c
+        JOIN "user" u ON c."userId" = u.id
+        WHERE {' AND '.join(conditions)}
+        ORDER BY c."created_at" {direction}, c.id {direction}
+        LIMIT %s
+    """, (*values, limit + 1))
+    rows = cur.fetchall()
+    
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor([page[-1]['created_at'].isoformat(), page[-1]['id']])
+    return [serialize_comment(comment) for comment in page], next_cursor
+
+# "issue-<issue id>-<project id>-<project version>[-<projection>]"
+ISSUE_ETAG_PATTERN = re.compile(r'^"issue-(\d+)-(\d+)-(\d+)(-\w+)?"$')
+
+# GET /issues/{id} fields: every issue field plus its comments
+ISSUE_DETAIL_FIELDS = (*ISSUE_FIELDS, 'comments')
+
+@app.get("/issues/{issue_id}")
+def get_issue(issue_id: int, request: Request, fields: Optional[str] = None, conn=Depends(get_db)):
+    """Get a single issue by ID (?fields= limits it to some issue fields and/or comments).
+
+    Comments are the newest page only, with commentsNextCursor for
+    GET /issues/{id}/comments; commentCount holds the total.
+    """
+    issue_fields = parse_fields(fields, ISSUE_DETAIL_FIELDS)
+    projection = f"-{projection_tag(issue_fields)}" if issue_fields is not None else ""
+    issue_fields = issue_fields if issue_fields is not None else ISSUE_DETAIL_FIELDS
+    cur = conn.cursor()
+    
+    try:
+        # The client's tag names the project the issue belonged to. Any write to the
+        # issue, its comments or assignees (or a move out of that project) bumps that
+        # project's version, so an unchanged version means an unchanged issue.
+        for tag in request_etags(request):
+            match = ISSUE_ETAG_PATTERN.match(tag)
+            if not match or int(match.group(1)) != issue_id or (match.group(4) or "") != projection:
+                continue
+            cur.execute('SELECT version FROM project WHERE id = %s', (int(match.group(2)),))
+            project_row = cur.fetchone()
+            if project_row and project_row['version'] == int(match.group(3)):
+                return not_modified(tag)
+        
+        cur.execute(f"""
+            SELECT {select_list(issue_fields, ('i.id', 'i."projectId"'))},
+                   p.version as project_version
+            FROM issue i
+            LEFT JOIN project p ON p.id = i."projectId"
+            WHERE i.id = %s
+        """, (issue_id,))
+        issue_data = cur.fetchone()
+        
+        if not issue_data:
+            return JSONResponse(
+                status_code=404,
+                content={
+                    "error": {
+                        "code": "ISSUE_NOT_FOUND",
+                        "message": f"Issue {issue_id} not found",
+                        "status": 404,
+                        "data": {}
+                    }
+                }
+            )
         
-        # Format issues
-        issues = []
-        for issue in issues_data:
-            # Get assignees for this issue from issue_user table
+        # Get assignees for this issue from issue_user table
+        assignee_users = []
+        if needs_assignees(issue_fields):
             cur.execute("""
                 SELECT u.id, u.name, u.email, u."avatarUrl"
                 FROM "user" u
                 JOIN issue_user iu ON u.id = iu.user_id
                 WHERE iu.issue_id = %s
-            """, (issue['id'],))
+            """, (issue_id,))
             assignee_users = cur.fetchall()
-            
-            issue_obj = Issue(
-                id=str(issue['id']),
-                title=issue['title'],
-                type=issue['type'] or "task",
-                status=issue['status'] or "backlog",
-                priority=issue['priority'] or "3",
-                listPosition=float(issue['listPosition']) if issue['listPosition'] else 0,
-                description=f"<p>{issue['description']}</p>" if issue['description'] else "",
-                descriptionText=issue['descriptionText'] or issue['description'] or "",
-                estimate=issue['estimate'],
-                timeSpent=issue['timeSpent'] or 0,
-                timeRemaining=issue['timeRemaining'],
-                reporterId=issue['reporterId'],
-                projectId=issue['projectId'],
-                createdAt=issue['created_at'].isoformat() if issue['created_at'] else None,
-                updatedAt=issue['updated_at'].isoformat() if issue['updated_at'] else None,
-                userIds=[user['id'] for user in assignee_users],
-                users=[{
-                    "id": user['id'],
-                    "name": user['name'],
-                    "email": user['email'],
-                    "avatarUrl": user['avatarUrl']
-                } for user in assignee_users]
-            )
-            issues.append(issue_obj)
-        
-        # Format users
-        users = []
-        for user in users_data:
-            user_obj = User(
-                id=user['id'],
-                name=user['name'],
-                email=user['email'],
-                avatarUrl=user['avatarUrl']
-            )
-            users.append(user_obj)
-        
-        # Create project response
-        project = Project(
-            id=project_data['id'],
-            name=project_data['name'],
-            url=project_data['url'],
-            description=project_data['description'],
-            category=project_data['category'],
-            createdAt=project_data['created_at'].isoformat() if project_data['created_at'] else None,
-            updatedAt=project_data['updated_at'].isoformat() if project_data['updated_at'] else None,
-            issues=issues,
-            users=users
-        )
         
-        return ProjectResponse(project=project)
+        issue = project_issue(issue_data, assignee_users, issue_fields)
         
-    except psycopg2.Error as e:
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+        # First page of comments for this issue
+        if 'comments' in issue_fields:
+            issue['comments'], issue['commentsNextCursor'] = fetch_comment_page(cur, issue_id)
+        
+        headers = None
+        if issue_data['project_version'] is not None:
+            headers = cache_headers(make_etag(
+                "issue", issue_id, issue_data['projectId'], f"{issue_data['project_version']}{projection}"
+            ))
+        
+        return FastJSONResponse({"issue": issue}, headers=headers)
     finally:
         cur.close()
-        conn.close()
 
-@app.get("/issues")
-def get_issues():
-    """Get all issues"""
-    conn = get_db_connection()
+BATCH_FETCH_MAX = 200
+
+# The newest comment page of many issues at once: one index range scan per issue
+# on (issueId, created_at, id), one extra row each to tell whether more exist
+COMMENT_HEADS_SQL = """
+    SELECT c.issue_id, c.id, c.body, c."created_at", c."updated_at",
+           u.id as user_id, u.name, u.email, u."avatarUrl"
+    FROM unnest($1::int[]) AS ids(issue_id)
+    CROSS JOIN LATERAL (
+        SELECT ids.issue_id, c.id, c.body, c."created_at", c."updated_at", c."userId"
+        FROM comment c
+        WHERE c."issueId" = ids.issue_id
+        ORDER BY c."created_at" DESC, c.id DESC
+        LIMIT $2
+    ) c
+    JOIN "user" u ON u.id = c."userId"
+    ORDER BY c.issue_id, c."created_at" DESC, c.id DESC
+"""
+
+async def fetch_comment_heads(db, issue_ids: list, limit: int = COMMENTS_PAGE_SIZE) -> dict:
+    """First comment page (newest first) of every issue, keyed by issue id: (comments, next cursor)"""
+    rows_by_issue = {issue_id: [] for issue_id in issue_ids}
+    for row in await db.fetch(COMMENT_HEADS_SQL, issue_ids, limit + 1):
+        rows_by_issue[row['issue_id']].append(row)
+    
+    heads = {}
+    for issue_id, rows in rows_by_issue.items():
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor([page[-1]['created_at'].isoformat(), page[-1]['id']])
+        heads[issue_id] = ([serialize_comment(comment) for comment in page], next_cursor)
+    return heads
+
+@app.post("/issues/batch")
+async def get_issues_batch(
+    batch_data: dict,
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_async_db)
+):
+    """Many issues by id in a fixed number of queries (search results, linked previews).
+
+    Body: {"ids": [12, 15, ...], "fields": "title,status,comments"}. fields takes
+    the GET /issues/{id} field names and defaults to every issue field without
+    comments; "comments" adds each issue's newest comment page. Issues are
+    returned in request order; ids that do not exist or belong to projects the
+    caller cannot see are listed in missingIds.
+    """
+    try:
+        issue_ids = list(dict.fromkeys(int(issue_id) for issue_id in batch_data.get('ids') or []))
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="ids must be a list of numeric issue ids")
+    if not issue_ids:
+        raise HTTPException(status_code=400, detail="ids must be a non-empty list")
+    if len(issue_ids) > BATCH_FETCH_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_FETCH_MAX} issues can be fetched at once")
+    issue_fields = parse_fields(batch_data.get('fields'), ISSUE_DETAIL_FIELDS) or tuple(ISSUE_FIELDS)
+    
+    rows = await db.fetch(f"""
+        SELECT {select_list(issue_fields, ('i.id', 'i."projectId"'))}
+        FROM issue i
+        WHERE i.id = ANY($1::int[])
+    """, issue_ids)
+    
+    # One membership check per project, however many of its issues were asked for
+    visible_projects = set()
+    for project_id in {row['projectId'] for row in rows}:
+        if project_id is not None and await project_acl.arole(db, project_id, current_user['id']):
+            visible_projects.add(project_id)
+    rows_by_id = {row['id']: row for row in rows if row['projectId'] in visible_projects}
+    found_ids = [issue_id for issue_id in issue_ids if issue_id in rows_by_id]
+    
+    assignees = {}
+    if needs_assignees(issue_fields):
+        assignees = await fetch_assignees_by_issue(db, found_ids, with_users='users' in issue_fields)
+    comment_heads = {}
+    if 'comments' in issue_fields and found_ids:
+        comment_heads = await fetch_comment_heads(db, found_ids)
+    
+    issues = []
+    for issue_id in found_ids:
+        issue = project_issue(rows_by_id[issue_id], assignees.get(issue_id, []), issue_fields)
+        if 'comments' in issue_fields:
+            issue['comments'], issue['commentsNextCursor'] = comment_heads[issue_id]
+        issues.append(issue)
+    
+    return FastJSONResponse({
+        "issues": issues,
+        "missingIds": [issue_id for issue_id in issue_ids if issue_id not in rows_by_id]
+    })
+
+def send_status_change_notification(cur, issue, old_status, assignee_users, current_user):
+    """Email the reporter and assignees that an issue changed status"""
+    issue_id = issue['id']
+    new_status = issue['status']
+    try:
+        # Get all stakeholders (reporter + assignees)
+        stakeholder_emails = []
+        stakeholder_names = []
+
+        # Get reporter info
+        if issue['reporterId']:
+            cur.execute("""
+                SELECT name, email FROM "user" WHERE id = %s
+            """, (issue['reporterId'],))
+            reporter = cur.fetchone()
+            if reporter and reporter['email']:
+                stakeholder_emails.append(reporter['email'])
+                stakeholder_names.append(reporter['name'])
+
+        # Add assignees
+        for user in assignee_users:
+            if user['email'] and user['email'] not in stakeholder_emails:
+                stakeholder_emails.append(user['email'])
+                stakeholder_names.append(user['name'])
+
+        # Get project name
+        cur.execute("""
+            SELECT name FROM project WHERE id = %s
+        """, (issue['projectId'],))
+        project = cur.fetchone()
+        project_name = project['name'] if project else 'Unknown Project'
+
+        if stakeholder_emails:
+            # Get the current user who made the change
+            updated_by_name = current_user.get('name', current_user.get('email', 'Unknown User'))
+
+            ticket_url = issue_url(issue['projectId'], issue_id)
+            unsubscribe_url = f"{BASE_URL}/unsubscribe"
+
+            # Send status change notification
+            async def send_status_notification():
+                await email_service.send_ticket_status_changed_email(
+                    user_emails=stakeholder_emails,
+                    user_names=stakeholder_names,
+                    ticket_id=issue_id,
+                    ticket_title=issue['title'],
+                    old_status=format_status(old_status),
+                    new_status=format_status(new_status),
+                    project_name=project_name,
+                    updated_by_name=updated_by_name,
+                    ticket_url=ticket_url,
+                    unsubscribe_url=unsubscribe_url
+                )
+
+            print(f"🚀 ATTEMPTING TO SEND STATUS CHANGE EMAIL for issue {issue_id}")
+            print(f"   📊 Status: {old_status} → {new_status}")
+            print(f"   📧 Recipients: {stakeholder_emails}")
+            print(f"   📁 Project: {project_name}")
+
+            run_async_email(send_status_notification())
+            print(f"✅ DEBUG: Status change email triggered for issue {issue_id}: {old_status} -> {new_status}")
+    except Exception as email_error:
+        print(f"DEBUG: Status change email failed: {str(email_error)}")
+
+# Replace one issue's assignees with a set diff: only missing rows are inserted and
+# only dropped rows deleted. Returns every user involved, flagged added / removed;
+# the final assignee list is the rows that were not removed. Unknown user ids are ignored.
+SET_ISSUE_ASSIGNEES_SQL = """
+    WITH wanted AS (
+        SELECT u.id AS user_id FROM "user" u WHERE u.id = ANY(%(user_ids)s::int[])
+    ),
+    removed AS (
+        DELETE FROM issue_user iu
+        WHERE iu.issue_id = %(issue_id)s
+          AND iu.user_id NOT IN (SELECT user_id FROM wanted)
+        RETURNING iu.user_id
+    ),
+    added AS (
+        INSERT INTO issue_user (issue_id, user_id)
+        SELECT %(issue_id)s, w.user_id
+        FROM wanted w
+        ON CONFLICT (issue_id, user_id) DO NOTHING
+        RETURNING user_id
+    )
+    SELECT u.id, u.name, u.email, u."avatarUrl",
+           u.id IN (SELECT user_id FROM added) AS added,
+           u.id IN (SELECT user_id FROM removed) AS removed
+    FROM "user" u
+    WHERE u.id IN (SELECT user_id FROM wanted)
+       OR u.id IN (SELECT user_id FROM removed)
+    ORDER BY u.id
+"""
+
+def send_assignee_change_notification(cur, issue, added_users, removed_users, current_user):
+    """Email the reporter and the users actually added to or removed from an issue"""
+    issue_id = issue['id']
+    try:
+        recipients = {}
+        if issue['reporterId']:
+            cur.execute('SELECT name, email FROM "user" WHERE id = %s', (issue['reporterId'],))
+            reporter = cur.fetchone()
+            if reporter and reporter['email']:
+                recipients[reporter['email']] = reporter['name']
+        for user in [*added_users, *removed_users]:
+            if user['email']:
+                recipients.setdefault(user['email'], user['name'])
+
+        if not recipients:
+            return
+
+        cur.execute('SELECT name FROM project WHERE id = %s', (issue['projectId'],))
+        project = cur.fetchone()
+        project_name = project['name'] if project else 'Unknown Project'
+
+        async def send_assignee_notification():
+            await email_service.send_assignee_changed_email(
+                notification_emails=list(recipients),
+                notification_names=list(recipients.values()),
+                ticket_id=issue_id,
+                ticket_title=issue['title'],
+                old_assignee_name=', '.join(user['name'] for user in removed_users) or 'Unassigned',
+                old_assignee_email=', '.join(user['email'] for user in removed_users),
+                new_assignee_name=', '.join(user['name'] for user in added_users) or 'Unassigned',
+                new_assignee_email=', '.join(user['email'] for user in added_users),
+                changed_by_name=current_user.get('name', current_user.get('email', 'Unknown User')),
+                project_name=project_name,
+                priority=format_priority(issue['priority']),
+                ticket_type=(issue['type'] or 'task').title(),
+                ticket_url=issue_url(issue['projectId'], issue_id),
+                unsubscribe_url=f"{BASE_URL}/unsubscribe"
+            )
+
+        print(f"🚀 ATTEMPTING TO SEND ASSIGNEE CHANGE EMAIL for issue {issue_id}")
+        print(f"   ➕ Added: {[user['email'] for user in added_users]}")
+        print(f"   ➖ Removed: {[user['email'] for user in removed_users]}")
+
+        run_async_email(send_assignee_notification())
+    except Exception as email_error:
+        print(f"DEBUG: Assignee change email failed: {str(email_error)}")
+
+# Frontend issue fields and the issue columns they write (PUT and PATCH /issues)
+ISSUE_FIELD_COLUMNS = {
+    'title': 'title',
+    'type': 'type',
+    'status': 'status',
+    'priority': 'priority',
+    'listPosition': 'listPosition',
+    'description': 'description',
+    'descriptionText': 'descriptionText',
+    'estimate': 'estimate',
+    'timeSpent': 'timeSpent',
+    'timeRemaining': 'timeRemaining',
+    'reporterId': 'reporterId',
+    'dueDate': 'due_date'
+}
+
+UPDATED_ISSUE_COLUMNS = """
+    i.id, i.title, i.type, i.status, i.priority, i."listPosition",
+    i.description, i."descriptionText", i.estimate, i."timeSpent",
+    i."timeRemaining", i."reporterId", i."projectId", i."created_at", i."updated_at", i.due_date
+"""
+
+def serialize_updated_issue(issue, assignee_users) -> dict:
+    """Response shape of PUT /issues/{id} and PATCH /issues/bulk"""
+    return {
+        "id": str(issue['id']),
+        "title": issue['title'],
+        "type": issue['type'] or "task",
+        "status": issue['status'] or "backlog",
+        "priority": issue['priority'] or "3",
+        "listPosition": issue['listPosition'] or 0,
+        "description": issue['description'] or "",
+        "descriptionText": issue['descriptionText'] or issue['description'] or "",
+        "estimate": issue['estimate'],
+        "timeSpent": issue['timeSpent'] or 0,
+        "timeRemaining": issue['timeRemaining'],
+        "reporterId": issue['reporterId'],
+        "projectId": issue['projectId'],
+        "createdAt": issue['created_at'],
+        "updatedAt": issue['updated_at'],
+        "dueDate": issue['due_date'],
+        "userIds": [user['id'] for user in assignee_users],
+        "users": [{
+            "id": user['id'],
+            "name": user['name'],
+            "email": user['email'],
+            "avatarUrl": user['avatarUrl']
+        } for user in assignee_users]
+    }
+
+def issue_url(project_id: int, issue_id: int) -> str:
+    """Link to an issue on the board, as used in notification emails"""
+    if BASE_URL.startswith('http://localhost'):
+        return f"{BASE_URL}/project/{project_id}/board?modal=issue-details&issueId={issue_id}"
+    return f"{BASE_URL}/project/{project_id}/board/issues/{issue_id}"
+
+BULK_UPDATE_MAX = 500
+
+# One UPDATE for every patch: jsonb_populate_record casts each value to its column's
+# type, and `patch ? column` keeps columns a patch does not mention unchanged
+BULK_UPDATE_ISSUES_SQL = """
+    UPDATE issue i SET
+        {assignments},
+        "updated_at" = NOW()
+    FROM (
+        SELECT e AS patch, r.*
+        FROM jsonb_array_elements(%s::jsonb) AS e
+        CROSS JOIN LATERAL jsonb_populate_record(NULL::issue, e) AS r
+    ) p
+    WHERE i.id = p.id
+    RETURNING {columns}
+""".format(
+    assignments=',\n        '.join(
+        f'"{column}" = CASE WHEN p.patch ? \'{column}\' THEN p."{column}" ELSE i."{column}" END'
+        for column in ISSUE_FIELD_COLUMNS.values()
+    ),
+    columns=UPDATED_ISSUE_COLUMNS
+)
+
+# Replace the assignees of every listed issue with one statement: delete the
+# rows that are no longer wanted, insert the missing ones, keep the rest
+BULK_SET_ASSIGNEES_SQL = """
+    WITH input AS (
+        SELECT (a->>'id')::int AS issue_id, a->'userIds' AS user_ids
+        FROM jsonb_array_elements(%s::jsonb) AS a
+    ),
+    wanted AS (
+        SELECT DISTINCT input.issue_id, u.value::int AS user_id
+        FROM input
+        CROSS JOIN LATERAL jsonb_array_elements_text(input.user_ids) AS u
+    ),
+    removed AS (
+        DELETE FROM issue_user iu
+        USING input
+        WHERE iu.issue_id = input.issue_id
+          AND (iu.issue_id, iu.user_id) NOT IN (SELECT issue_id, user_id FROM wanted)
+    )
+    INSERT INTO issue_user (issue_id, user_id)
+    SELECT issue_id, user_id FROM wanted
+    ON CONFLICT (issue_id, user_id) DO NOTHING
+    RETURNING issue_id, user_id
+"""
+
+@app.patch("/issues/bulk")
+def bulk_update_issues(bulk_data: dict, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
+    """Update many issues in one transaction (multi-card moves, batch edits).
+
+    Body: {"updates": [{"id": 12, "status": "done", "listPosition": 3.5}, ...]}.
+    Each entry carries only the fields it changes; "userIds" replaces that
+    issue's assignees. Every stakeholder gets at most one email for the batch.
+    """
+    updates = bulk_data.get('updates')
+    if not isinstance(updates, list) or not updates:
+        raise HTTPException(status_code=400, detail="updates must be a non-empty list")
+    if len(updates) > BULK_UPDATE_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {BULK_UPDATE_MAX} issues can be updated at once")
+    
+    patches = []
+    assignments = []
+    for update in updates:
+        try:
+            issue_id = int(update['id'])
+            user_ids = [int(uid) for uid in update['userIds'] or [] if uid] if 'userIds' in update else None
+        except (TypeError, ValueError, KeyError):
+            raise HTTPException(status_code=400, detail="Every update needs a numeric id and numeric userIds")
+        patch = {column: update[field] for field, column in ISSUE_FIELD_COLUMNS.items() if field in update}
+        patch['id'] = issue_id
+        patches.append(patch)
+        if user_ids is not None:
+            assignments.append({'id': issue_id, 'userIds': user_ids})
+    
+    issue_ids = [patch['id'] for patch in patches]
+    if len(set(issue_ids)) != len(issue_ids):
+        raise HTTPException(status_code=400, detail="Each issue may appear only once")
+    
     cur = conn.cursor()
     
     try:
+        # Lock in id order so concurrent bulk moves over the same cards cannot deadlock
         cur.execute("""
-            SELECT i.*, u.name as reporter_name, u.email as reporter_email
-            FROM issue i
-            LEFT JOIN "user" u ON i."reporterId" = u.id
-            ORDER BY i."listPosition", i.id
-        """)
-        issues_data = cur.fetchall()
-        
-        issues = []
-        for issue in issues_data:
-            issues.append({
-                "id": str(issue['id']),
-                "title": issue['title'],
-                "type": issue['type'] or "task",
-                "status": issue['status'] or "backlog",
-                "priority": issue['priority'] or "3",
-                "projectId": issue['projectid']
-            })
+            SELECT id, status, "projectId", priority, estimate, "listPosition"
+            FROM issue
+            WHERE id = ANY(%s)
+            ORDER BY id
+            FOR UPDATE
+        """, (issue_ids,))
+        previous = {row['id']: row for row in cur.fetchall()}
+        
+        missing = [issue_id for issue_id in issue_ids if issue_id not in previous]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Issues not found: {', '.join(map(str, missing))}")
+        
+        for project_id in {row['projectId'] for row in previous.values()}:
+            if project_id is not None and not project_acl.role(conn, project_id, current_user['id']):
+                raise HTTPException(status_code=403, detail="Access denied to this project")
+        
+        cur.execute(BULK_UPDATE_ISSUES_SQL, (json.dumps(patches, default=str),))
+        updated_issues = cur.fetchall()
+        
+        new_assignments = []
+        previous_assignees = {}
+        if assignments:
+            # Assignee sets before the change, for the history
+            cur.execute("""
+                SELECT issue_id, user_id FROM issue_user WHERE issue_id = ANY(%s)
+            """, ([assignment['id'] for assignment in assignments],))
+            previous_assignees = {assignment['id']: [] for assignment in assignments}
+            for row in cur.fetchall():
+                previous_assignees[row['issue_id']].append(row['user_id'])
+            
+            cur.execute(BULK_SET_ASSIGNEES_SQL, (json.dumps(assignments),))
+            new_assignments = cur.fetchall()
+        
+        cur.execute("""
+            SELECT iu.issue_id, u.id, u.name, u.email, u."avatarUrl"
+            FROM issue_user iu
+            JOIN "user" u ON u.id = iu.user_id
+            WHERE iu.issue_id = ANY(%s)
+            ORDER BY iu.issue_id, iu.id
+        """, (issue_ids,))
+        assignees = {issue_id: [] for issue_id in issue_ids}
+        for row in cur.fetchall():
+            assignees[row['issue_id']].append(row)
+        
+        events = []
+        for issue in updated_issues:
+            events += issue_changes(
+                previous[issue['id']], issue, current_user['id'],
+                old_assignees=previous_assignees.get(issue['id']),
+                new_assignees=[user['id'] for user in assignees[issue['id']]] if issue['id'] in previous_assignees else None
+            )
+        record_events(cur, events)
         
-        return {"issues": issues}
+        for issue in updated_issues:
+            publish(cur, issue['projectId'], "issue.updated",
+                    actorId=current_user['id'],
+                    issue=issue_event_fields(issue, [user['id'] for user in assignees[issue['id']]]))
         
+        conn.commit()
+    except HTTPException:
+        conn.rollback()
+        raise
+    except (psycopg2.DataError, psycopg2.IntegrityError) as e:
+        conn.rollback()
+        raise HTTPException(status_code=400, detail=f"Invalid update: {str(e)}")
+    except Exception:
+        conn.rollback()
+        raise
     finally:
         cur.close()
-        conn.close()
-
-# Duplicate endpoint removed - using the admin-only version below
+    
+    try:
+        send_bulk_update_digests(updated_issues, previous, assignees, new_assignments, current_user)
+    except Exception as email_error:
+        print(f"DEBUG: Bulk update digest emails failed: {str(email_error)}")
+    
+    # Same order as the request
+    issues_by_id = {issue['id']: issue for issue in updated_issues}
+    return FastJSONResponse({
+        "issues": [
+            serialize_updated_issue(issues_by_id[issue_id], assignees[issue_id])
+            for issue_id in issue_ids
+        ]
+    })
 
-# Duplicate function removed - moved above
+def send_bulk_update_digests(updated_issues, previous, assignees, new_assignments, current_user):
+    """Coalesce a bulk update into one email per stakeholder.
 
-@app.get("/currentUser", response_model=CurrentUserResponse)
-async def get_current_user_endpoint(current_user: dict = Depends(get_current_user)):
-    """Get the current authenticated user"""
-    user = User(
-        id=current_user['id'],
-        name=current_user['name'],
-        email=current_user['email'],
-        avatarUrl=current_user['avatarUrl'],
-        role=current_user['role']
-    )
+    Status changes go to the reporter and assignees (as with PUT /issues/{id}),
+    new assignments to the assignee.
+    """
+    changes_by_user = {}
+    issues_by_id = {issue['id']: issue for issue in updated_issues}
     
-    return CurrentUserResponse(currentUser=user)
+    for issue in updated_issues:
+        old_status = previous[issue['id']]['status']
+        if old_status == issue['status']:
+            continue
+        summary = f"{format_status(old_status)} → {format_status(issue['status'])}"
+        stakeholders = [issue['reporterId']] + [user['id'] for user in assignees[issue['id']]]
+        for user_id in dict.fromkeys(uid for uid in stakeholders if uid):
+            changes_by_user.setdefault(user_id, []).append((issue, summary))
+    
+    for assignment in new_assignments:
+        issue = issues_by_id[assignment['issue_id']]
+        changes_by_user.setdefault(assignment['user_id'], []).append((issue, "Assigned to you"))
+    
+    if not changes_by_user:
+        return
+    
+    with db_pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute('SELECT id, name, email FROM "user" WHERE id = ANY(%s)', (list(changes_by_user),))
+            users = {row['id']: row for row in cur.fetchall()}
+            cur.execute(
+                'SELECT id, name FROM project WHERE id = ANY(%s)',
+                (list({issue['projectId'] for issue in updated_issues if issue['projectId'] is not None}),)
+            )
+            project_names = {row['id']: row['name'] for row in cur.fetchall()}
+    
+    updated_by_name = current_user.get('name', current_user.get('email', 'Unknown User'))
+    
+    async def send_digests():
+        for user_id, changes in changes_by_user.items():
+            user = users.get(user_id)
+            if not user or not user['email']:
+                continue
+            await email_service.send_ticket_digest_email(
+                user_email=user['email'],
+                user_name=user['name'],
+                changes=[{
+                    "ticketId": str(issue['id']),
+                    "ticketTitle": issue['title'],
+                    "summary": summary,
+                    "ticketUrl": issue_url(issue['projectId'], issue['id'])
+                } for issue, summary in changes],
+                project_name=', '.join(sorted({
+                    project_names.get(issue['projectId'], 'Unknown Project') for issue, _ in changes
+                })),
+                updated_by_name=updated_by_name,
+                unsubscribe_url=f"{BASE_URL}/unsubscribe"
+            )
+    
+    print(f"🚀 ATTEMPTING TO SEND {len(changes_by_user)} BULK UPDATE DIGEST EMAIL(S)")
+    run_async_email(send_digests())
+
+def run_column_rebalance(project_id: int, status: str):
+    """Background job: respace a column whose position gaps ran out"""
+    try:
+        with db_pool.connection() as conn:
+            moved = rebalance_column(conn, project_id, status)
+        print(f"Rebalanced {moved} issue(s) in project {project_id} / {status}")
+    except Exception as e:
+        print(f"Column rebalance failed for project {project_id} / {status}: {str(e)}")
+    finally:
+        rebalance_scheduler.release(project_id, status)
 
+@app.put("/issues/{issue_id}/move")
+def move_issue(
+    issue_id: int,
+    move_data: dict,
+    background_tasks: BackgroundTasks,
+    current_user: dict = Depends(get_current_user),
+    conn=Depends(get_db)
+):
+    """Move a card to a column and slot, computing its listPosition server-side.
 
-@app.get("/issues/{issue_id}")
-def get_issue(issue_id: int):
-    """Get a single issue by ID"""
-    conn = get_db_connection()
+    Body: {"status": "inprogress", "prevId": <card above or null>, "nextId": <card below or null>}.
+    Writes only the moved row; when the gap it lands in is nearly exhausted the
+    column is respaced by a background job after the response is sent.
+    """
     cur = conn.cursor()
     
     try:
         cur.execute("""
-            SELECT 
-                i.id,
-                i.title,
-                i.type,
-                i.status,
-                i.priority,
-                i."listPosition",
-                i.description,
-                i."descriptionText",
-                i.estimate,
-                i."timeSpent",
-                i."timeRemaining",
-                i."reporterId",
-                i."projectId",
-                i."created_at",
-                i."updated_at",
-                i.due_date,
-                u.name as reporter_name,
-                u.email as reporter_email,
-                u."avatarUrl" as reporter_avatar
-            FROM issue i
-            LEFT JOIN "user" u ON i."reporterId" = u.id
-            WHERE i.id = %s
+            SELECT id, status, "projectId", "listPosition" FROM issue WHERE id = %s FOR UPDATE
         """, (issue_id,))
-        issue_data = cur.fetchone()
+        issue = cur.fetchone()
+        if not issue:
+            raise HTTPException(status_code=404, detail="Issue not found")
+        if not project_acl.role(conn, issue['projectId'], current_user['id']):
+            raise HTTPException(status_code=403, detail="Access denied to this project")
         
-        if not issue_data:
-            return JSONResponse(
-                status_code=404,
-                content={
-                    "error": {
-                        "code": "ISSUE_NOT_FOUND",
-                        "message": f"Issue {issue_id} not found",
-                        "status": 404,
-                        "data": {}
-                    }
-                }
-            )
+        status = move_data.get('status') or issue['status']
+        try:
+            prev_id = int(move_data['prevId']) if move_data.get('prevId') is not None else None
+            next_id = int(move_data['nextId']) if move_data.get('nextId') is not None else None
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="prevId and nextId must be issue ids")
+        
+        neighbours = neighbour_positions(cur, issue['projectId'], status, issue_id, prev_id, next_id)
+        if neighbours is None:
+            raise HTTPException(status_code=409, detail="The neighbouring issue is no longer in that column")
+        before, after = neighbours
+        
+        cur.execute(f"""
+            UPDATE issue i
+            SET status = %s, "listPosition" = %s, "updated_at" = NOW()
+            WHERE i.id = %s
+            RETURNING {UPDATED_ISSUE_COLUMNS}
+        """, (status, position_between(before, after), issue_id))
+        updated_issue = cur.fetchone()
         
-        # No comments table exists yet, return empty array
-        # Get assignees for this issue from issue_user table
         cur.execute("""
             SELECT u.id, u.name, u.email, u."avatarUrl"
             FROM "user" u
@@ -687,74 +2204,38 @@ def get_issue(issue_id: int):
         """, (issue_id,))
         assignee_users = cur.fetchall()
         
-        # Get comments for this issue
-        cur.execute("""
-            SELECT c.id, c.body, c."created_at", c."updated_at",
-                   u.id as user_id, u.name, u.email, u."avatarUrl"
-            FROM comment c
-            JOIN "user" u ON c."userId" = u.id
-            WHERE c."issueId" = %s
-            ORDER BY c."created_at" ASC
-        """, (issue_id,))
-        comments_data = cur.fetchall()
+        record_events(cur, issue_changes(issue, updated_issue, current_user['id']))
+        publish(cur, updated_issue['projectId'], "issue.updated",
+                actorId=current_user['id'],
+                issue=issue_event_fields(updated_issue, [user['id'] for user in assignee_users]))
         
-        comments = []
-        for comment in comments_data:
-            comments.append({
-                "id": str(comment['id']),
-                "body": comment['body'],
-                "createdAt": comment['created_at'].isoformat() if comment['created_at'] else None,
-                "updatedAt": comment['updated_at'].isoformat() if comment['updated_at'] else None,
-                "user": {
-                    "id": comment['user_id'],
-                    "name": comment['name'],
-                    "email": comment['email'],
-                    "avatarUrl": comment['avatarUrl']
-                }
-            })
+        conn.commit()
         
-        return {
-            "issue": {
-                "id": str(issue_data['id']),
-                "title": issue_data['title'],
-                "type": issue_data['type'] or "task",
-                "status": issue_data['status'] or "backlog",
-                "priority": issue_data['priority'] or "3",
-                "listPosition": float(issue_data['listPosition']) if issue_data['listPosition'] else 0,
-                "description": f"<p>{issue_data['description']}</p>" if issue_data['description'] else "",
-                "descriptionText": issue_data['descriptionText'] or issue_data['description'] or "",
-                "estimate": issue_data['estimate'],
-                "timeSpent": issue_data['timeSpent'] or 0,
-                "timeRemaining": issue_data['timeRemaining'],
-                "reporterId": issue_data['reporterId'],
-                "projectId": issue_data['projectId'],
-                "createdAt": issue_data['created_at'].isoformat() if issue_data['created_at'] else None,
-                "updatedAt": issue_data['updated_at'].isoformat() if issue_data['updated_at'] else None,
-                "dueDate": issue_data['due_date'].isoformat() if issue_data['due_date'] else None,
-                "userIds": [user['id'] for user in assignee_users],
-                "users": [{
-                    "id": user['id'],
-                    "name": user['name'],
-                    "email": user['email'],
-                    "avatarUrl": user['avatarUrl']
-                } for user in assignee_users],
-                "comments": comments
-            }
-        }
+        if gap_exhausted(before, after) and rebalance_scheduler.claim(updated_issue['projectId'], status):
+            background_tasks.add_task(run_column_rebalance, updated_issue['projectId'], status)
+        
+        if issue['status'] != updated_issue['status']:
+            send_status_change_notification(cur, updated_issue, issue['status'], assignee_users, current_user)
+        
+        return FastJSONResponse(serialize_updated_issue(updated_issue, assignee_users))
+    except HTTPException:
+        conn.rollback()
+        raise
+    except Exception as e:
+        conn.rollback()
+        raise e
     finally:
         cur.close()
-        conn.close()
 
 @app.put("/issues/{issue_id}")
-def update_issue(issue_id: int, issue_update: dict, current_user: dict = Depends(get_current_user)):
+def update_issue(issue_id: int, issue_update: dict, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Update an issue"""
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
         # Get the current issue state to compare for email notifications
         cur.execute("""
-            SELECT status, "reporterId", "projectId", title
+            SELECT status, "reporterId", "projectId", title, priority, estimate, "listPosition"
             FROM issue WHERE id = %s
         """, (issue_id,))
         old_issue = cur.fetchone()
@@ -779,20 +2260,7 @@ def update_issue(issue_id: int, issue_update: dict, current_user: dict = Depends
         values = []
         
         # Map frontend field names to database column names
-        field_mapping = {
-            'title': 'title',
-            'type': 'type',
-            'status': 'status',
-            'priority': 'priority',
-            'listPosition': '"listPosition"',
-            'description': 'description',
-            'descriptionText': '"descriptionText"',
-            'estimate': 'estimate',
-            'timeSpent': '"timeSpent"',
-            'timeRemaining': '"timeRemaining"',
-            'reporterId': '"reporterId"',
-            'dueDate': 'due_date'
-        }
+        field_mapping = {field: f'"{column}"' for field, column in ISSUE_FIELD_COLUMNS.items()}
         
         # Handle assignee updates separately
         assignee_user_ids = None
@@ -806,8 +2274,8 @@ def update_issue(issue_id: int, issue_update: dict, current_user: dict = Depends
                 values.append(value)
         
         # Always update timestamp even if no other fields changed
-        update_fields.append('"updated_at" = %s')
-        values.append(datetime.now())
+        # (database clock, so delta-sync cursors and updated_at agree)
+        update_fields.append('"updated_at" = NOW()')
         
         # Add issue_id for WHERE clause
         values.append(issue_id)
@@ -863,137 +2331,59 @@ def update_issue(issue_id: int, issue_update: dict, current_user: dict = Depends
                 }
             )
         
-        # Update assignees if provided
+        added_users, removed_users = [], []
+        old_assignee_ids = new_assignee_ids = None
         if assignee_user_ids is not None:
-            # Remove all current assignees
-            cur.execute("DELETE FROM issue_user WHERE issue_id = %s", (issue_id,))
-            
-            # Add new assignees
-            for user_id in assignee_user_ids:
-                if user_id:  # Only insert valid user IDs
-                    cur.execute("""
-                        INSERT INTO issue_user (issue_id, user_id)
-                        VALUES (%s, %s)
-                        ON CONFLICT (issue_id, user_id) DO NOTHING
-                    """, (issue_id, user_id))
-                    print(f"DEBUG: Assigned user {user_id} to issue {issue_id}")
-        
-        # Get current assignees for response
-        cur.execute("""
-            SELECT u.id, u.name, u.email, u."avatarUrl"
-            FROM "user" u
-            JOIN issue_user iu ON u.id = iu.user_id
-            WHERE iu.issue_id = %s
-        """, (issue_id,))
-        assignee_users = cur.fetchall()
+            # Apply only the difference; the statement also returns the final list
+            cur.execute(SET_ISSUE_ASSIGNEES_SQL, {
+                'issue_id': issue_id,
+                'user_ids': [int(user_id) for user_id in assignee_user_ids if user_id]
+            })
+            assignment_rows = cur.fetchall()
+            assignee_users = [user for user in assignment_rows if not user['removed']]
+            added_users = [user for user in assignment_rows if user['added']]
+            removed_users = [user for user in assignment_rows if user['removed']]
+            old_assignee_ids = [user['id'] for user in assignment_rows if not user['added']]
+            new_assignee_ids = [user['id'] for user in assignee_users]
+        else:
+            cur.execute("""
+                SELECT u.id, u.name, u.email, u."avatarUrl"
+                FROM "user" u
+                JOIN issue_user iu ON u.id = iu.user_id
+                WHERE iu.issue_id = %s
+            """, (issue_id,))
+            assignee_users = cur.fetchall()
+        
+        record_events(cur, issue_changes(
+            old_issue, updated_issue, current_user['id'], old_assignee_ids, new_assignee_ids
+        ))
+
+        publish(cur, updated_issue['projectId'], "issue.updated",
+                actorId=current_user['id'],
+                issue=issue_event_fields(updated_issue, [user['id'] for user in assignee_users]))
+        if old_issue['projectId'] != updated_issue['projectId']:
+            publish(cur, old_issue['projectId'], "issue.deleted", actorId=current_user['id'], issueId=str(issue_id))
         
         conn.commit()
         
         # Send email notifications for status changes
-        new_status = updated_issue['status']
-        if old_status != new_status:
-            try:
-                # Get all stakeholders (reporter + assignees)
-                stakeholder_emails = []
-                stakeholder_names = []
-                
-                # Get reporter info
-                if updated_issue['reporterId']:
-                    cur.execute("""
-                        SELECT name, email FROM "user" WHERE id = %s
-                    """, (updated_issue['reporterId'],))
-                    reporter = cur.fetchone()
-                    if reporter and reporter['email']:
-                        stakeholder_emails.append(reporter['email'])
-                        stakeholder_names.append(reporter['name'])
-                
-                # Add assignees
-                for user in assignee_users:
-                    if user['email'] and user['email'] not in stakeholder_emails:
-                        stakeholder_emails.append(user['email'])
-                        stakeholder_names.append(user['name'])
-                
-                # Get project name
-                cur.execute("""
-                    SELECT name FROM project WHERE id = %s
-                """, (updated_issue['projectId'],))
-                project = cur.fetchone()
-                project_name = project['name'] if project else 'Unknown Project'
-                
-                if stakeholder_emails:
-                    # Get the current user who made the change
-                    updated_by_name = current_user.get('name', current_user.get('email', 'Unknown User'))
-                    
-                    # Determine URL format based on environment
-                    if BASE_URL.startswith('http://localhost'):
-                        ticket_url = f"{BASE_URL}/project/{updated_issue['projectId']}/board?modal=issue-details&issueId={issue_id}"
-                        unsubscribe_url = f"{BASE_URL}/unsubscribe"
-                    else:
-                        ticket_url = f"{BASE_URL}/project/{updated_issue['projectId']}/board/issues/{issue_id}"
-                        unsubscribe_url = f"{BASE_URL}/unsubscribe"
-                    
-                    # Send status change notification
-                    async def send_status_notification():
-                        await email_service.send_ticket_status_changed_email(
-                            user_emails=stakeholder_emails,
-                            user_names=stakeholder_names,
-                            ticket_id=issue_id,
-                            ticket_title=updated_issue['title'],
-                            old_status=format_status(old_status),
-                            new_status=format_status(new_status),
-                            project_name=project_name,
-                            updated_by_name=updated_by_name,
-                            ticket_url=ticket_url,
-                            unsubscribe_url=unsubscribe_url
-                        )
-                    
-                    print(f"🚀 ATTEMPTING TO SEND STATUS CHANGE EMAIL for issue {issue_id}")
-                    print(f"   📊 Status: {old_status} → {new_status}")
-                    print(f"   📧 Recipients: {stakeholder_emails}")
-                    print(f"   📁 Project: {project_name}")
-                    
-                    run_async_email(send_status_notification())
-                    print(f"✅ DEBUG: Status change email triggered for issue {issue_id}: {old_status} -> {new_status}")
-            except Exception as email_error:
-                print(f"DEBUG: Status change email failed: {str(email_error)}")
+        if old_status != updated_issue['status']:
+            send_status_change_notification(cur, updated_issue, old_status, assignee_users, current_user)
+        
+        if added_users or removed_users:
+            send_assignee_change_notification(cur, updated_issue, added_users, removed_users, current_user)
         
         # Return the full updated issue to ensure frontend has all the data
-        return {
-            "id": str(updated_issue['id']),
-            "title": updated_issue['title'],
-            "type": updated_issue['type'] or "task",
-            "status": updated_issue['status'] or "backlog",
-            "priority": updated_issue['priority'] or "3",
-            "listPosition": float(updated_issue['listPosition']) if updated_issue['listPosition'] else 0,
-            "description": updated_issue['description'] or "",
-            "descriptionText": updated_issue['descriptionText'] or updated_issue['description'] or "",
-            "estimate": updated_issue['estimate'],
-            "timeSpent": updated_issue['timeSpent'] or 0,
-            "timeRemaining": updated_issue['timeRemaining'],
-            "reporterId": updated_issue['reporterId'],
-            "projectId": updated_issue['projectId'],
-            "createdAt": updated_issue['created_at'].isoformat() if updated_issue['created_at'] else None,
-            "updatedAt": updated_issue['updated_at'].isoformat() if updated_issue['updated_at'] else None,
-            "dueDate": updated_issue['due_date'].isoformat() if updated_issue['due_date'] else None,
-            "userIds": [user['id'] for user in assignee_users],
-            "users": [{
-                "id": user['id'],
-                "name": user['name'],
-                "email": user['email'],
-                "avatarUrl": user['avatarUrl']
-            } for user in assignee_users]
-        }
+        return FastJSONResponse(serialize_updated_issue(updated_issue, assignee_users))
     except Exception as e:
         conn.rollback()
         raise e
     finally:
         cur.close()
-        conn.close()
 
 @app.post("/issues")
-def create_issue(issue_data: dict):
+def create_issue(issue_data: dict, conn=Depends(get_db)):
     """Create a new issue"""
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -1001,7 +2391,7 @@ def create_issue(issue_data: dict):
         issue_data.setdefault('type', 'task')
         issue_data.setdefault('status', 'backlog')
         issue_data.setdefault('priority', '3')
-        issue_data.setdefault('listPosition', 99999)  # Put at end of list
+        issue_data.setdefault('listPosition', None)  # None: end of its column
         issue_data.setdefault('description', '')
         issue_data.setdefault('descriptionText', '')
         issue_data.setdefault('estimate', None)
@@ -1024,7 +2414,13 @@ def create_issue(issue_data: dict):
                 description, "descriptionText", estimate, "timeSpent",
                 "timeRemaining", "reporterId", "projectId", due_date
             ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                %s, %s, %s, %s,
+                COALESCE(%s, (
+                    SELECT COALESCE(MAX("listPosition"), 0) + %s
+                    FROM issue
+                    WHERE "projectId" = %s AND status = %s
+                )),
+                %s, %s, %s, %s, %s, %s, %s, %s
             ) RETURNING 
                 id, title, type, status, priority, "listPosition",
                 description, "descriptionText", estimate, "timeSpent",
@@ -1035,6 +2431,9 @@ def create_issue(issue_data: dict):
             issue_data['status'],
             issue_data['priority'],
             issue_data['listPosition'],
+            POSITION_STEP,
+            issue_data.get('projectId', 1),
+            issue_data['status'],
             issue_data['description'],
             issue_data['descriptionText'],
             issue_data.get('estimate'),
@@ -1058,6 +2457,9 @@ def create_issue(issue_data: dict):
                 """, (issue_id, user_id))
                 print(f"DEBUG: Assigned user {user_id} to issue {issue_id}")
         
+        publish(cur, new_issue['projectId'], "issue.created",
+                issue=issue_event_fields(new_issue, dict.fromkeys(uid for uid in assignee_user_ids if uid)))
+        
         conn.commit()
         
         # Get assignee users for response
@@ -1140,21 +2542,21 @@ def create_issue(issue_data: dict):
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
 
 @app.delete("/issues/{issue_id}")
-def delete_issue(issue_id: int):
+def delete_issue(issue_id: int, conn=Depends(get_db)):
     """Delete an issue"""
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
-        cur.execute("DELETE FROM issue WHERE id = %s RETURNING id", (issue_id,))
+        cur.execute('DELETE FROM issue WHERE id = %s RETURNING id, "projectId"', (issue_id,))
         deleted = cur.fetchone()
         
         if not deleted:
             raise HTTPException(status_code=404, detail="Issue not found")
         
+        publish(cur, deleted['projectId'], "issue.deleted", issueId=str(issue_id))
+        
         conn.commit()
         return {"message": "Issue deleted successfully"}
         
@@ -1163,7 +2565,132 @@ def delete_issue(issue_id: int):
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
+
+# Uploaded import files are spooled here until the background job has read them
+IMPORT_SPOOL_DIR = os.getenv('IMPORT_SPOOL_DIR') or None
+IMPORT_MAX_BYTES = int(os.getenv('IMPORT_MAX_BYTES', str(100 * 1024 * 1024)))
+IMPORT_WRITE_BUFFER = 1024 * 1024  # bytes collected per spool write on the threadpool
+
+def update_import_job(job_id: int, **fields):
+    """Record import progress on its own pooled connection so it is visible before the import commits"""
+    assignments = ', '.join(f'{column} = %s' for column in fields)
+    with db_pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f'UPDATE issue_import_job SET {assignments}, updated_at = NOW() WHERE id = %s',
+                (*fields.values(), job_id)
+            )
+        conn.commit()
+
+def run_issue_import(job_id: int, path: str, project_id: int, reporter_id: int, fmt: str):
+    """Background job: COPY an uploaded file into a project"""
+    def progress(phase, rows):
+        if phase != 'done':
+            update_import_job(job_id, status=phase, rows_read=rows)
+
+    try:
+        with open(path, newline='', encoding='utf-8') as stream, db_pool.connection() as conn:
+            result = import_issues(conn, stream, project_id, reporter_id, fmt, progress)
+        update_import_job(job_id, status='done', rows_imported=result['imported'], finished_at=datetime.now())
+        print(f"Imported {result['imported']} issue(s) into project {project_id} (job {job_id})")
+    except ImportValidationError as e:
+        update_import_job(job_id, status='failed', errors=json.dumps(e.errors), finished_at=datetime.now())
+    except Exception as e:
+        print(f"Issue import job {job_id} failed: {str(e)}")
+        update_import_job(job_id, status='failed', errors=json.dumps([{"line": None, "error": str(e)}]),
+                          finished_at=datetime.now())
+    finally:
+        os.remove(path)
+
+@app.post("/projects/{project_id}/import", status_code=202)
+async def import_project_issues(
+    project_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    format: str = 'csv',
+    current_user: dict = Depends(get_current_user)
+):
+    """Bulk import issues from a CSV or JSONL request body (see issue_import.py for the fields).
+
+    The body (at most IMPORT_MAX_BYTES, 413 beyond) is spooled to disk and
+    imported by a background job in one transaction; poll GET /imports/{jobId}
+    for progress and validation errors.
+    """
+    if format not in IMPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of: {', '.join(IMPORT_FORMATS)}")
+    too_large = HTTPException(status_code=413, detail=f"Import files are limited to {IMPORT_MAX_BYTES} bytes")
+    try:
+        declared_length = int(request.headers.get('content-length', '0'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid Content-Length")
+    if declared_length > IMPORT_MAX_BYTES:
+        raise too_large
+
+    # Short borrows only: the upload itself may take a while
+    async with async_engine.connection() as db:
+        members = await project_acl.amembers(db, project_id)
+    if not (current_user.get('role') == 'admin' or members.get(current_user['id']) == 'admin'):
+        raise HTTPException(status_code=403, detail="Only admins can import issues")
+
+    # Disk I/O runs on the threadpool so a large upload never stalls the event loop (and its SSE streams)
+    spool = await run_in_threadpool(
+        tempfile.NamedTemporaryFile, prefix='issue-import-', suffix=f'.{format}', dir=IMPORT_SPOOL_DIR, delete=False
+    )
+    try:
+        received = 0
+        buffer = bytearray()
+        try:
+            async for chunk in request.stream():
+                received += len(chunk)
+                if received > IMPORT_MAX_BYTES:
+                    raise too_large
+                buffer += chunk
+                if len(buffer) >= IMPORT_WRITE_BUFFER:
+                    await run_in_threadpool(spool.write, bytes(buffer))
+                    buffer.clear()
+            if buffer:
+                await run_in_threadpool(spool.write, bytes(buffer))
+        finally:
+            await run_in_threadpool(spool.close)
+
+        async with async_engine.connection() as db:
+            job_id = await db.fetchval("""
+                INSERT INTO issue_import_job (project_id, created_by, format)
+                VALUES ($1, $2, $3)
+                RETURNING id
+            """, project_id, current_user['id'], format)
+    except Exception:
+        await run_in_threadpool(os.remove, spool.name)
+        raise
+
+    background_tasks.add_task(run_issue_import, job_id, spool.name, project_id, current_user['id'], format)
+    return {"jobId": job_id, "status": "queued"}
+
+@app.get("/imports/{job_id}")
+async def get_import_job(job_id: int, current_user: dict = Depends(get_current_user), db=Depends(get_async_db)):
+    """Progress of a bulk import job"""
+    job = await db.fetchrow("""
+        SELECT id, project_id, status, format, rows_read, rows_imported, errors,
+               created_at, finished_at
+        FROM issue_import_job
+        WHERE id = $1
+    """, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    if current_user.get('role') != 'admin' and not await project_acl.arole(db, job['project_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied to this project")
+
+    return {
+        "jobId": job['id'],
+        "projectId": job['project_id'],
+        "status": job['status'],
+        "format": job['format'],
+        "rowsRead": job['rows_read'],
+        "rowsImported": job['rows_imported'],
+        "errors": json.loads(job['errors']) if job['errors'] else [],
+        "createdAt": job['created_at'].isoformat(),
+        "finishedAt": job['finished_at'].isoformat() if job['finished_at'] else None
+    }
 
 # Authentication models
 class LoginRequest(BaseModel):
@@ -1206,9 +2733,8 @@ def verify_token(token: str) -> Optional[int]:
 
 # Authentication endpoints
 @app.post("/auth/login")
-def login(login_data: LoginRequest):
+def login(login_data: LoginRequest, conn=Depends(get_db)):
     """Login with email and password"""
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -1250,14 +2776,12 @@ def login(login_data: LoginRequest):
         }
     finally:
         cur.close()
-        conn.close()
 
 # Test login endpoint removed
 
 @app.post("/auth/google")
-def google_login(google_data: GoogleLoginRequest):
+def google_login(google_data: GoogleLoginRequest, conn=Depends(get_db)):
     """Login with Google"""
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -1369,6 +2893,7 @@ def google_login(google_data: GoogleLoginRequest):
         )
         
         conn.commit()
+        principal_cache.invalidate_user(user['id'])
         
         return {
             "token": token,
@@ -1382,12 +2907,10 @@ def google_login(google_data: GoogleLoginRequest):
         }
     finally:
         cur.close()
-        conn.close()
 
 @app.post("/auth/simple-login")
-def simple_login(login_data: dict):
+def simple_login(login_data: dict, conn=Depends(get_db)):
     """Simple login for admin users with email only"""
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -1434,16 +2957,10 @@ def simple_login(login_data: dict):
         }
     finally:
         cur.close()
-        conn.close()
 
 @app.post("/auth/logout")
-async def logout(request: Request):
+def logout(request: Request, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Logout current user"""
-    user_id = await get_current_user(request)
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -1452,21 +2969,20 @@ async def logout(request: Request):
         
         cur.execute('DELETE FROM sessions WHERE token = %s', (token,))
         conn.commit()
+        principal_cache.invalidate_token(token)
         
         return {"message": "Logged out successfully"}
     finally:
         cur.close()
-        conn.close()
 
 # Update the currentUser endpoint to use authentication
 # Removed duplicate endpoint
 
 # Create new user (admin only)
 @app.post("/users")
-async def create_user(user_data: dict, current_user: dict = Depends(get_current_user)):
+def create_user(user_data: dict, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Create a new user (admin only)"""
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -1515,14 +3031,12 @@ async def create_user(user_data: dict, current_user: dict = Depends(get_current_
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
 
 # Get all users (admin only)
 @app.get("/users")
-async def get_users(current_user: dict = Depends(get_current_user)):
+def get_users(current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Get all users (admin only)"""
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -1557,15 +3071,13 @@ async def get_users(current_user: dict = Depends(get_current_user)):
         }
     finally:
         cur.close()
-        conn.close()
 
 # Delete user (admin only)
 @app.delete("/users/{user_id}")
-async def delete_user(user_id: int, current_user: dict = Depends(get_current_user)):
+def delete_user(user_id: int, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Delete a user (admin only)"""
     current_user_id = current_user['id']
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -1612,6 +3124,8 @@ async def delete_user(user_id: int, current_user: dict = Depends(get_current_use
         print(f"DEBUG: Successfully deleted user {user_to_delete['email']}")
         
         conn.commit()
+        principal_cache.invalidate_user(user_id)
+        project_acl.invalidate_user(user_id)
         
         return {
             "message": f"User {user_to_delete['email']} deleted successfully",
@@ -1630,15 +3144,13 @@ async def delete_user(user_id: int, current_user: dict = Depends(get_current_use
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
 
 # Update user (admin only)
 @app.put("/users/{user_id}")
-async def update_user(user_id: int, user_data: dict, current_user: dict = Depends(get_current_user)):
+def update_user(user_id: int, user_data: dict, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Update a user's information and role (admin only)"""
     current_user_id = current_user['id']
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -1681,7 +3193,7 @@ async def update_user(user_id: int, user_data: dict, current_user: dict = Depend
         if new_role != user_to_update['role']:
             cur.execute("""
                 UPDATE user_project 
-                SET role = %s 
+                SET role = %s, updated_at = NOW()
                 WHERE user_id = %s
             """, (new_role, user_id))
             
@@ -1691,6 +3203,8 @@ async def update_user(user_id: int, user_data: dict, current_user: dict = Depend
         print(f"DEBUG: Successfully updated user {updated_user['email']}")
         
         conn.commit()
+        principal_cache.invalidate_user(user_id)
+        project_acl.invalidate_user(user_id)
         
         return {
             "message": f"User {updated_user['email']} updated successfully",
@@ -1712,29 +3226,81 @@ async def update_user(user_id: int, user_data: dict, current_user: dict = Depend
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
 
 # Comment endpoints
-@app.post("/comments")
-async def create_comment(comment_data: dict, current_user: dict = Depends(get_current_user)):
-    """Create a new comment"""
-    conn = get_db_connection()
+@app.get("/issues/{issue_id}/comments")
+def get_issue_comments(
+    issue_id: int,
+    order: str = 'desc',
+    cursor: Optional[str] = None,
+    limit: int = COMMENTS_PAGE_SIZE,
+    current_user: dict = Depends(get_current_user),
+    conn=Depends(get_db)
+):
+    """Keyset pages of an issue's comments (order=desc: newest first, asc: oldest first)"""
     cur = conn.cursor()
     
     try:
-        # Insert the comment with UTC timestamp
-        cur.execute("""
-            INSERT INTO comment (body, "issueId", "userId", "created_at", "updated_at")
-            VALUES (%s, %s, %s, NOW(), NOW())
-            RETURNING id, body, "created_at", "updated_at"
-        """, (
-            comment_data['body'],
-            comment_data['issueId'],
-            current_user['id']
-        ))
+        cur.execute('SELECT "projectId", comment_count FROM issue WHERE id = %s', (issue_id,))
+        issue = cur.fetchone()
+        if not issue:
+            raise HTTPException(status_code=404, detail="Issue not found")
+        if not project_acl.role(conn, issue['projectId'], current_user['id']):
+            raise HTTPException(status_code=403, detail="Access denied to this project")
         
-        comment = cur.fetchone()
-        conn.commit()
+        comments, next_cursor = fetch_comment_page(
+            cur, issue_id, order, clamp_limit(limit, COMMENTS_PAGE_SIZE_MAX), cursor
+        )
+        return FastJSONResponse({
+            "comments": comments,
+            "total": issue['comment_count'],
+            "nextCursor": next_cursor
+        })
+    finally:
+        cur.close()
+
+@app.get("/issues/{issue_id}/history")
+def get_issue_history(
+    issue_id: int,
+    field: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = HISTORY_PAGE_SIZE,
+    current_user: dict = Depends(get_current_user),
+    conn=Depends(get_db)
+):
+    """Field-level changes to one issue, newest first (field=status,assignees filters)"""
+    cur = conn.cursor()
+    
+    try:
+        cur.execute('SELECT "projectId" FROM issue WHERE id = %s', (issue_id,))
+        issue = cur.fetchone()
+        if not issue:
+            raise HTTPException(status_code=404, detail="Issue not found")
+        if not project_acl.role(conn, issue['projectId'], current_user['id']):
+            raise HTTPException(status_code=403, detail="Access denied to this project")
+        
+        events, next_cursor = fetch_history_page(
+            cur, 'issue_id', issue_id, field, clamp_limit(limit, HISTORY_PAGE_SIZE_MAX), cursor
+        )
+        return FastJSONResponse({"events": events, "nextCursor": next_cursor})
+    finally:
+        cur.close()
+
+@app.post("/comments")
+async def create_comment(comment_data: dict, current_user: dict = Depends(get_current_user), db=Depends(get_async_db)):
+    """Create a new comment"""
+    try:
+        async with db.transaction():
+            # Insert the comment with UTC timestamp
+            comment = await db.fetchrow("""
+                INSERT INTO comment (body, "issueId", "userId", "created_at", "updated_at")
+                VALUES ($1, $2, $3, NOW(), NOW())
+                RETURNING id, body, "created_at", "updated_at",
+                          (SELECT i."projectId" FROM issue i WHERE i.id = comment."issueId") AS project_id
+            """, comment_data['body'], comment_data['issueId'], current_user['id'])
+            
+            await apublish(db, comment['project_id'], "comment.created", actorId=current_user['id'],
+                           issueId=str(comment_data['issueId']), commentId=str(comment['id']))
         
         return {
             "comment": {
@@ -1752,23 +3318,21 @@ async def create_comment(comment_data: dict, current_user: dict = Depends(get_cu
         }
         
     except Exception as e:
-        conn.rollback()
         print(f"Error creating comment: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        cur.close()
-        conn.close()
 
 @app.put("/comments/{comment_id}")
-async def update_comment(comment_id: int, comment_data: dict, current_user: dict = Depends(get_current_user)):
+def update_comment(comment_id: int, comment_data: dict, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Update a comment"""
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
         # Check if user owns the comment
         cur.execute("""
-            SELECT "userId" FROM comment WHERE id = %s
+            SELECT c."userId", c."issueId", i."projectId"
+            FROM comment c
+            LEFT JOIN issue i ON i.id = c."issueId"
+            WHERE c.id = %s
         """, (comment_id,))
         comment_owner = cur.fetchone()
         
@@ -1784,6 +3348,8 @@ async def update_comment(comment_id: int, comment_data: dict, current_user: dict
         """, (comment_data['body'], comment_id))
         
         updated_comment = cur.fetchone()
+        publish(cur, comment_owner['projectId'], "comment.updated", actorId=current_user['id'],
+                issueId=str(comment_owner['issueId']), commentId=str(comment_id))
         conn.commit()
         
         return {
@@ -1810,18 +3376,19 @@ async def update_comment(comment_id: int, comment_data: dict, current_user: dict
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
 
 @app.delete("/comments/{comment_id}")
-async def delete_comment(comment_id: int, current_user: dict = Depends(get_current_user)):
+def delete_comment(comment_id: int, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Delete a comment"""
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
         # Check if user owns the comment
         cur.execute("""
-            SELECT "userId" FROM comment WHERE id = %s
+            SELECT c."userId", c."issueId", i."projectId"
+            FROM comment c
+            LEFT JOIN issue i ON i.id = c."issueId"
+            WHERE c.id = %s
         """, (comment_id,))
         comment_owner = cur.fetchone()
         
@@ -1832,6 +3399,8 @@ async def delete_comment(comment_id: int, current_user: dict = Depends(get_curre
         cur.execute("""
             DELETE FROM comment WHERE id = %s
         """, (comment_id,))
+        publish(cur, comment_owner['projectId'], "comment.deleted", actorId=current_user['id'],
+                issueId=str(comment_owner['issueId']), commentId=str(comment_id))
         
         conn.commit()
         return {"message": "Comment deleted successfully"}
@@ -1845,17 +3414,15 @@ async def delete_comment(comment_id: int, current_user: dict = Depends(get_curre
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
 
 # Create new project
 @app.post("/projects")
-async def create_project(project_data: dict, current_user: dict = Depends(get_current_user)):
+def create_project(project_data: dict, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Create a new project"""
     user_id = current_user['id']
     
     print(f"DEBUG: Creating project by user {current_user['email']}: {project_data}")
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -1884,6 +3451,7 @@ async def create_project(project_data: dict, current_user: dict = Depends(get_cu
         print(f"DEBUG: Added user {user_id} as admin to project {project['id']}")
         
         conn.commit()
+        project_acl.invalidate(project['id'])
         
         return {
             "project": {
@@ -1903,33 +3471,21 @@ async def create_project(project_data: dict, current_user: dict = Depends(get_cu
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
 
 # Add user to project
 @app.post("/projects/{project_id}/users")
-async def add_user_to_project(project_id: int, user_data: dict, current_user: dict = Depends(get_current_user)):
+def add_user_to_project(project_id: int, user_data: dict, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Add a user to a project"""
     current_user_id = current_user['id']
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
         # Check if current user is admin (global admin or project admin)
-        cur.execute("""
-            SELECT role FROM "user" WHERE id = %s
-        """, (current_user_id,))
-        global_user = cur.fetchone()
-        
-        cur.execute("""
-            SELECT role FROM user_project 
-            WHERE user_id = %s AND project_id = %s
-        """, (current_user_id, project_id))
-        
-        project_user_role = cur.fetchone()
+        members = project_acl.members(conn, project_id)
         
-        is_global_admin = global_user and global_user['role'] == 'admin'
-        is_project_admin = project_user_role and project_user_role['role'] == 'admin'
+        is_global_admin = current_user.get('role') == 'admin'
+        is_project_admin = members.get(current_user_id) == 'admin'
         
         if not (is_global_admin or is_project_admin):
             raise HTTPException(status_code=403, detail="Only admins can add users to projects")
@@ -1944,21 +3500,21 @@ async def add_user_to_project(project_id: int, user_data: dict, current_user: di
             raise HTTPException(status_code=404, detail="User not found. Please create the user in Admin > Manage Users first.")
         
         # Check if user already in project
-        cur.execute("""
-            SELECT id FROM user_project 
-            WHERE user_id = %s AND project_id = %s
-        """, (user['id'], project_id))
-        
-        if cur.fetchone():
+        if user['id'] in members:
             raise HTTPException(status_code=400, detail="User already in project")
         
         # Add user to project using their global role
         cur.execute("""
             INSERT INTO user_project (user_id, project_id, role)
             VALUES (%s, %s, %s)
+            ON CONFLICT (user_id, project_id) DO NOTHING
         """, (user['id'], project_id, user['role']))
         
+        if cur.rowcount == 0:
+            raise HTTPException(status_code=400, detail="User already in project")
+        
         conn.commit()
+        project_acl.invalidate(project_id)
         
         return {"message": "User added successfully"}
     except HTTPException:
@@ -1968,27 +3524,34 @@ async def add_user_to_project(project_id: int, user_data: dict, current_user: di
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
 
 # Get project users
 @app.get("/projects/{project_id}/users")
-async def get_project_users(project_id: int, current_user: dict = Depends(get_current_user)):
+def get_project_users(
+    project_id: int,
+    request: Request,
+    response: Response,
+    current_user: dict = Depends(get_current_user),
+    conn=Depends(get_db)
+):
     """Get all users in a project"""
     user_id = current_user['id']
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
         # Check if user has access to project
-        cur.execute("""
-            SELECT role FROM user_project 
-            WHERE user_id = %s AND project_id = %s
-        """, (user_id, project_id))
-        
-        if not cur.fetchone():
+        if not project_acl.role(conn, project_id, user_id):
             raise HTTPException(status_code=403, detail="Access denied")
         
+        cur.execute('SELECT version FROM project WHERE id = %s', (project_id,))
+        project_row = cur.fetchone()
+        if project_row:
+            etag = make_etag("project-users", project_id, project_row['version'])
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            response.headers.update(cache_headers(etag))
+        
         # Get all users in project
         cur.execute("""
             SELECT u.*, up.role as project_role, up.joined_at
@@ -2015,33 +3578,19 @@ async def get_project_users(project_id: int, current_user: dict = Depends(get_cu
         }
     finally:
         cur.close()
-        conn.close()
 
 # Remove user from project
 @app.delete("/projects/{project_id}/users/{user_id}")
-async def remove_user_from_project(project_id: int, user_id: int, current_user: dict = Depends(get_current_user)):
+def remove_user_from_project(project_id: int, user_id: int, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Remove a user from a project"""
     current_user_id = current_user['id']
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
         # Check if current user is admin (global admin or project admin)
-        cur.execute("""
-            SELECT role FROM "user" WHERE id = %s
-        """, (current_user_id,))
-        global_user = cur.fetchone()
-        
-        cur.execute("""
-            SELECT role FROM user_project 
-            WHERE user_id = %s AND project_id = %s
-        """, (current_user_id, project_id))
-        
-        project_user_role = cur.fetchone()
-        
-        is_global_admin = global_user and global_user['role'] == 'admin'
-        is_project_admin = project_user_role and project_user_role['role'] == 'admin'
+        is_global_admin = current_user.get('role') == 'admin'
+        is_project_admin = project_acl.role(conn, project_id, current_user_id) == 'admin'
         
         if not (is_global_admin or is_project_admin):
             raise HTTPException(status_code=403, detail="Only admins can remove users from projects")
@@ -2057,9 +3606,7 @@ async def remove_user_from_project(project_id: int, user_id: int, current_user:
             if current_user['role'] != 'admin':
                 raise HTTPException(status_code=403, detail="Only admins can remove project owner")
             # Don't allow owner to remove themselves
-            cur.execute('SELECT id FROM "user" WHERE email = %s', (current_user['email'],))
-            current_user_db = cur.fetchone()
-            if current_user_db['id'] == user_id:
+            if current_user_id == user_id:
                 raise HTTPException(status_code=400, detail="Project owner cannot remove themselves")
         
         # Remove user from project
@@ -2069,6 +3616,7 @@ async def remove_user_from_project(project_id: int, user_id: int, current_user:
         """, (user_id, project_id))
         
         conn.commit()
+        project_acl.invalidate(project_id)
         
         return {"message": "User removed successfully"}
     except HTTPException:
@@ -2078,26 +3626,18 @@ async def remove_user_from_project(project_id: int, user_id: int, current_user:
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
 
 # Update project
 @app.put("/projects/{project_id}")
-async def update_project(project_id: int, project_data: dict, current_user: dict = Depends(get_current_user)):
+def update_project(project_id: int, project_data: dict, current_user: dict = Depends(get_current_user), conn=Depends(get_db)):
     """Update a project"""
     current_user_id = current_user['id']
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
         # Check if current user has access to project
-        cur.execute("""
-            SELECT role FROM user_project 
-            WHERE user_id = %s AND project_id = %s
-        """, (current_user_id, project_id))
-        
-        user_access = cur.fetchone()
-        if not user_access:
+        if not project_acl.role(conn, project_id, current_user_id):
             raise HTTPException(status_code=403, detail="Access denied")
         
         # Update project
@@ -2137,20 +3677,19 @@ async def update_project(project_id: int, project_data: dict, current_user: dict
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
 
 
 @app.put("/projects/{project_id}/users/{user_id}/role", response_model=dict)
-async def update_user_role(
+def update_user_role(
     project_id: int, 
     user_id: int, 
     role_update: dict, 
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    conn=Depends(get_db)
 ):
     print(f"DEBUG: Role update request - Project: {project_id}, User: {user_id}, New Role: {role_update.get('role')}")
     print(f"DEBUG: Current user: {current_user}")
     
-    conn = get_db_connection()
     cur = conn.cursor()
     
     try:
@@ -2158,13 +3697,7 @@ async def update_user_role(
         is_global_admin = current_user.get('role') == 'admin'
         
         # Check if current user is project admin
-        cur.execute("""
-            SELECT role FROM user_project 
-            WHERE user_id = (SELECT id FROM "user" WHERE email = %s) 
-            AND project_id = %s
-        """, (current_user['email'], project_id))
-        user_project = cur.fetchone()
-        is_project_admin = user_project and user_project['role'] == 'admin'
+        is_project_admin = project_acl.role(conn, project_id, current_user['id']) == 'admin'
         
         print(f"DEBUG: is_global_admin: {is_global_admin}, is_project_admin: {is_project_admin}")
         
@@ -2181,7 +3714,7 @@ async def update_user_role(
         # Update project role
         cur.execute("""
             UPDATE user_project 
-            SET role = %s 
+            SET role = %s, updated_at = NOW()
             WHERE user_id = %s AND project_id = %s
             RETURNING *
         """, (new_role, user_id, project_id))
@@ -2204,6 +3737,8 @@ async def update_user_role(
         print(f"DEBUG: Successfully updated global role: {updated_user['role']}")
         
         conn.commit()
+        principal_cache.invalidate_user(user_id)
+        project_acl.invalidate(project_id)
         return {"message": "Role updated successfully", "role": updated_project['role']}
     
     except HTTPException:
@@ -2215,7 +3750,6 @@ async def update_user_role(
         raise HTTPException(status_code=500, detail=str(e))
     finally:
         cur.close()
-        conn.close()
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,292 @@
+"""Versioned schema migrations.
+
+Migrations live in ``migrations/`` as pairs of files named
+``<version>_<name>.up.sql`` and ``<version>_<name>.down.sql``. Applied versions
+are recorded in the ``schema_migrations`` table.
+
+A migration runs inside a single transaction unless its first line is
+``-- migrate:no-transaction`` (needed for CREATE INDEX CONCURRENTLY); such
+files are executed one statement at a time in autocommit mode, so keep them
+to plain statements without function bodies.
+
+Usage (from the api/ directory):
+
+    python migrate.py status          # list applied and pending migrations
+    python migrate.py up [--to N]     # apply pending migrations
+    python migrate.py down [--steps N]  # roll back the latest N migrations
+    python migrate.py check           # run the index advisor
+"""
+import os
+import re
+import sys
+import argparse
+import logging
+from collections import namedtuple
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+NO_TRANSACTION_MARKER = '-- migrate:no-transaction'
+MIGRATION_LOCK_ID = 72_410_001  # pg_advisory_lock key shared by every runner
+
+Migration = namedtuple('Migration', ['version', 'name', 'up_path', 'down_path'])
+
+# Indexes the hot queries rely on: (table, leading columns). Any valid index whose
+# leading columns match satisfies the check, whoever created it.
+EXPECTED_INDEXES = [
+    ('issue', ('projectId', 'listPosition')),
+    ('issue', ('projectId', 'status', 'listPosition')),
+    ('issue', ('search_vector',)),
+    ('issue_user', ('issue_id', 'user_id')),
+    ('issue_user', ('user_id',)),
+    ('comment', ('issueId',)),
+    ('comment', ('issueId', 'created_at', 'id')),
+    ('issue_event', ('issue_id', 'created_at', 'id')),
+    ('issue_event', ('project_id', 'created_at', 'id')),
+    ('sessions', ('token',)),
+    ('sessions', ('user_id',)),
+    ('user_project', ('user_id', 'project_id')),
+    ('user_project', ('project_id',)),
+    ('user', ('email',)),
+]
+
+
+def discover_migrations(directory: str = MIGRATIONS_DIR) -> list:
+    """Return migrations found on disk, ordered by version"""
+    pattern = re.compile(r'^(\d+)_(\w+)\.up\.sql$')
+    migrations = []
+    for filename in os.listdir(directory):
+        match = pattern.match(filename)
+        if not match:
+            continue
+        version, name = int(match.group(1)), match.group(2)
+        down_path = os.path.join(directory, f"{match.group(1)}_{name}.down.sql")
+        migrations.append(Migration(
+            version, name,
+            os.path.join(directory, filename),
+            down_path if os.path.exists(down_path) else None
+        ))
+
+    migrations.sort(key=lambda m: m.version)
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Duplicate migration versions in {directory}")
+    return migrations
+
+
+def split_statements(sql: str) -> list:
+    """Split a no-transaction migration into individual statements"""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith('--')]
+    return [statement.strip() for statement in '\n'.join(lines).split(';') if statement.strip()]
+
+
+def get_connection():
+    """Open a dedicated connection for migration work"""
+    load_dotenv()
+    return psycopg2.connect(
+        host=os.getenv('DB_HOST'),
+        port=os.getenv('DB_PORT'),
+        database=os.getenv('DB_DATABASE'),
+        user=os.getenv('DB_USERNAME'),
+        password=os.getenv('DB_PASSWORD'),
+        cursor_factory=RealDictCursor
+    )
+
+
+class MigrationRunner:
+    def __init__(self, conn, migrations: list = None):
+        self.conn = conn
+        self.migrations = migrations if migrations is not None else discover_migrations()
+
+    def ensure_state_table(self):
+        with self.conn.cursor() as cur:
+            cur.execute("""
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    version INTEGER PRIMARY KEY,
+                    name VARCHAR(255) NOT NULL,
+                    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+        self.conn.commit()
+
+    def applied_versions(self, create: bool = True) -> set:
+        if create:
+            self.ensure_state_table()
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT to_regclass('schema_migrations') IS NOT NULL AS present")
+            if cur.fetchone()['present']:
+                cur.execute('SELECT version FROM schema_migrations')
+                versions = {row['version'] for row in cur.fetchall()}
+            else:
+                versions = set()
+        self.conn.commit()
+        return versions
+
+    def pending(self, create: bool = True) -> list:
+        applied = self.applied_versions(create)
+        return [m for m in self.migrations if m.version not in applied]
+
+    def status(self) -> list:
+        applied = self.applied_versions()
+        return [(m, m.version in applied) for m in self.migrations]
+
+    def _lock(self):
+        self.conn.autocommit = True
+        with self.conn.cursor() as cur:
+            cur.execute('SELECT pg_advisory_lock(%s)', (MIGRATION_LOCK_ID,))
+
+    def _unlock(self):
+        self.conn.autocommit = True
+        with self.conn.cursor() as cur:
+            cur.execute('SELECT pg_advisory_unlock(%s)', (MIGRATION_LOCK_ID,))
+        self.conn.autocommit = False
+
+    def _run_script(self, path: str, record_sql: str, record_params: tuple):
+        with open(path) as f:
+            sql = f.read()
+
+        if sql.lstrip().startswith(NO_TRANSACTION_MARKER):
+            self.conn.autocommit = True
+            with self.conn.cursor() as cur:
+                for statement in split_statements(sql):
+                    cur.execute(statement)
+                cur.execute(record_sql, record_params)
+            return
+
+        self.conn.autocommit = False
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(sql)
+                cur.execute(record_sql, record_params)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def up(self, target: int = None) -> list:
+        """Apply pending migrations up to and including target"""
+        self.ensure_state_table()
+        self._lock()
+        try:
+            applied = []
+            for migration in self.pending():
+                if target is not None and migration.version > target:
+                    break
+                print(f"Applying {migration.version:04d}_{migration.name}")
+                self._run_script(
+                    migration.up_path,
+                    'INSERT INTO schema_migrations (version, name) VALUES (%s, %s)',
+                    (migration.version, migration.name)
+                )
+                applied.append(migration)
+            return applied
+        finally:
+            self._unlock()
+
+    def down(self, steps: int = 1) -> list:
+        """Roll back the most recently applied migrations"""
+        self.ensure_state_table()
+        self._lock()
+        try:
+            applied = self.applied_versions()
+            to_revert = [m for m in reversed(self.migrations) if m.version in applied][:steps]
+            for migration in to_revert:
+                if not migration.down_path:
+                    raise RuntimeError(f"Migration {migration.version:04d}_{migration.name} has no down script")
+                print(f"Reverting {migration.version:04d}_{migration.name}")
+                self._run_script(
+                    migration.down_path,
+                    'DELETE FROM schema_migrations WHERE version = %s',
+                    (migration.version,)
+                )
+            return to_revert
+        finally:
+            self._unlock()
+
+
+def find_missing_indexes(conn, expected: list = EXPECTED_INDEXES) -> list:
+    """Return (table, columns) pairs with no valid index covering them as a prefix"""
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT t.relname AS table_name,
+                   array_agg(a.attname::text ORDER BY k.ord) AS columns
+            FROM pg_index ix
+            JOIN pg_class t ON t.oid = ix.indrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            CROSS JOIN LATERAL unnest(ix.indkey) WITH ORDINALITY AS k(attnum, ord)
+            JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+            WHERE n.nspname = current_schema()
+              AND ix.indisvalid
+              AND t.relname = ANY(%s)
+            GROUP BY ix.indexrelid, t.relname
+        """, (list({table for table, _ in expected}),))
+        existing = {}
+        for row in cur.fetchall():
+            existing.setdefault(row['table_name'], []).append(tuple(row['columns']))
+    conn.rollback()
+
+    missing = []
+    for table, columns in expected:
+        covered = any(index[:len(columns)] == tuple(columns) for index in existing.get(table, []))
+        if not covered:
+            missing.append((table, columns))
+    return missing
+
+
+def check_schema(conn) -> list:
+    """Index advisor: log a warning for every missing hot-path index or pending migration"""
+    warnings = []
+    for table, columns in find_missing_indexes(conn):
+        column_list = ', '.join(f'"{c}"' for c in columns)
+        warnings.append(f'Missing index on {table} ({column_list}); run `python migrate.py up`')
+
+    # Read-only: the app must not create schema_migrations behind the CLI's back
+    pending = MigrationRunner(conn).pending(create=False)
+    if pending:
+        names = ', '.join(f"{m.version:04d}_{m.name}" for m in pending)
+        warnings.append(f"Pending migrations: {names}")
+
+    for warning in warnings:
+        logger.warning(warning)
+        print(f"⚠️  SCHEMA: {warning}")
+    return warnings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ticket Tracker schema migrations")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('status', help="List applied and pending migrations")
+    up_parser = subparsers.add_parser('up', help="Apply pending migrations")
+    up_parser.add_argument('--to', type=int, default=None, help="Stop after this version")
+    down_parser = subparsers.add_parser('down', help="Roll back applied migrations")
+    down_parser.add_argument('--steps', type=int, default=1, help="Number of migrations to revert")
+    subparsers.add_parser('check', help="Run the index advisor")
+    args = parser.parse_args(argv)
+
+    conn = get_connection()
+    try:
+        runner = MigrationRunner(conn)
+        if args.command == 'status':
+            for migration, applied in runner.status():
+                print(f"[{'x' if applied else ' '}] {migration.version:04d}_{migration.name}")
+        elif args.command == 'up':
+            applied = runner.up(args.to)
+            print(f"Applied {len(applied)} migration(s)")
+        elif args.command == 'down':
+            reverted = runner.down(args.steps)
+            print(f"Reverted {len(reverted)} migration(s)")
+        elif args.command == 'check':
+            if check_schema(conn):
+                return 1
+            print("Schema looks good: all expected indexes present")
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+-- migrate:no-transaction
+DROP INDEX CONCURRENTLY IF EXISTS idx_user_project_project_user;
+DROP INDEX CONCURRENTLY IF EXISTS idx_sessions_user;
+DROP INDEX CONCURRENTLY IF EXISTS idx_sessions_token;
+DROP INDEX CONCURRENTLY IF EXISTS idx_comment_issue_created;
+DROP INDEX CONCURRENTLY IF EXISTS idx_issue_user_user_issue;
+DROP INDEX CONCURRENTLY IF EXISTS idx_issue_project_list_position;
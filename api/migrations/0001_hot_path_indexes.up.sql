@@ -0,0 +1,27 @@
+-- migrate:no-transaction
+-- Composite indexes for the hot queries in main.py. Built CONCURRENTLY so
+-- applying this on a live database does not block writes.
+-- issue_user (issue_id, user_id), user_project (user_id, project_id) and
+-- "user" (email) are already covered by their UNIQUE constraints.
+
+-- Board load and issue listings: WHERE "projectId" = ? ORDER BY "listPosition", id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_issue_project_list_position
+    ON issue ("projectId", "listPosition", id);
+
+-- Reverse assignee lookups ("issues assigned to user", user deletion cascades)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_issue_user_user_issue
+    ON issue_user (user_id, issue_id);
+
+-- Issue modal comments: WHERE "issueId" = ? ORDER BY created_at
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_comment_issue_created
+    ON comment ("issueId", "created_at", id);
+
+-- Logout and session cleanup
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sessions_token
+    ON sessions (token);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sessions_user
+    ON sessions (user_id);
+
+-- Project member listings: WHERE project_id = ?
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_project_project_user
+    ON user_project (project_id, user_id);
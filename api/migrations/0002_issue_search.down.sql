@@ -0,0 +1,3 @@
+DROP INDEX IF EXISTS idx_issue_title_trgm;
+DROP INDEX IF EXISTS idx_issue_search_vector;
+ALTER TABLE issue DROP COLUMN IF EXISTS search_vector;
@@ -0,0 +1,18 @@
+-- Full-text search over issue title and description. The tsvector is a
+-- generated column, so every INSERT/UPDATE (create_issue, update_issue, bulk
+-- paths) keeps it and its GIN index current without application code.
+-- Adding a STORED generated column rewrites the issue table once.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE issue ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(NULLIF("descriptionText", ''), description, '')), 'B')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_issue_search_vector
+    ON issue USING gin (search_vector);
+
+-- Typo-tolerant title matching (similarity / %) and indexed ILIKE substring search
+CREATE INDEX IF NOT EXISTS idx_issue_title_trgm
+    ON issue USING gin (title gin_trgm_ops);
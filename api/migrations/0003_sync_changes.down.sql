@@ -0,0 +1,11 @@
+DROP TRIGGER IF EXISTS issue_user_sync_delete ON issue_user;
+DROP TRIGGER IF EXISTS issue_user_sync_insert ON issue_user;
+DROP TRIGGER IF EXISTS user_project_sync_tombstone ON user_project;
+DROP TRIGGER IF EXISTS issue_sync_tombstone ON issue;
+DROP FUNCTION IF EXISTS sync_touch_assigned_issues();
+DROP FUNCTION IF EXISTS sync_member_tombstones();
+DROP FUNCTION IF EXISTS sync_issue_tombstones();
+DROP INDEX IF EXISTS idx_user_project_project_updated;
+ALTER TABLE user_project DROP COLUMN IF EXISTS updated_at;
+DROP INDEX IF EXISTS idx_issue_project_updated;
+DROP TABLE IF EXISTS sync_tombstone;
@@ -0,0 +1,78 @@
+-- Delta sync for GET /project/{id}/changes: updated_at drives upserts and
+-- sync_tombstone records deletions. Deletions are captured by triggers so
+-- cascades (project or user deletion) produce tombstones as well.
+
+CREATE TABLE IF NOT EXISTS sync_tombstone (
+    id BIGSERIAL PRIMARY KEY,
+    project_id INTEGER NOT NULL,
+    entity VARCHAR(32) NOT NULL,
+    entity_id INTEGER NOT NULL,
+    deleted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_sync_tombstone_project_deleted
+    ON sync_tombstone (project_id, deleted_at);
+
+CREATE INDEX IF NOT EXISTS idx_issue_project_updated
+    ON issue ("projectId", "updated_at");
+
+-- Membership rows need their own change timestamp (role updates)
+ALTER TABLE user_project ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+UPDATE user_project SET updated_at = COALESCE(joined_at, updated_at);
+
+CREATE INDEX IF NOT EXISTS idx_user_project_project_updated
+    ON user_project (project_id, updated_at);
+
+CREATE OR REPLACE FUNCTION sync_issue_tombstones() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO sync_tombstone (project_id, entity, entity_id)
+    SELECT "projectId", 'issue', id FROM deleted_rows WHERE "projectId" IS NOT NULL;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_member_tombstones() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO sync_tombstone (project_id, entity, entity_id)
+    SELECT project_id, 'member', user_id FROM deleted_rows;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Assignment changes surface as a changed issue carrying its new userIds
+CREATE OR REPLACE FUNCTION sync_touch_assigned_issues() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        UPDATE issue SET "updated_at" = CURRENT_TIMESTAMP
+        WHERE id IN (SELECT DISTINCT issue_id FROM changed_rows_old);
+    ELSE
+        UPDATE issue SET "updated_at" = CURRENT_TIMESTAMP
+        WHERE id IN (SELECT DISTINCT issue_id FROM changed_rows_new);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS issue_sync_tombstone ON issue;
+CREATE TRIGGER issue_sync_tombstone
+    AFTER DELETE ON issue
+    REFERENCING OLD TABLE AS deleted_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sync_issue_tombstones();
+
+DROP TRIGGER IF EXISTS user_project_sync_tombstone ON user_project;
+CREATE TRIGGER user_project_sync_tombstone
+    AFTER DELETE ON user_project
+    REFERENCING OLD TABLE AS deleted_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sync_member_tombstones();
+
+DROP TRIGGER IF EXISTS issue_user_sync_insert ON issue_user;
+CREATE TRIGGER issue_user_sync_insert
+    AFTER INSERT ON issue_user
+    REFERENCING NEW TABLE AS changed_rows_new
+    FOR EACH STATEMENT EXECUTE FUNCTION sync_touch_assigned_issues();
+
+DROP TRIGGER IF EXISTS issue_user_sync_delete ON issue_user;
+CREATE TRIGGER issue_user_sync_delete
+    AFTER DELETE ON issue_user
+    REFERENCING OLD TABLE AS changed_rows_old
+    FOR EACH STATEMENT EXECUTE FUNCTION sync_touch_assigned_issues();
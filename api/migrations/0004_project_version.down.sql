@@ -0,0 +1,17 @@
+DROP TRIGGER IF EXISTS user_project_version ON "user";
+DROP TRIGGER IF EXISTS user_project_project_version_delete ON user_project;
+DROP TRIGGER IF EXISTS user_project_project_version_update ON user_project;
+DROP TRIGGER IF EXISTS user_project_project_version_insert ON user_project;
+DROP TRIGGER IF EXISTS comment_project_version_delete ON comment;
+DROP TRIGGER IF EXISTS comment_project_version_update ON comment;
+DROP TRIGGER IF EXISTS comment_project_version_insert ON comment;
+DROP TRIGGER IF EXISTS issue_project_version_delete ON issue;
+DROP TRIGGER IF EXISTS issue_project_version_update ON issue;
+DROP TRIGGER IF EXISTS issue_project_version_insert ON issue;
+DROP TRIGGER IF EXISTS project_version_self ON project;
+DROP FUNCTION IF EXISTS project_version_from_user();
+DROP FUNCTION IF EXISTS project_version_from_member();
+DROP FUNCTION IF EXISTS project_version_from_comment();
+DROP FUNCTION IF EXISTS project_version_from_issue();
+DROP FUNCTION IF EXISTS project_version_self();
+ALTER TABLE project DROP COLUMN IF EXISTS version;
@@ -0,0 +1,147 @@
+-- project.version: bumped by every write that changes what a project's reads
+-- return, so GET handlers can answer If-None-Match from this one row. The
+-- triggers are statement-level: a bulk write bumps each project once.
+
+ALTER TABLE project ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 1;
+
+-- Edits to the project row itself
+CREATE OR REPLACE FUNCTION project_version_self() RETURNS trigger AS $$
+BEGIN
+    IF NEW.version = OLD.version THEN
+        NEW.version := OLD.version + 1;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION project_version_from_issue() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE project SET version = version + 1
+        WHERE id IN (SELECT "projectId" FROM new_rows);
+    ELSIF TG_OP = 'UPDATE' THEN
+        -- Both sides: an issue moved between projects changes both
+        UPDATE project SET version = version + 1
+        WHERE id IN (SELECT "projectId" FROM new_rows UNION SELECT "projectId" FROM old_rows);
+    ELSE
+        UPDATE project SET version = version + 1
+        WHERE id IN (SELECT "projectId" FROM old_rows);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION project_version_from_comment() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE project SET version = version + 1
+        WHERE id IN (SELECT i."projectId" FROM issue i WHERE i.id IN (SELECT "issueId" FROM new_rows));
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE project SET version = version + 1
+        WHERE id IN (SELECT i."projectId" FROM issue i
+                     WHERE i.id IN (SELECT "issueId" FROM new_rows UNION SELECT "issueId" FROM old_rows));
+    ELSE
+        UPDATE project SET version = version + 1
+        WHERE id IN (SELECT i."projectId" FROM issue i WHERE i.id IN (SELECT "issueId" FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION project_version_from_member() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE project SET version = version + 1
+        WHERE id IN (SELECT project_id FROM new_rows);
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE project SET version = version + 1
+        WHERE id IN (SELECT project_id FROM new_rows UNION SELECT project_id FROM old_rows);
+    ELSE
+        UPDATE project SET version = version + 1
+        WHERE id IN (SELECT project_id FROM old_rows);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Boards and member lists embed name, email and avatar of their users
+CREATE OR REPLACE FUNCTION project_version_from_user() RETURNS trigger AS $$
+BEGIN
+    UPDATE project SET version = version + 1
+    WHERE id IN (
+        SELECT up.project_id
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        JOIN user_project up ON up.user_id = n.id
+        WHERE (n.name, n.email, n."avatarUrl") IS DISTINCT FROM (o.name, o.email, o."avatarUrl")
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS project_version_self ON project;
+CREATE TRIGGER project_version_self
+    BEFORE UPDATE ON project
+    FOR EACH ROW EXECUTE FUNCTION project_version_self();
+
+-- Assignment changes need no trigger of their own: issue_user_sync_* (0003)
+-- touch the issue row, which fires issue_project_version_update.
+DROP TRIGGER IF EXISTS issue_project_version_insert ON issue;
+CREATE TRIGGER issue_project_version_insert
+    AFTER INSERT ON issue
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_version_from_issue();
+
+DROP TRIGGER IF EXISTS issue_project_version_update ON issue;
+CREATE TRIGGER issue_project_version_update
+    AFTER UPDATE ON issue
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_version_from_issue();
+
+DROP TRIGGER IF EXISTS issue_project_version_delete ON issue;
+CREATE TRIGGER issue_project_version_delete
+    AFTER DELETE ON issue
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_version_from_issue();
+
+DROP TRIGGER IF EXISTS comment_project_version_insert ON comment;
+CREATE TRIGGER comment_project_version_insert
+    AFTER INSERT ON comment
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_version_from_comment();
+
+DROP TRIGGER IF EXISTS comment_project_version_update ON comment;
+CREATE TRIGGER comment_project_version_update
+    AFTER UPDATE ON comment
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_version_from_comment();
+
+DROP TRIGGER IF EXISTS comment_project_version_delete ON comment;
+CREATE TRIGGER comment_project_version_delete
+    AFTER DELETE ON comment
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_version_from_comment();
+
+DROP TRIGGER IF EXISTS user_project_project_version_insert ON user_project;
+CREATE TRIGGER user_project_project_version_insert
+    AFTER INSERT ON user_project
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_version_from_member();
+
+DROP TRIGGER IF EXISTS user_project_project_version_update ON user_project;
+CREATE TRIGGER user_project_project_version_update
+    AFTER UPDATE ON user_project
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_version_from_member();
+
+DROP TRIGGER IF EXISTS user_project_project_version_delete ON user_project;
+CREATE TRIGGER user_project_project_version_delete
+    AFTER DELETE ON user_project
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_version_from_member();
+
+DROP TRIGGER IF EXISTS user_project_version ON "user";
+CREATE TRIGGER user_project_version
+    AFTER UPDATE ON "user"
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_version_from_user();
@@ -0,0 +1,5 @@
+-- migrate:no-transaction
+-- Card moves look up their neighbours inside one board column:
+-- WHERE "projectId" = ? AND status = ? ORDER BY "listPosition", id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_issue_project_status_position
+    ON issue ("projectId", status, "listPosition", id);
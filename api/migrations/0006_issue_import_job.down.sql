@@ -0,0 +1 @@
+DROP TABLE IF EXISTS issue_import_job;
@@ -0,0 +1,20 @@
+-- Bulk imports run in a background task; their progress and validation
+-- errors live here so any worker can answer GET /imports/{id}.
+
+CREATE TABLE IF NOT EXISTS issue_import_job (
+    id BIGSERIAL PRIMARY KEY,
+    project_id INTEGER NOT NULL REFERENCES project(id) ON DELETE CASCADE,
+    created_by INTEGER REFERENCES "user"(id) ON DELETE SET NULL,
+    format VARCHAR(10) NOT NULL,
+    -- queued, copying, validating, merging, done, failed
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    rows_read INTEGER NOT NULL DEFAULT 0,
+    rows_imported INTEGER NOT NULL DEFAULT 0,
+    errors JSONB,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_issue_import_job_project
+    ON issue_import_job (project_id, created_at);
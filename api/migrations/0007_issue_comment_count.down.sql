@@ -0,0 +1,5 @@
+DROP TRIGGER IF EXISTS comment_count_delete ON comment;
+DROP TRIGGER IF EXISTS comment_count_update ON comment;
+DROP TRIGGER IF EXISTS comment_count_insert ON comment;
+DROP FUNCTION IF EXISTS issue_comment_count();
+ALTER TABLE issue DROP COLUMN IF EXISTS comment_count;
@@ -0,0 +1,61 @@
+-- issue.comment_count: maintained by statement-level triggers on comment, so
+-- the issue modal can show the total while loading one page of comments.
+
+-- Hold comment writes while the triggers are installed and the counts backfilled
+LOCK TABLE comment IN SHARE MODE;
+
+ALTER TABLE issue ADD COLUMN IF NOT EXISTS comment_count INTEGER NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION issue_comment_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE issue i SET comment_count = i.comment_count + d.delta
+        FROM (SELECT "issueId", COUNT(*) AS delta FROM new_rows GROUP BY "issueId") d
+        WHERE i.id = d."issueId";
+    ELSIF TG_OP = 'UPDATE' THEN
+        -- Only comments moved to another issue change any count
+        UPDATE issue i SET comment_count = i.comment_count + d.delta
+        FROM (
+            SELECT issue_id, SUM(delta) AS delta
+            FROM (
+                SELECT n."issueId" AS issue_id, 1 AS delta
+                FROM new_rows n JOIN old_rows o ON o.id = n.id
+                WHERE n."issueId" IS DISTINCT FROM o."issueId"
+                UNION ALL
+                SELECT o."issueId", -1
+                FROM new_rows n JOIN old_rows o ON o.id = n.id
+                WHERE n."issueId" IS DISTINCT FROM o."issueId"
+            ) moved
+            GROUP BY issue_id
+        ) d
+        WHERE i.id = d.issue_id AND d.delta <> 0;
+    ELSE
+        UPDATE issue i SET comment_count = GREATEST(i.comment_count - d.delta, 0)
+        FROM (SELECT "issueId", COUNT(*) AS delta FROM old_rows GROUP BY "issueId") d
+        WHERE i.id = d."issueId";
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS comment_count_insert ON comment;
+CREATE TRIGGER comment_count_insert
+    AFTER INSERT ON comment
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION issue_comment_count();
+
+DROP TRIGGER IF EXISTS comment_count_update ON comment;
+CREATE TRIGGER comment_count_update
+    AFTER UPDATE ON comment
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION issue_comment_count();
+
+DROP TRIGGER IF EXISTS comment_count_delete ON comment;
+CREATE TRIGGER comment_count_delete
+    AFTER DELETE ON comment
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION issue_comment_count();
+
+UPDATE issue i SET comment_count = c.total
+FROM (SELECT "issueId", COUNT(*) AS total FROM comment GROUP BY "issueId") c
+WHERE i.id = c."issueId" AND i.comment_count <> c.total;
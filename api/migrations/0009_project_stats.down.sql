@@ -0,0 +1,5 @@
+DROP TRIGGER IF EXISTS project_stats_delete ON issue;
+DROP TRIGGER IF EXISTS project_stats_update ON issue;
+DROP TRIGGER IF EXISTS project_stats_insert ON issue;
+DROP FUNCTION IF EXISTS project_stats_from_issue();
+DROP TABLE IF EXISTS project_stats;
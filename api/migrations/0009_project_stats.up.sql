@@ -0,0 +1,98 @@
+-- project_stats: per-project, per-status issue counts and time totals,
+-- maintained by statement-level triggers on issue so dashboards and the
+-- project list never aggregate the issue table. Every writer (single edits,
+-- bulk updates, imports, moves) is covered without application code.
+
+-- Hold issue writes while the triggers are installed and the totals backfilled
+LOCK TABLE issue IN SHARE MODE;
+
+CREATE TABLE IF NOT EXISTS project_stats (
+    project_id INTEGER NOT NULL REFERENCES project(id) ON DELETE CASCADE,
+    status VARCHAR(50) NOT NULL,
+    issue_count INTEGER NOT NULL DEFAULT 0,
+    estimate BIGINT NOT NULL DEFAULT 0,
+    time_spent BIGINT NOT NULL DEFAULT 0,
+    time_remaining BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (project_id, status)
+);
+
+CREATE OR REPLACE FUNCTION project_stats_from_issue() RETURNS trigger AS $$
+DECLARE
+    deltas text;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        deltas := $q$
+            SELECT n."projectId" AS project_id, COALESCE(n.status, 'backlog') AS status, 1 AS issues,
+                   COALESCE(n.estimate, 0) AS estimate, COALESCE(n."timeSpent", 0) AS time_spent,
+                   COALESCE(n."timeRemaining", 0) AS time_remaining
+            FROM new_rows n
+        $q$;
+    ELSIF TG_OP = 'UPDATE' THEN
+        -- Card moves and title edits change no totals: only rows whose project,
+        -- status or time fields changed are counted out of the old and into the new
+        deltas := $q$
+            SELECT n."projectId" AS project_id, COALESCE(n.status, 'backlog') AS status, 1 AS issues,
+                   COALESCE(n.estimate, 0) AS estimate, COALESCE(n."timeSpent", 0) AS time_spent,
+                   COALESCE(n."timeRemaining", 0) AS time_remaining
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE (n."projectId", n.status, n.estimate, n."timeSpent", n."timeRemaining")
+                  IS DISTINCT FROM (o."projectId", o.status, o.estimate, o."timeSpent", o."timeRemaining")
+            UNION ALL
+            SELECT o."projectId", COALESCE(o.status, 'backlog'), -1,
+                   -COALESCE(o.estimate, 0), -COALESCE(o."timeSpent", 0), -COALESCE(o."timeRemaining", 0)
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE (n."projectId", n.status, n.estimate, n."timeSpent", n."timeRemaining")
+                  IS DISTINCT FROM (o."projectId", o.status, o.estimate, o."timeSpent", o."timeRemaining")
+        $q$;
+    ELSE
+        deltas := $q$
+            SELECT o."projectId" AS project_id, COALESCE(o.status, 'backlog') AS status, -1 AS issues,
+                   -COALESCE(o.estimate, 0) AS estimate, -COALESCE(o."timeSpent", 0) AS time_spent,
+                   -COALESCE(o."timeRemaining", 0) AS time_remaining
+            FROM old_rows o
+        $q$;
+    END IF;
+
+    -- Transition tables are visible to EXECUTE, so one upsert serves all three operations
+    EXECUTE format($q$
+        INSERT INTO project_stats AS s (project_id, status, issue_count, estimate, time_spent, time_remaining)
+        SELECT d.project_id, d.status, SUM(d.issues), SUM(d.estimate), SUM(d.time_spent), SUM(d.time_remaining)
+        FROM (%s) d
+        -- Issues removed by a cascading project delete have nothing left to count for
+        WHERE d.project_id IN (SELECT id FROM project)
+        GROUP BY d.project_id, d.status
+        ON CONFLICT (project_id, status) DO UPDATE SET
+            issue_count = s.issue_count + EXCLUDED.issue_count,
+            estimate = s.estimate + EXCLUDED.estimate,
+            time_spent = s.time_spent + EXCLUDED.time_spent,
+            time_remaining = s.time_remaining + EXCLUDED.time_remaining
+    $q$, deltas);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS project_stats_insert ON issue;
+CREATE TRIGGER project_stats_insert
+    AFTER INSERT ON issue
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_stats_from_issue();
+
+DROP TRIGGER IF EXISTS project_stats_update ON issue;
+CREATE TRIGGER project_stats_update
+    AFTER UPDATE ON issue
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_stats_from_issue();
+
+DROP TRIGGER IF EXISTS project_stats_delete ON issue;
+CREATE TRIGGER project_stats_delete
+    AFTER DELETE ON issue
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_stats_from_issue();
+
+DELETE FROM project_stats;
+INSERT INTO project_stats (project_id, status, issue_count, estimate, time_spent, time_remaining)
+SELECT i."projectId", COALESCE(i.status, 'backlog'), COUNT(*),
+       COALESCE(SUM(i.estimate), 0), COALESCE(SUM(i."timeSpent"), 0), COALESCE(SUM(i."timeRemaining"), 0)
+FROM issue i
+WHERE i."projectId" IS NOT NULL
+GROUP BY i."projectId", COALESCE(i.status, 'backlog');
@@ -0,0 +1,4 @@
+DROP FUNCTION IF EXISTS issue_event_drop_partitions(INTEGER);
+DROP FUNCTION IF EXISTS issue_event_create_partitions(INTEGER);
+-- Drops every partition with it
+DROP TABLE IF EXISTS issue_event;
@@ -0,0 +1,78 @@
+-- issue_event: append-only, field-level history of issues (status, priority,
+-- estimate, listPosition, assignees), written by the API in the transaction
+-- that makes the change. Range-partitioned by month on created_at so
+-- retention drops whole partitions instead of deleting rows.
+
+CREATE TABLE IF NOT EXISTS issue_event (
+    id BIGSERIAL,
+    issue_id INTEGER NOT NULL,
+    project_id INTEGER NOT NULL,
+    actor_id INTEGER,
+    field VARCHAR(32) NOT NULL,
+    old_value JSONB,
+    new_value JSONB,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    -- The partition key has to be part of every unique constraint
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- History is kept after an issue is deleted, so no foreign keys: both
+-- lookups are keyset scans newest first
+CREATE INDEX IF NOT EXISTS idx_issue_event_issue
+    ON issue_event (issue_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_issue_event_project
+    ON issue_event (project_id, created_at, id);
+
+-- Catches rows for a month whose partition was not created in time
+CREATE TABLE IF NOT EXISTS issue_event_default PARTITION OF issue_event DEFAULT;
+
+-- Create the partitions of the current month and the next months_ahead
+CREATE OR REPLACE FUNCTION issue_event_create_partitions(months_ahead INTEGER) RETURNS void AS $$
+DECLARE
+    month_start DATE;
+    month_end DATE;
+    partition_name TEXT;
+BEGIN
+    FOR n IN 0..months_ahead LOOP
+        month_start := (date_trunc('month', CURRENT_DATE) + make_interval(months => n))::date;
+        month_end := (month_start + INTERVAL '1 month')::date;
+        partition_name := 'issue_event_' || to_char(month_start, 'YYYY_MM');
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+
+        -- A month's rows must leave the default partition before the month can be attached
+        EXECUTE format('CREATE TABLE %I (LIKE issue_event INCLUDING DEFAULTS)', partition_name);
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM issue_event_default WHERE created_at >= %L AND created_at < %L RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            month_start, month_end, partition_name
+        );
+        EXECUTE format(
+            'ALTER TABLE issue_event ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+            partition_name, month_start, month_end
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Drop the monthly partitions older than keep_months before the current month
+CREATE OR REPLACE FUNCTION issue_event_drop_partitions(keep_months INTEGER) RETURNS SETOF TEXT AS $$
+DECLARE
+    cutoff DATE := (date_trunc('month', CURRENT_DATE) - make_interval(months => keep_months))::date;
+    partition_name TEXT;
+BEGIN
+    FOR partition_name IN
+        SELECT c.relname::text
+        FROM pg_inherits inh
+        JOIN pg_class c ON c.oid = inh.inhrelid
+        WHERE inh.inhparent = 'issue_event'::regclass
+          AND c.relname ~ '^issue_event_[0-9]{4}_[0-9]{2}$'
+          AND to_date(right(c.relname, 7), 'YYYY_MM') < cutoff
+        ORDER BY c.relname
+    LOOP
+        EXECUTE format('DROP TABLE %I', partition_name);
+        RETURN NEXT partition_name;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT issue_event_create_partitions(3);
@@ -0,0 +1,6 @@
+DROP TRIGGER IF EXISTS sessions_principal_invalidation_delete ON sessions;
+DROP TRIGGER IF EXISTS user_principal_invalidation_delete ON "user";
+DROP TRIGGER IF EXISTS user_principal_invalidation_update ON "user";
+DROP FUNCTION IF EXISTS principal_invalidation_from_session();
+DROP FUNCTION IF EXISTS principal_invalidation_from_user();
+DROP FUNCTION IF EXISTS notify_cache_invalidation(TEXT, INTEGER[]);
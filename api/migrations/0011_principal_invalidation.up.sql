@@ -0,0 +1,62 @@
+-- Cross-worker invalidation of cached principals: every change to who a user
+-- is (account edits, role changes, deletion) and every session deletion
+-- (logout, re-login, account removal) is announced on cache_invalidation when
+-- its transaction commits. Each worker's LISTEN connection applies it to its
+-- own principal cache (see realtime.BoardBroadcaster.register_cache).
+
+-- Send {"users": [...]} for a set of user ids, or {"all": true} when the list
+-- would not fit in a NOTIFY payload
+CREATE OR REPLACE FUNCTION notify_cache_invalidation(kind TEXT, ids INTEGER[]) RETURNS void AS $$
+BEGIN
+    IF ids IS NULL OR cardinality(ids) = 0 THEN
+        RETURN;
+    END IF;
+    IF cardinality(ids) > 500 THEN
+        PERFORM pg_notify('cache_invalidation', '{"all": true}');
+    ELSE
+        PERFORM pg_notify('cache_invalidation', json_build_object(kind, ids)::text);
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION principal_invalidation_from_user() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        PERFORM notify_cache_invalidation('users', ARRAY(
+            SELECT DISTINCT o.id
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE (n.email, n.name, n.role, n."avatarUrl") IS DISTINCT FROM (o.email, o.name, o.role, o."avatarUrl")
+        ));
+    ELSE
+        PERFORM notify_cache_invalidation('users', ARRAY(SELECT DISTINCT id FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION principal_invalidation_from_session() RETURNS trigger AS $$
+BEGIN
+    PERFORM notify_cache_invalidation('users', ARRAY(
+        SELECT DISTINCT user_id FROM old_rows WHERE user_id IS NOT NULL
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS user_principal_invalidation_update ON "user";
+CREATE TRIGGER user_principal_invalidation_update
+    AFTER UPDATE ON "user"
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION principal_invalidation_from_user();
+
+DROP TRIGGER IF EXISTS user_principal_invalidation_delete ON "user";
+CREATE TRIGGER user_principal_invalidation_delete
+    AFTER DELETE ON "user"
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION principal_invalidation_from_user();
+
+DROP TRIGGER IF EXISTS sessions_principal_invalidation_delete ON sessions;
+CREATE TRIGGER sessions_principal_invalidation_delete
+    AFTER DELETE ON sessions
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION principal_invalidation_from_session();
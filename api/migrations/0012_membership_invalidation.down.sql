@@ -0,0 +1,4 @@
+DROP TRIGGER IF EXISTS user_project_membership_invalidation_delete ON user_project;
+DROP TRIGGER IF EXISTS user_project_membership_invalidation_update ON user_project;
+DROP TRIGGER IF EXISTS user_project_membership_invalidation_insert ON user_project;
+DROP FUNCTION IF EXISTS membership_invalidation_from_member();
@@ -0,0 +1,37 @@
+-- Cross-worker invalidation of the project membership index (acl.ProjectACL):
+-- every membership write (add, role change, removal, including cascades from
+-- project or user deletion) announces its projects on cache_invalidation at
+-- commit. notify_cache_invalidation comes from 0011.
+
+CREATE OR REPLACE FUNCTION membership_invalidation_from_member() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM notify_cache_invalidation('projects', ARRAY(SELECT DISTINCT project_id FROM new_rows));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM notify_cache_invalidation('projects', ARRAY(
+            SELECT project_id FROM new_rows UNION SELECT project_id FROM old_rows
+        ));
+    ELSE
+        PERFORM notify_cache_invalidation('projects', ARRAY(SELECT DISTINCT project_id FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS user_project_membership_invalidation_insert ON user_project;
+CREATE TRIGGER user_project_membership_invalidation_insert
+    AFTER INSERT ON user_project
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION membership_invalidation_from_member();
+
+DROP TRIGGER IF EXISTS user_project_membership_invalidation_update ON user_project;
+CREATE TRIGGER user_project_membership_invalidation_update
+    AFTER UPDATE ON user_project
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION membership_invalidation_from_member();
+
+DROP TRIGGER IF EXISTS user_project_membership_invalidation_delete ON user_project;
+CREATE TRIGGER user_project_membership_invalidation_delete
+    AFTER DELETE ON user_project
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION membership_invalidation_from_member();
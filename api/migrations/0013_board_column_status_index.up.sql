@@ -0,0 +1,5 @@
+-- migrate:no-transaction
+-- Board columns group cards without a status into the backlog column:
+-- WHERE "projectId" = ? AND COALESCE(NULLIF(status, ''), 'backlog') = ? ORDER BY "listPosition", id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_issue_project_column_position
+    ON issue ("projectId", (COALESCE(NULLIF(status, ''), 'backlog')), "listPosition", id);
@@ -0,0 +1,50 @@
+-- Restore the 0010 definitions, without the advisory lock
+
+-- Create the partitions of the current month and the next months_ahead
+CREATE OR REPLACE FUNCTION issue_event_create_partitions(months_ahead INTEGER) RETURNS void AS $$
+DECLARE
+    month_start DATE;
+    month_end DATE;
+    partition_name TEXT;
+BEGIN
+    FOR n IN 0..months_ahead LOOP
+        month_start := (date_trunc('month', CURRENT_DATE) + make_interval(months => n))::date;
+        month_end := (month_start + INTERVAL '1 month')::date;
+        partition_name := 'issue_event_' || to_char(month_start, 'YYYY_MM');
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+
+        -- A month's rows must leave the default partition before the month can be attached
+        EXECUTE format('CREATE TABLE %I (LIKE issue_event INCLUDING DEFAULTS)', partition_name);
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM issue_event_default WHERE created_at >= %L AND created_at < %L RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            month_start, month_end, partition_name
+        );
+        EXECUTE format(
+            'ALTER TABLE issue_event ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+            partition_name, month_start, month_end
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Drop the monthly partitions older than keep_months before the current month
+CREATE OR REPLACE FUNCTION issue_event_drop_partitions(keep_months INTEGER) RETURNS SETOF TEXT AS $$
+DECLARE
+    cutoff DATE := (date_trunc('month', CURRENT_DATE) - make_interval(months => keep_months))::date;
+    partition_name TEXT;
+BEGIN
+    FOR partition_name IN
+        SELECT c.relname::text
+        FROM pg_inherits inh
+        JOIN pg_class c ON c.oid = inh.inhrelid
+        WHERE inh.inhparent = 'issue_event'::regclass
+          AND c.relname ~ '^issue_event_[0-9]{4}_[0-9]{2}$'
+          AND to_date(right(c.relname, 7), 'YYYY_MM') < cutoff
+        ORDER BY c.relname
+    LOOP
+        EXECUTE format('DROP TABLE %I', partition_name);
+        RETURN NEXT partition_name;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,149 @@
+"""Board card ordering: fractional listPosition values kept healthy server-side.
+
+A move writes one row: the midpoint between the new neighbours' positions.
+Repeated inserts into the same gap halve it each time, so once a gap falls
+below MIN_POSITION_GAP the column is scheduled for a rebalance, which spreads
+its cards POSITION_STEP apart again. Rebalancing runs after the response has
+been sent and never inside the request that triggered it.
+"""
+import os
+import threading
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from realtime import publish
+
+load_dotenv()
+
+POSITION_STEP = 1024.0
+MIN_POSITION_GAP = float(os.getenv('LIST_POSITION_MIN_GAP', '1e-6'))
+
+# Arbitrary pg_advisory_xact_lock namespace for column rebalances
+REBALANCE_LOCK_NAMESPACE = 72_410_014
+
+
+def position_between(before: Optional[float], after: Optional[float]) -> float:
+    """listPosition for a card placed between two neighbours (None: column edge)"""
+    if before is None and after is None:
+        return POSITION_STEP
+    if before is None:
+        return after - POSITION_STEP
+    if after is None:
+        return before + POSITION_STEP
+    return before + (after - before) / 2
+
+
+def gap_exhausted(before: Optional[float], after: Optional[float]) -> bool:
+    """True when the gap between two neighbours is too small to keep splitting"""
+    if before is None or after is None:
+        return False
+    return after - before < MIN_POSITION_GAP
+
+
+def neighbour_positions(cur, project_id: int, status: str, issue_id: int,
+                        prev_id: Optional[int], next_id: Optional[int]):
+    """Positions of the cards that will sit directly above and below a moved card.
+
+    The client names one anchor card (the one above, else the one below); the
+    other neighbour is looked up here so a stale or filtered client view can
+    never place a card across a card it did not see. Returns None when the
+    anchor is not in the target column.
+    """
+    def anchor_position(anchor_id):
+        cur.execute("""
+            SELECT "listPosition" FROM issue
+            WHERE id = %s AND "projectId" = %s AND status = %s AND id <> %s
+        """, (anchor_id, project_id, status, issue_id))
+        row = cur.fetchone()
+        return row['listPosition'] if row else None
+
+    if prev_id is not None:
+        before = anchor_position(prev_id)
+        if before is None:
+            return None
+        cur.execute("""
+            SELECT "listPosition" FROM issue
+            WHERE "projectId" = %s AND status = %s AND id <> %s
+              AND ("listPosition", id) > (%s, %s)
+            ORDER BY "listPosition", id
+            LIMIT 1
+        """, (project_id, status, issue_id, before, prev_id))
+        row = cur.fetchone()
+        return float(before), float(row['listPosition']) if row else None
+
+    if next_id is not None:
+        after = anchor_position(next_id)
+        if after is None:
+            return None
+        cur.execute("""
+            SELECT "listPosition" FROM issue
+            WHERE "projectId" = %s AND status = %s AND id <> %s
+              AND ("listPosition", id) < (%s, %s)
+            ORDER BY "listPosition" DESC, id DESC
+            LIMIT 1
+        """, (project_id, status, issue_id, after, next_id))
+        row = cur.fetchone()
+        return (float(row['listPosition']) if row else None), float(after)
+
+    # No anchor: append to the end of the column
+    cur.execute("""
+        SELECT MAX("listPosition") AS last_position FROM issue
+        WHERE "projectId" = %s AND status = %s AND id <> %s
+    """, (project_id, status, issue_id))
+    last_position = cur.fetchone()['last_position']
+    return (float(last_position) if last_position is not None else None), None
+
+
+def rebalance_column(conn, project_id: int, status: str) -> int:
+    """Respace one board column POSITION_STEP apart, keeping its order; returns rows moved"""
+    with conn.cursor() as cur:
+        # One rebalance per column at a time across all workers; a second request just skips
+        cur.execute('SELECT pg_try_advisory_xact_lock(%s, hashtext(%s)) AS locked',
+                    (REBALANCE_LOCK_NAMESPACE, f"{project_id}:{status}"))
+        if not cur.fetchone()['locked']:
+            conn.rollback()
+            return 0
+
+        cur.execute("""
+            UPDATE issue i
+            SET "listPosition" = r.position, "updated_at" = NOW()
+            FROM (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY "listPosition", id) * %s AS position
+                FROM issue
+                WHERE "projectId" = %s AND status = %s
+            ) r
+            WHERE i.id = r.id AND i."listPosition" IS DISTINCT FROM r.position
+        """, (POSITION_STEP, project_id, status))
+        moved = cur.rowcount
+        if moved:
+            publish(cur, project_id, "column.rebalanced", status=status)
+    conn.commit()
+    return moved
+
+
+class RebalanceScheduler:
+    """Deduplicates rebalance jobs so a burst of moves into one gap queues one job"""
+
+    def __init__(self):
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def claim(self, project_id: int, status: str) -> bool:
+        """Mark a column as scheduled; False if a job for it is already pending"""
+        with self._lock:
+            if (project_id, status) in self._pending:
+                return False
+            self._pending.add((project_id, status))
+            return True
+
+    def release(self, project_id: int, status: str):
+        with self._lock:
+            self._pending.discard((project_id, status))
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+
+rebalance_scheduler = RebalanceScheduler()
@@ -0,0 +1,41 @@
+import json
+import base64
+import binascii
+from typing import Optional
+
+from fastapi import HTTPException
+
+
+def encode_cursor(values: list) -> str:
+    """Opaque keyset cursor for the sort key of the last row on a page"""
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[list]:
+    """Decode a cursor produced by encode_cursor, rejecting anything malformed with a 400"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def clamp_limit(limit: int, maximum: int) -> int:
+    """Keep a requested page size within 1..maximum"""
+    return max(1, min(limit, maximum))
+
+
+class SqlParams:
+    """Collects positional asyncpg parameters while a query is assembled"""
+
+    def __init__(self, *initial):
+        self.values = list(initial)
+
+    def add(self, value) -> str:
+        self.values.append(value)
+        return f"${len(self.values)}"
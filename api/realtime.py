@@ -0,0 +1,263 @@
+"""Per-project push channel for board events.
+
+Writers call publish() / apublish() inside the transaction that makes the
+change: Postgres delivers the NOTIFY to every worker's listener when that
+transaction commits, and never for a rollback. Each worker keeps a single
+LISTEN connection and fans events out to the SSE streams of its own clients,
+so any number of uvicorn workers see every event.
+
+The same connection listens on INVALIDATION_CHANNEL, where database triggers
+announce writes that per-worker caches must forget (see register_cache).
+"""
+import os
+import json
+import time
+import asyncio
+import logging
+
+import asyncpg
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = 'board_events'
+INVALIDATION_CHANNEL = 'cache_invalidation'
+MAX_PAYLOAD_BYTES = 7900  # pg_notify rejects payloads of 8000 bytes or more
+
+# Sent when a stream may have missed events (listener reconnect, slow client);
+# the client reloads the board or asks GET /project/{id}/changes
+RESYNC_EVENT = json.dumps({"type": "resync"})
+
+# Queued for a stream whose access may have been revoked (membership or
+# principal invalidation); the stream re-runs its authorize() check
+REVALIDATE = object()
+
+
+def encode_event(project_id: int, event_type: str, data: dict) -> str:
+    event = {"type": event_type, "projectId": project_id, **data}
+    payload = json.dumps(event, default=str, separators=(',', ':'))
+    if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+        # Too large to push: send the ids only and let clients refetch
+        event = {key: value for key, value in event.items() if not isinstance(value, (dict, list))}
+        event["truncated"] = True
+        payload = json.dumps(event, default=str, separators=(',', ':'))
+    return payload
+
+
+def publish(cur, project_id: int, event_type: str, **data):
+    """Queue a board event on a psycopg2 cursor; it is sent when the transaction commits"""
+    if project_id is None:
+        return
+    cur.execute('SELECT pg_notify(%s, %s)', (CHANNEL, encode_event(project_id, event_type, data)))
+
+
+async def apublish(db, project_id: int, event_type: str, **data):
+    """Queue a board event on an asyncpg connection; it is sent when the transaction commits"""
+    if project_id is None:
+        return
+    await db.execute('SELECT pg_notify($1, $2)', CHANNEL, encode_event(project_id, event_type, data))
+
+
+class BoardBroadcaster:
+    """Listens on CHANNEL and hands each event to the subscribers of its project"""
+
+    def __init__(
+        self,
+        connect_kwargs: dict,
+        queue_size: int = 256,
+        keepalive: float = 15.0,
+        reconnect_delay: float = 2.0,
+    ):
+        self.connect_kwargs = connect_kwargs
+        self.queue_size = queue_size
+        self.keepalive = keepalive
+        self.reconnect_delay = reconnect_delay
+        self._subscribers = {}  # project id -> set of asyncio.Queue
+        self._queue_users = {}  # asyncio.Queue -> user id of the stream
+        self._caches = []       # kept coherent through INVALIDATION_CHANNEL
+        self._conn = None
+        self._task = None
+        self._delivered = 0
+        self._dropped = 0
+
+    @classmethod
+    def from_env(cls):
+        load_dotenv()
+        return cls(
+            connect_kwargs={
+                "host": os.getenv('DB_HOST'),
+                "port": os.getenv('DB_PORT'),
+                "database": os.getenv('DB_DATABASE'),
+                "user": os.getenv('DB_USERNAME'),
+                "password": os.getenv('DB_PASSWORD'),
+            },
+            queue_size=int(os.getenv('REALTIME_QUEUE_SIZE', '256')),
+            keepalive=float(os.getenv('REALTIME_KEEPALIVE', '15')),
+            reconnect_delay=float(os.getenv('REALTIME_RECONNECT_DELAY', '2')),
+        )
+
+    def register_cache(self, cache):
+        """Keep a per-worker cache coherent with writes made by any worker.
+
+        The cache gets apply_invalidation(message) for every payload on
+        INVALIDATION_CHANNEL. It is suspended (bypassed and emptied) whenever
+        the listener is not connected, since invalidations sent then are lost,
+        and resumed once LISTEN is in place again.
+        """
+        cache.suspend()
+        self._caches.append(cache)
+
+    def _suspend_caches(self, *args):
+        for cache in self._caches:
+            cache.suspend()
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _listen(self):
+        """Keep one LISTEN connection open, reconnecting after failures"""
+        while True:
+            try:
+                self._conn = await asyncpg.connect(**self.connect_kwargs)
+                # Suspend the caches the moment the connection drops, not at the next keepalive
+                self._conn.add_termination_listener(self._suspend_caches)
+                await self._conn.add_listener(CHANNEL, self._on_notify)
+                await self._conn.add_listener(INVALIDATION_CHANNEL, self._on_invalidation)
+                for cache in self._caches:
+                    cache.resume()
+                # Anything sent while we were disconnected is lost, revocations included
+                self._broadcast_all(RESYNC_EVENT)
+                self._broadcast_all(REVALIDATE)
+                while True:
+                    await asyncio.sleep(self.keepalive)
+                    await self._conn.execute('SELECT 1')
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Board event listener lost its connection: {str(e)}")
+            finally:
+                self._suspend_caches()
+                if self._conn is not None:
+                    self._conn.terminate()
+                    self._conn = None
+            await asyncio.sleep(self.reconnect_delay)
+
+    def _on_notify(self, conn, pid, channel, payload):
+        try:
+            project_id = json.loads(payload).get('projectId')
+        except ValueError:
+            return
+        for queue in list(self._subscribers.get(project_id, ())):
+            self._offer(queue, payload)
+
+    def _on_invalidation(self, conn, pid, channel, payload):
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            # Unreadable: forgetting everything is always safe
+            message = {"all": True}
+        for cache in self._caches:
+            cache.apply_invalidation(message)
+        self._revalidate_streams(message)
+
+    def _revalidate_streams(self, message: dict):
+        """Make the streams whose project or user was invalidated check their access again"""
+        if message.get('all'):
+            self._broadcast_all(REVALIDATE)
+            return
+        projects = set(message.get('projects') or ())
+        users = set(message.get('users') or ())
+        for project_id, queues in list(self._subscribers.items()):
+            for queue in list(queues):
+                if project_id in projects or self._queue_users.get(queue) in users:
+                    self._offer(queue, REVALIDATE)
+
+    def _broadcast_all(self, payload: str):
+        for queues in list(self._subscribers.values()):
+            for queue in list(queues):
+                self._offer(queue, payload)
+
+    def _offer(self, queue: asyncio.Queue, payload: str):
+        try:
+            queue.put_nowait(payload)
+            self._delivered += 1
+        except asyncio.QueueFull:
+            # A client that cannot keep up gets a resync instead of a backlog,
+            # but never loses a pending access check
+            revalidate = payload is REVALIDATE
+            self._dropped += queue.qsize()
+            while not queue.empty():
+                revalidate = queue.get_nowait() is REVALIDATE or revalidate
+            queue.put_nowait(RESYNC_EVENT)
+            if revalidate:
+                queue.put_nowait(REVALIDATE)
+
+    def subscribe(self, project_id: int, user_id: int = None) -> asyncio.Queue:
+        # Room for at least a resync and an access check
+        queue = asyncio.Queue(maxsize=max(self.queue_size, 2))
+        self._subscribers.setdefault(project_id, set()).add(queue)
+        self._queue_users[queue] = user_id
+        return queue
+
+    def unsubscribe(self, project_id: int, queue: asyncio.Queue):
+        self._queue_users.pop(queue, None)
+        queues = self._subscribers.get(project_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[project_id]
+
+    async def stream(self, project_id: int, user_id: int = None, authorize=None, expires_at: float = None):
+        """Server-sent event stream for one client of a project.
+
+        The stream ends when the client's token expires (``expires_at``, epoch
+        seconds) or when ``authorize()`` returns False after an invalidation
+        touching the project or the user; a reconnecting client is then
+        authenticated and authorized from scratch.
+        """
+        queue = self.subscribe(project_id, user_id)
+        try:
+            yield 'retry: 3000\n\n'
+            while True:
+                timeout = self.keepalive
+                if expires_at is not None:
+                    remaining = expires_at - time.time()
+                    if remaining <= 0:
+                        return
+                    timeout = min(timeout, remaining)
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    # Comment line: keeps proxies from closing an idle stream
+                    yield ': keepalive\n\n'
+                    continue
+                if payload is REVALIDATE:
+                    if authorize is not None and not await authorize():
+                        return
+                    continue
+                yield f'data: {payload}\n\n'
+        finally:
+            self.unsubscribe(project_id, queue)
+
+    def stats(self) -> dict:
+        return {
+            "listening": self._conn is not None and not self._conn.is_closed(),
+            "projects": len(self._subscribers),
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+        }
+
+
+# Initialize the per-worker broadcaster with environment variables
+board_events = BoardBroadcaster.from_env()
@@ -0,0 +1,266 @@
+"""Content-negotiated encoding of JSON responses.
+
+ResponseEncodingMiddleware rewrites complete (non-streaming) JSON responses
+for clients that ask for it:
+
+  * ``Accept: application/msgpack`` turns the JSON document into MessagePack
+  * ``Accept-Encoding: br`` / ``gzip`` compresses bodies of at least
+    RESPONSE_COMPRESSION_MIN_BYTES (brotli preferred when installed)
+
+Each negotiated representation gets its own strong ETag (the endpoint's tag
+plus ``+msgpack`` / ``+br`` / ``+gzip``); the suffixes are stripped from
+If-None-Match before the request reaches the endpoint, so conditional
+requests keep working unchanged. Encoded bodies of responses with an ETag are
+kept in a bounded LRU keyed by path, query string and representation, together
+with a digest of the JSON they were made from: a hot board is still built on
+every request, but only recompressed when its bytes changed. The fresh body is
+always what decides, so the cache can never serve something the endpoint would
+no longer return. Streaming responses (SSE, exports) pass through untouched.
+"""
+import os
+import re
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+
+import orjson
+from dotenv import load_dotenv
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+try:
+    import msgpack
+except ImportError:  # JSON only
+    msgpack = None
+
+load_dotenv()
+
+MSGPACK_MEDIA_TYPES = ('application/msgpack', 'application/x-msgpack')
+ENCODED_STATUSES = (200, 201, 202)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5  # 11 (the default) is far too slow for per-request use
+ETAG_SUFFIX = re.compile(r'\+(?:msgpack|br|gzip)(?=[+"])')
+
+
+def parse_quality_list(header: str) -> dict:
+    """{token: q} from an Accept / Accept-Encoding header"""
+    values = {}
+    for item in header.split(','):
+        token, _, params = item.strip().partition(';')
+        if not token:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        values[token.strip().lower()] = quality
+    return values
+
+
+def choose_encoding(accept_encoding: str):
+    """'br', 'gzip' or None for a request's Accept-Encoding"""
+    accepted = parse_quality_list(accept_encoding)
+    if brotli is not None and accepted.get('br', 0) > 0:
+        return 'br'
+    if accepted.get('gzip', accepted.get('*', 0)) > 0:
+        return 'gzip'
+    return None
+
+
+def wants_msgpack(accept: str) -> bool:
+    if msgpack is None:
+        return False
+    accepted = parse_quality_list(accept)
+    return any(accepted.get(media_type, 0) > 0 for media_type in MSGPACK_MEDIA_TYPES)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def to_msgpack(body: bytes) -> bytes:
+    return msgpack.packb(orjson.loads(body), use_bin_type=True)
+
+
+class EncodedResponseCache:
+    """Byte-bounded LRU of encoded bodies keyed by (path, query, representation)"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (body, content encoding or None, source digest)
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_env(cls):
+        return cls(max_bytes=int(os.getenv('RESPONSE_CACHE_MAX_BYTES', str(64 * 1024 * 1024))))
+
+    def get(self, key, source_digest: bytes):
+        """(body, content encoding) cached for key, if it was encoded from the same source bytes"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] != source_digest:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0], entry[1]
+
+    def put(self, key, body: bytes, content_encoding, source_digest: bytes):
+        if len(body) > self.max_bytes // 4:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[0])
+            self._entries[key] = (body, content_encoding, source_digest)
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, (evicted, _, _) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+class ResponseEncodingMiddleware:
+    def __init__(self, app, minimum_size: int = None, cache: EncodedResponseCache = None):
+        self.app = app
+        self.minimum_size = minimum_size if minimum_size is not None else int(
+            os.getenv('RESPONSE_COMPRESSION_MIN_BYTES', '1024')
+        )
+        self.cache = cache if cache is not None else encoded_responses
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = choose_encoding(request_headers.get('accept-encoding', ''))
+        use_msgpack = wants_msgpack(request_headers.get('accept', ''))
+        if not encoding and not use_msgpack:
+            await self.app(scope, receive, send)
+            return
+
+        suffix = ('+msgpack' if use_msgpack else '') + (f'+{encoding}' if encoding else '')
+        if 'if-none-match' in request_headers:
+            scope = dict(scope, headers=[
+                (name, ETAG_SUFFIX.sub('', value.decode('latin-1')).encode('latin-1') if name == b'if-none-match' else value)
+                for name, value in scope['headers']
+            ])
+
+        responder = _EncodingResponder(
+            self, send, (scope['path'], scope.get('query_string', b'')), encoding, use_msgpack, suffix
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _EncodingResponder:
+    def __init__(self, middleware, send, resource, encoding, use_msgpack, suffix):
+        self.middleware = middleware
+        self.downstream = send
+        self.resource = resource  # (path, query string)
+        self.encoding = encoding
+        self.use_msgpack = use_msgpack
+        self.suffix = suffix
+        self.start = None
+        self.passthrough = False
+
+    async def send(self, message):
+        if self.passthrough:
+            await self.downstream(message)
+            return
+
+        if message['type'] == 'http.response.start':
+            self.start = message
+            headers = MutableHeaders(scope=message)
+            if message['status'] == 304 and 'etag' in headers:
+                headers['etag'] = self._representation_etag(headers['etag'])
+            return
+
+        if message['type'] != 'http.response.body':
+            await self.downstream(message)
+            return
+
+        headers = MutableHeaders(scope=self.start)
+        eligible = (
+            self.start['status'] in ENCODED_STATUSES
+            and headers.get('content-type', '').startswith('application/json')
+            and 'content-encoding' not in headers
+            and not message.get('more_body', False)
+        )
+        if not eligible:
+            # Streaming or non-JSON: forward as is
+            self.passthrough = True
+            await self.downstream(self.start)
+            await self.downstream(message)
+            return
+
+        body, content_encoding = await self._encode(message.get('body', b''), 'etag' in headers)
+
+        if self.use_msgpack:
+            headers['content-type'] = MSGPACK_MEDIA_TYPES[0]
+        if content_encoding:
+            headers['content-encoding'] = content_encoding
+        if 'etag' in headers:
+            headers['etag'] = self._representation_etag(headers['etag'])
+        headers['content-length'] = str(len(body))
+        headers.add_vary_header('Accept-Encoding')
+        headers.add_vary_header('Accept')
+
+        await self.downstream(self.start)
+        await self.downstream({'type': 'http.response.body', 'body': body})
+
+    def _representation_etag(self, etag: str) -> str:
+        if not etag.endswith('"'):
+            return etag
+        return etag[:-1] + self.suffix + '"'
+
+    async def _encode(self, body: bytes, cacheable: bool):
+        cache = self.middleware.cache
+        key = (*self.resource, self.suffix) if cacheable else None
+        digest = None
+        if key is not None:
+            # Reuse an encoding only of these exact bytes, whatever the ETag claims
+            digest = hashlib.blake2b(body, digest_size=16).digest()
+            cached = cache.get(key, digest)
+            if cached is not None:
+                return cached
+
+        def encode():
+            encoded = to_msgpack(body) if self.use_msgpack else body
+            if self.encoding and len(encoded) >= self.middleware.minimum_size:
+                return compress(encoded, self.encoding), self.encoding
+            return encoded, None
+
+        # Compressing a large board takes milliseconds; keep it off the event loop
+        encoded, content_encoding = await run_in_threadpool(encode)
+        if key is not None:
+            cache.put(key, encoded, content_encoding, digest)
+        return encoded, content_encoding
+
+
+# Per-worker cache of encoded bodies
+encoded_responses = EncodedResponseCache.from_env()
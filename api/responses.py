@@ -0,0 +1,40 @@
+"""orjson-backed JSON responses.
+
+FastJSONResponse is the app's default response class. orjson writes
+datetime, date, UUID and dataclass values natively (ISO 8601, like
+.isoformat()); Decimal (NUMERIC columns such as listPosition) is written as a
+float and pydantic models as their model_dump().
+
+Returning a FastJSONResponse from an endpoint skips FastAPI's
+jsonable_encoder pass, which walks and copies the whole result in Python
+before it is serialized; hot endpoints build plain dicts of database values
+and return them wrapped in one.
+"""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def default(value):
+    """orjson fallback for the types it does not serialize itself"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,80 @@
+"""A malformed JSONL line reaches the caller as ImportValidationError.
+
+psycopg2 swallows exceptions raised inside copy_expert's read callback and
+raises QueryCanceled instead; the fake cursor below does the same.
+
+Run from the api/ directory: python -m pytest tests
+"""
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from issue_import import ImportValidationError, import_issues  # noqa: E402
+
+
+class QueryCanceled(Exception):
+    pass
+
+
+class FakeCursor:
+    def __init__(self):
+        self.copied = ''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        pass
+
+    def copy_expert(self, sql, stream):
+        try:
+            while True:
+                chunk = stream.read(8192)
+                if not chunk:
+                    break
+                self.copied += chunk
+        except Exception:
+            raise QueryCanceled("COPY from stdin failed: error in .read() call")
+
+
+class FakeConnection:
+    def __init__(self):
+        self.cur = FakeCursor()
+        self.rolled_back = False
+
+    def cursor(self):
+        return self.cur
+
+    def commit(self):
+        raise AssertionError("a failed import must not commit")
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def test_malformed_jsonl_line_is_reported_with_its_line_number():
+    conn = FakeConnection()
+    stream = io.StringIO('{"title": "First"}\n\n{"title": \n')
+
+    with pytest.raises(ImportValidationError) as raised:
+        import_issues(conn, stream, project_id=1, reporter_id=1, fmt='jsonl')
+
+    assert raised.value.errors == [{"line": 3, "error": "Invalid JSON"}]
+    assert conn.rolled_back
+
+
+def test_non_object_jsonl_line_is_rejected():
+    conn = FakeConnection()
+    stream = io.StringIO('{"title": "First"}\n["not", "an", "object"]\n')
+
+    with pytest.raises(ImportValidationError) as raised:
+        import_issues(conn, stream, project_id=1, reporter_id=1, fmt='jsonl')
+
+    assert raised.value.errors == [{"line": 2, "error": "Expected a JSON object"}]
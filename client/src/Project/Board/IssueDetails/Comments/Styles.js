@@ -1,6 +1,6 @@
 import styled from 'styled-components';
 
-import { font } from 'shared/utils/styles';
+import { color, font, mixin } from 'shared/utils/styles';
 
 export const Comments = styled.div`
   padding-top: 40px;
@@ -10,3 +10,13 @@ export const Title = styled.div`
   ${font.medium}
   ${font.size(15)}
 `;
+
+export const LoadOlder = styled.div`
+  padding: 16px 0 0;
+  color: ${color.textMedium};
+  ${font.size(14.5)};
+  ${mixin.clickable}
+  &:hover {
+    color: ${color.textDark};
+  }
+`;
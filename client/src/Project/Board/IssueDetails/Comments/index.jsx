@@ -1,27 +1,62 @@
-import React from 'react';
+import React, { useState, useEffect } from 'react';
 import PropTypes from 'prop-types';
+import { uniqBy } from 'lodash';
 
+import api from 'shared/utils/api';
+import toast from 'shared/utils/toast';
 import { sortByNewest } from 'shared/utils/javascript';
 
 import Create from './Create';
 import Comment from './Comment';
-import { Comments, Title } from './Styles';
+import { Comments, Title, LoadOlder } from './Styles';
 
 const propTypes = {
   issue: PropTypes.object.isRequired,
   fetchIssue: PropTypes.func.isRequired,
 };
 
-const ProjectBoardIssueDetailsComments = ({ issue, fetchIssue }) => (
-  <Comments>
-    <Title>Comments</Title>
-    <Create issueId={issue.id} fetchIssue={fetchIssue} />
+const ProjectBoardIssueDetailsComments = ({ issue, fetchIssue }) => {
+  // The issue arrives with its newest comments only; older pages load on demand
+  const [olderComments, setOlderComments] = useState([]);
+  const [nextCursor, setNextCursor] = useState(issue.commentsNextCursor);
+  const [isLoading, setLoading] = useState(false);
 
-    {sortByNewest(issue.comments, 'createdAt').map(comment => (
-      <Comment key={comment.id} comment={comment} fetchIssue={fetchIssue} />
-    ))}
-  </Comments>
-);
+  useEffect(() => {
+    setOlderComments([]);
+    setNextCursor(issue.commentsNextCursor);
+  }, [issue.comments, issue.commentsNextCursor]);
+
+  const loadOlderComments = async () => {
+    setLoading(true);
+    try {
+      const page = await api.get(`/issues/${issue.id}/comments`, { cursor: nextCursor });
+      setOlderComments(current => [...current, ...page.comments]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      toast.error(error);
+    }
+    setLoading(false);
+  };
+
+  const comments = uniqBy([...issue.comments, ...olderComments], 'id');
+
+  return (
+    <Comments>
+      <Title>{issue.commentCount ? `Comments (${issue.commentCount})` : 'Comments'}</Title>
+      <Create issueId={issue.id} fetchIssue={fetchIssue} />
+
+      {sortByNewest(comments, 'createdAt').map(comment => (
+        <Comment key={comment.id} comment={comment} fetchIssue={fetchIssue} />
+      ))}
+
+      {nextCursor && (
+        <LoadOlder onClick={isLoading ? undefined : loadOlderComments}>
+          {isLoading ? 'Loading…' : `Show older comments (${issue.commentCount - comments.length})`}
+        </LoadOlder>
+      )}
+    </Comments>
+  );
+};
 
 ProjectBoardIssueDetailsComments.propTypes = propTypes;
 
@@ -81,3 +81,14 @@ export const Issues = styled.div`
     display: none;
   }
 `;
+
+export const LoadMore = styled.div`
+  padding: 8px 0;
+  text-align: center;
+  color: ${color.textMedium};
+  ${font.size(13)};
+  ${mixin.clickable}
+  &:hover {
+    color: ${color.textDark};
+  }
+`;
@@ -7,27 +7,40 @@ import { intersection } from 'lodash';
 import { IssueStatusCopy } from 'shared/constants/issues';
 
 import Issue from './Issue';
-import { List, Title, IssuesCount, Issues } from './Styles';
+import { List, Title, IssuesCount, Issues, LoadMore } from './Styles';
 
 const propTypes = {
   status: PropTypes.string.isRequired,
   project: PropTypes.object.isRequired,
   filters: PropTypes.object.isRequired,
   currentUserId: PropTypes.number,
+  loadMoreColumnIssues: PropTypes.func,
   renderHeaderOnly: PropTypes.bool,
   renderContentOnly: PropTypes.bool,
 };
 
 const defaultProps = {
   currentUserId: null,
+  loadMoreColumnIssues: () => {},
   renderHeaderOnly: false,
   renderContentOnly: false,
 };
 
-const ProjectBoardList = ({ status, project, filters, currentUserId, renderHeaderOnly, renderContentOnly }) => {
+const ProjectBoardList = ({
+  status,
+  project,
+  filters,
+  currentUserId,
+  loadMoreColumnIssues,
+  renderHeaderOnly,
+  renderContentOnly,
+}) => {
   const filteredIssues = filterIssues(project.issues, filters, currentUserId);
   const filteredListIssues = getSortedListIssues(filteredIssues, status);
   const allListIssues = getSortedListIssues(project.issues, status);
+  // Paginated boards only hold the first cards of each column
+  const column = project.columns ? project.columns[status] : null;
+  const columnTotal = column ? column.total : allListIssues.length;
 
   // Render only header
   if (renderHeaderOnly) {
@@ -35,7 +48,7 @@ const ProjectBoardList = ({ status, project, filters, currentUserId, renderHeade
       <List>
         <Title>
           {`${IssueStatusCopy[status]} `}
-          <IssuesCount>{formatIssuesCount(allListIssues, filteredListIssues)}</IssuesCount>
+          <IssuesCount>{formatIssuesCount(columnTotal, allListIssues, filteredListIssues)}</IssuesCount>
         </Title>
       </List>
     );
@@ -56,6 +69,11 @@ const ProjectBoardList = ({ status, project, filters, currentUserId, renderHeade
                 <Issue key={issue.id} projectUsers={project.users} issue={issue} index={index} />
               ))}
               {provided.placeholder}
+              {column && column.nextCursor && (
+                <LoadMore onClick={() => loadMoreColumnIssues(status)}>
+                  {`Load more (${columnTotal - allListIssues.length})`}
+                </LoadMore>
+              )}
             </Issues>
           </List>
         )}
@@ -70,7 +88,7 @@ const ProjectBoardList = ({ status, project, filters, currentUserId, renderHeade
         <List>
           <Title>
             {`${IssueStatusCopy[status]} `}
-            <IssuesCount>{formatIssuesCount(allListIssues, filteredListIssues)}</IssuesCount>
+            <IssuesCount>{formatIssuesCount(columnTotal, allListIssues, filteredListIssues)}</IssuesCount>
           </Title>
           <Issues
             {...provided.droppableProps}
@@ -110,11 +128,11 @@ const filterIssues = (projectIssues, filters, currentUserId) => {
 const getSortedListIssues = (issues, status) =>
   issues.filter(issue => issue.status === status).sort((a, b) => a.listPosition - b.listPosition);
 
-const formatIssuesCount = (allListIssues, filteredListIssues) => {
+const formatIssuesCount = (columnTotal, allListIssues, filteredListIssues) => {
   if (allListIssues.length !== filteredListIssues.length) {
-    return `${filteredListIssues.length} of ${allListIssues.length}`;
+    return `${filteredListIssues.length} of ${columnTotal}`;
   }
-  return allListIssues.length;
+  return columnTotal;
 };
 
 ProjectBoardList.propTypes = propTypes;
@@ -4,6 +4,7 @@ import { DragDropContext } from 'react-beautiful-dnd';
 
 import useCurrentUser from 'shared/hooks/currentUser';
 import api from 'shared/utils/api';
+import toast from 'shared/utils/toast';
 import { moveItemWithinArray, insertItemIntoArray } from 'shared/utils/javascript';
 import { IssueStatus } from 'shared/constants/issues';
 
@@ -14,24 +15,47 @@ const propTypes = {
   project: PropTypes.object.isRequired,
   filters: PropTypes.object.isRequired,
   updateLocalProjectIssues: PropTypes.func.isRequired,
+  loadMoreColumnIssues: PropTypes.func.isRequired,
 };
 
-const ProjectBoardLists = ({ project, filters, updateLocalProjectIssues }) => {
+const ProjectBoardLists = ({ project, filters, updateLocalProjectIssues, loadMoreColumnIssues }) => {
   const { currentUserId } = useCurrentUser();
 
   const handleIssueDrop = ({ draggableId, destination, source }) => {
     if (!isPositionChanged(source, destination)) return;
 
     const issueId = Number(draggableId);
+    const currentFields = project.issues.find(({ id }) => id === String(issueId));
+    const { prevIssue, nextIssue } = getAfterDropPrevNextIssue(
+      project.issues,
+      destination,
+      source,
+      issueId,
+    );
+
+    // Show the move right away; the server picks the authoritative position
+    updateLocalProjectIssues(String(issueId), {
+      status: destination.droppableId,
+      listPosition: calculateIssueListPosition(project.issues, destination, source, issueId),
+    });
 
-    api.optimisticUpdate(`/issues/${issueId}`, {
-      updatedFields: {
+    api
+      .put(`/issues/${issueId}/move`, {
         status: destination.droppableId,
-        listPosition: calculateIssueListPosition(project.issues, destination, source, issueId),
-      },
-      currentFields: project.issues.find(({ id }) => id === String(issueId)),
-      setLocalData: fields => updateLocalProjectIssues(String(issueId), fields),
-    });
+        prevId: prevIssue ? Number(prevIssue.id) : null,
+        nextId: nextIssue ? Number(nextIssue.id) : null,
+      })
+      .then(
+        issue =>
+          updateLocalProjectIssues(String(issueId), {
+            status: issue.status,
+            listPosition: issue.listPosition,
+          }),
+        error => {
+          updateLocalProjectIssues(String(issueId), currentFields);
+          toast.error(error);
+        },
+      );
   };
 
   return (
@@ -57,6 +81,7 @@ const ProjectBoardLists = ({ project, filters, updateLocalProjectIssues }) => {
               project={project}
               filters={filters}
               currentUserId={currentUserId}
+              loadMoreColumnIssues={loadMoreColumnIssues}
               renderContentOnly={true}
             />
           ))}
@@ -14,6 +14,7 @@ const propTypes = {
   project: PropTypes.object.isRequired,
   fetchProject: PropTypes.func.isRequired,
   updateLocalProjectIssues: PropTypes.func.isRequired,
+  loadMoreColumnIssues: PropTypes.func.isRequired,
 };
 
 const defaultFilters = {
@@ -23,7 +24,7 @@ const defaultFilters = {
   recent: false,
 };
 
-const ProjectBoard = ({ project, fetchProject, updateLocalProjectIssues }) => {
+const ProjectBoard = ({ project, fetchProject, updateLocalProjectIssues, loadMoreColumnIssues }) => {
   const match = useRouteMatch();
   const history = useHistory();
 
@@ -45,6 +46,7 @@ const ProjectBoard = ({ project, fetchProject, updateLocalProjectIssues }) => {
         project={project}
         filters={filters}
         updateLocalProjectIssues={updateLocalProjectIssues}
+        loadMoreColumnIssues={loadMoreColumnIssues}
       />
       
       <Route
@@ -1,11 +1,13 @@
 import React from 'react';
 import { Route, Redirect, useRouteMatch, useHistory, useParams } from 'react-router-dom';
 
+import api from 'shared/utils/api';
 import useApi from 'shared/hooks/api';
 import { updateArrayItemById } from 'shared/utils/javascript';
 import { createQueryParamModalHelpers } from 'shared/utils/queryParamModal';
 import { PageLoader, PageError, Modal, Avatar } from 'shared/components';
 import useCurrentUser from 'shared/hooks/currentUser';
+import useProjectEvents from 'shared/hooks/projectEvents';
 
 import NavbarLeft from './NavbarLeft';
 import Sidebar from './Sidebar';
@@ -16,6 +18,9 @@ import ProjectSettings from './ProjectSettings';
 import ProjectMembers from './Members';
 import { ProjectPage } from './Styles';
 
+// Cards loaded per status column on board open; the rest load on demand
+const BOARD_COLUMN_LIMIT = 100;
+
 const Project = () => {
   const match = useRouteMatch();
   const history = useHistory();
@@ -25,7 +30,27 @@ const Project = () => {
   const issueSearchModalHelpers = createQueryParamModalHelpers('issue-search');
   const issueCreateModalHelpers = createQueryParamModalHelpers('issue-create');
 
-  const [{ data, error, setLocalData }, fetchProject] = useApi.get(`/project/${projectId}`);
+  const [{ data, error, setLocalData }, fetchProject] = useApi.get(`/project/${projectId}`, {
+    columnLimit: BOARD_COLUMN_LIMIT,
+    fields: 'board',
+  });
+
+  // Apply collaborators' card moves in place; anything else reloads the board
+  useProjectEvents(projectId, event => {
+    const localIssues = data ? data.project.issues : [];
+    const isLocalIssue = event.issue && localIssues.some(issue => issue.id === event.issue.id);
+
+    if (event.type === 'issue.updated' && isLocalIssue) {
+      setLocalData(currentData => ({
+        project: {
+          ...currentData.project,
+          issues: updateArrayItemById(currentData.project.issues, event.issue.id, event.issue),
+        },
+      }));
+    } else if (['issue.created', 'issue.updated', 'issue.deleted', 'column.rebalanced', 'resync'].includes(event.type)) {
+      fetchProject();
+    }
+  });
 
   if (!data) return <PageLoader />;
   if (error) return <PageError />;
@@ -41,6 +66,32 @@ const Project = () => {
     }));
   };
 
+  const loadMoreColumnIssues = async status => {
+    const column = project.columns && project.columns[status];
+    if (!column || !column.nextCursor) return;
+
+    const page = await api.get(`/project/${projectId}/columns/${status}`, {
+      cursor: column.nextCursor,
+      fields: 'board',
+    });
+    setLocalData(currentData => {
+      const loadedIds = new Set(currentData.project.issues.map(issue => issue.id));
+      return {
+        project: {
+          ...currentData.project,
+          issues: [
+            ...currentData.project.issues,
+            ...page.issues.filter(issue => !loadedIds.has(issue.id)),
+          ],
+          columns: {
+            ...currentData.project.columns,
+            [status]: { ...currentData.project.columns[status], nextCursor: page.nextCursor },
+          },
+        },
+      };
+    });
+  };
+
   return (
     <ProjectPage>
       <NavbarLeft
@@ -146,6 +197,7 @@ const Project = () => {
             project={project}
             fetchProject={fetchProject}
             updateLocalProjectIssues={updateLocalProjectIssues}
+            loadMoreColumnIssues={loadMoreColumnIssues}
           />
         )}
       />
@@ -295,6 +295,14 @@ const MyProjects = () => {
                             Members
                           </div>
                         </div>
+                        <div style={{ textAlign: 'center' }}>
+                          <div style={{ fontSize: '18px', fontWeight: '700', color: '#0052cc' }}>
+                            {project.issueCount || 0}
+                          </div>
+                          <div style={{ fontSize: '11px', color: '#5e6c84', fontWeight: '500' }}>
+                            Issues
+                          </div>
+                        </div>
                         <div style={{ textAlign: 'center' }}>
                           <div style={{ fontSize: '11px', color: '#5e6c84', fontWeight: '500' }}>
                             Created
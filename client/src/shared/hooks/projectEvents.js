@@ -0,0 +1,32 @@
+import { useEffect, useRef } from 'react';
+
+import { getStoredAuthToken } from 'shared/utils/authToken';
+
+const baseURL = process.env.REACT_APP_API_URL || 'https://ticket-tracker.turing.com/api';
+
+// Subscribes to a project's server-sent board events; EventSource reconnects by itself
+const useProjectEvents = (projectId, onEvent) => {
+  const onEventRef = useRef(onEvent);
+  onEventRef.current = onEvent;
+
+  useEffect(() => {
+    const token = getStoredAuthToken();
+    if (!projectId || !token || typeof EventSource === 'undefined') return undefined;
+
+    const source = new EventSource(
+      `${baseURL}/project/${projectId}/events?token=${encodeURIComponent(token)}`,
+    );
+    source.onmessage = message => {
+      let event;
+      try {
+        event = JSON.parse(message.data);
+      } catch (error) {
+        return;
+      }
+      onEventRef.current(event);
+    };
+    return () => source.close();
+  }, [projectId]);
+};
+
+export default useProjectEvents;